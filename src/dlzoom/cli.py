@@ -26,7 +26,7 @@ from dlzoom import __version__
 from dlzoom.audio_extractor import AudioExtractionError
 from dlzoom.config import Config, ConfigError
 from dlzoom.downloader import DownloadError
-from dlzoom.exceptions import DlzoomError
+from dlzoom.exceptions import AuthenticationError, DlzoomError, PermissionDeniedError
 from dlzoom.logger import setup_logging
 from dlzoom.login import main as login_main
 from dlzoom.logout import main as logout_main
@@ -84,6 +84,16 @@ def _autoload_dotenv() -> None:
 # Module logger for warnings/info
 logger = logging.getLogger(__name__)
 
+# Substrings that are never valid in a meeting ID (checked after whitespace removal)
+_PATH_TRAVERSAL_TOKENS = ("..", "\\")
+
+# Zoom UUIDs can contain: a-z, A-Z, 0-9, +, /, =, _, -
+# Require at least one alphanumeric (rejects "/", "//", "==", "+") and minimum length
+_UUID_RE = re.compile(r"^(?=.*[A-Za-z0-9])[A-Za-z0-9+/=_-]{2,100}$")
+
+# --from-date/--to-date shape; calendar validity is checked by date.fromisoformat
+_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
 
 def validate_meeting_id(
     ctx: click.Context, param: click.Parameter, value: str | tuple[str, ...] | None
@@ -107,15 +117,15 @@ def validate_meeting_id(
         click.BadParameter: If meeting ID format is invalid
     """
     # Normalize: remove whitespace, strip URL fragments, and decode percent-encoding
-    if value is None or (isinstance(value, tuple) and len(value) == 0):
+    if value is None or value == ():
         # Allow None for optional option usage; required arguments should not pass None.
         return None
 
-    # If value is a tuple (from nargs=-1), join the parts
+    # If value is a tuple (from nargs=-1), join the parts in one pass and fall through
+    # to the string path; whitespace between parts is removed during normalization.
     if isinstance(value, tuple):
-        raw = " ".join(str(v) for v in value).strip()
-    else:
-        raw = str(value).strip()
+        value = " ".join(value)
+    raw = str(value).strip()
 
     # If user pasted a URL or an encoded UUID, strip fragment/query and decode
     # Examples handled:
@@ -144,8 +154,10 @@ def validate_meeting_id(
         raise click.BadParameter("Meeting ID cannot be empty")
 
     # Check for path traversal attempts on normalized value
-    # Allow forward slashes for UUIDs, but block .. and backslashes
-    if ".." in normalized_value or "\\" in normalized_value:
+    # Allow forward slashes for UUIDs, but block .. and backslashes.
+    # Plain substring tests are enough here: collapsing whitespace can only join
+    # dots together, so ". ./etc" style obfuscation is caught on the normalized value.
+    if any(token in normalized_value for token in _PATH_TRAVERSAL_TOKENS):
         raise click.BadParameter(
             "Meeting ID contains invalid characters (path traversal attempt detected)"
         )
@@ -160,10 +172,7 @@ def validate_meeting_id(
             )
 
     # Check if UUID format (alphanumeric plus base64 characters)
-    # Zoom UUIDs can contain: a-z, A-Z, 0-9, +, /, =, _, -
-    # Require at least one alphanumeric and minimum length
-    uuid_pattern = r"^(?=.*[A-Za-z0-9])[A-Za-z0-9+/=_-]{2,100}$"
-    if re.match(uuid_pattern, normalized_value):
+    if _UUID_RE.match(normalized_value):
         if len(normalized_value) <= 100:  # Reasonable max length for UUID
             return normalized_value
         else:
@@ -193,13 +202,10 @@ cli.add_command(whoami_main, name="whoami")
 def _validate_date(ctx: click.Context, param: click.Parameter, value: str | None) -> str | None:
     if value is None:
         return None
-    import re as _re
-    from datetime import datetime as _dt
-
-    if not _re.match(r"^\d{4}-\d{2}-\d{2}$", value):
+    if not _DATE_RE.fullmatch(value):
         raise click.BadParameter(f"Date must be YYYY-MM-DD, got: {value}")
     try:
-        _dt.strptime(value, "%Y-%m-%d")
+        date.fromisoformat(value)
     except ValueError as e:
         raise click.BadParameter(f"Invalid date: {e}")
     return value
@@ -210,8 +216,14 @@ def _utc_today() -> date:
     return datetime.now(UTC).date()
 
 
-def _calc_range(range_opt: str) -> tuple[str, str]:
-    today = _utc_today()
+def _calc_range(range_opt: str, today: date | None = None) -> tuple[str, str]:
+    """Resolve a --range shortcut to (from_date, to_date) strings.
+
+    ``today`` lets callers resolve the UTC date once per invocation and reuse it;
+    when omitted, ``_utc_today()`` is consulted.
+    """
+    if today is None:
+        today = _utc_today()
     if range_opt == "today":
         f = t = today
     elif range_opt == "yesterday":
@@ -225,6 +237,37 @@ def _calc_range(range_opt: str) -> tuple[str, str]:
     return f.strftime("%Y-%m-%d"), t.strftime("%Y-%m-%d")
 
 
+def _close_when_command_ends(client: ZoomClient) -> None:
+    """Release the S2S client's credentials and pooled connections once the command exits."""
+    ctx = click.get_current_context(silent=True)
+    if ctx is not None:
+        ctx.call_on_close(client.close)
+
+
+# Zoom's "access token does not contain scopes" error code (returned with HTTP 400)
+_ZOOM_SCOPE_ERROR_CODE = 4711
+
+
+def _is_permission_failure(exc: BaseException) -> bool:
+    """Return True when a Zoom API error is caused by missing permissions or scopes."""
+    if isinstance(exc, (AuthenticationError, PermissionDeniedError)):
+        return True
+    if isinstance(exc, ZoomAPIError):
+        return exc.status_code in (401, 403) or exc.zoom_code == _ZOOM_SCOPE_ERROR_CODE
+    if isinstance(exc, ZoomUserAPIError):
+        # The user client wraps requests' HTTPError; its response carries the status
+        # and Zoom's error body.
+        response = getattr(exc.__cause__, "response", None)
+        if getattr(response, "status_code", None) in (401, 403):
+            return True
+        try:
+            body = response.json()
+        except Exception:
+            return False
+        return isinstance(body, dict) and body.get("code") == _ZOOM_SCOPE_ERROR_CODE
+    return False
+
+
 @cli.command(name="recordings", help="Browse recordings by date or list instances for a meeting")
 @click.option("--from-date", callback=_validate_date, help="Start date (YYYY-MM-DD)")
 @click.option("--to-date", callback=_validate_date, help="End date (YYYY-MM-DD)")
@@ -319,13 +362,10 @@ def recordings(
 
     # Dates
     if range_opt:
-        from_date, to_date = _calc_range(range_opt)
+        from_date, to_date = _calc_range(range_opt, today=_utc_today())
     if from_date and to_date:
-        from datetime import datetime
-
-        fdt = datetime.strptime(from_date, "%Y-%m-%d")
-        tdt = datetime.strptime(to_date, "%Y-%m-%d")
-        if fdt > tdt:
+        # Both are validated YYYY-MM-DD strings, which compare in calendar order
+        if from_date > to_date:
             error_msg = "--from-date must be before or equal to --to-date"
             if json_mode:
                 formatter.output_error(error_msg)
@@ -373,9 +413,11 @@ def recordings(
                 str(cfg.zoom_account_id),
                 str(cfg.zoom_client_id),
                 str(cfg.zoom_client_secret),
+                token_cache_dir=cfg.s2s_token_cache_dir,
             )
             client.base_url = cfg.zoom_api_base_url.rstrip("/")
             client.token_url = cfg.zoom_oauth_token_url or client.token_url
+            _close_when_command_ends(client)
         else:
             client = ZoomUserClient(tokens, str(cfg.tokens_path))  # type: ignore[arg-type]
             if hasattr(client, "base_url"):
@@ -500,10 +542,21 @@ def recordings(
                 debug=debug,
             )
 
+        # Keep only the summary fields while paging; full payloads (recording_files
+        # lists, download URLs) are dropped as soon as each page is consumed.
         for m in meeting_iter:
             if topic and topic.lower() not in str(m.get("topic", "")).lower():
                 continue
-            items.append(m)
+            items.append(
+                {
+                    "id": m.get("id"),
+                    "uuid": m.get("uuid"),
+                    "topic": m.get("topic"),
+                    "start_time": m.get("start_time"),
+                    "duration": m.get("duration"),
+                    "recording_count": len(m.get("recording_files", [])),
+                }
+            )
             fetched += 1
             if limit and limit > 0 and fetched >= limit:
                 break
@@ -517,44 +570,33 @@ def recordings(
         enrichment_budget = 50  # cap number of meeting lookups per command
 
         def _is_recurring_definitive(mid: Any) -> bool | None:
-            try:
-                if not mid:
-                    return None
-                # Only enrich if heuristic would be false (single occurrence) and budget remains
-                if id_counts.get(mid, 0) > 1:
-                    return None
-                nonlocal enrichment_budget
-                if enrichment_budget <= 0:
-                    return None
-                enrichment_budget -= 1
-                details = client.get_meeting(str(mid))
-                mtype = details.get("type")
-                if isinstance(mtype, int) and mtype in (3, 8):
-                    return True
-                if isinstance(mtype, int):
-                    return False
+            nonlocal enrichment_budget
+            # Only enrich if heuristic would be false (single occurrence) and budget remains
+            if not mid or id_counts.get(mid, 0) > 1 or enrichment_budget <= 0:
                 return None
-            except Exception:
+            enrichment_budget -= 1
+            try:
+                mtype = client.get_meeting(str(mid)).get("type")
+            except Exception as e:
+                # A permission/scope failure (missing meeting:read) repeats for every
+                # remaining meeting, so stop enriching; any other error (e.g. a 404 for
+                # a deleted meeting) only skips this one.
+                if _is_permission_failure(e):
+                    enrichment_budget = 0
                 return None
-
-        enriched: list[dict[str, Any]] = []
+            if isinstance(mtype, int) and mtype in (3, 8):
+                return True
+            if isinstance(mtype, int):
+                return False
+            return None
+
+        # The recurring flag needs id counts across the whole result set, so rows are
+        # completed in place once paging finishes rather than streamed out.
         for m in items:
-            mid = m.get("id")
+            mid = m["id"]
             rec = _is_recurring_definitive(mid)
-            if rec is None:
-                rec_flag = id_counts.get(mid, 0) > 1
-            else:
-                rec_flag = rec
-            m2 = {
-                "id": m.get("id"),
-                "uuid": m.get("uuid"),
-                "topic": m.get("topic"),
-                "start_time": m.get("start_time"),
-                "duration": m.get("duration"),
-                "recording_count": len(m.get("recording_files", [])),
-                "recurring": rec_flag,
-            }
-            enriched.append(m2)
+            m["recurring"] = id_counts.get(mid, 0) > 1 if rec is None else rec
+        enriched = items
 
         if json_mode:
             payload = {
@@ -861,9 +903,11 @@ def download(
                 str(cfg.zoom_account_id),
                 str(cfg.zoom_client_id),
                 str(cfg.zoom_client_secret),
+                token_cache_dir=cfg.s2s_token_cache_dir,
             )
             client.base_url = cfg.zoom_api_base_url.rstrip("/")
             client.token_url = cfg.zoom_oauth_token_url or client.token_url
+            _close_when_command_ends(client)
         else:
             client = ZoomUserClient(user_tokens, str(cfg.tokens_path))  # type: ignore[arg-type]
             if hasattr(client, "base_url"):
@@ -4,33 +4,122 @@ Configuration management for dlzoom
 
 import json
 import os
+import sys
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any, Literal
 from urllib.parse import urlsplit, urlunsplit
 
 from dotenv import load_dotenv
-from platformdirs import user_config_dir
+from platformdirs import user_cache_dir, user_config_dir
 
 from dlzoom.exceptions import ConfigError
 
-# Check YAML availability at module level
+# Prefer orjson for config parsing when installed; it reads bytes directly.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so error handling is shared.
 try:
-    from importlib.util import find_spec
+    import orjson  # type: ignore[import-not-found]
 
-    YAML_AVAILABLE = find_spec("yaml") is not None
+    _json_loads: Callable[[bytes], Any] = orjson.loads
 except ImportError:
-    YAML_AVAILABLE = False
+    _json_loads = json.loads
+
+# PyYAML availability; None until a YAML config file is first loaded.
+# Tests may set this to True/False directly to force either path.
+YAML_AVAILABLE: bool | None = None
+
+
+def _yaml_available() -> bool:
+    """Probe for PyYAML on first use and remember the answer."""
+    global YAML_AVAILABLE
+    if YAML_AVAILABLE is None:
+        try:
+            from importlib.util import find_spec
+
+            YAML_AVAILABLE = find_spec("yaml") is not None
+        except ImportError:
+            YAML_AVAILABLE = False
+    return YAML_AVAILABLE
+
+
+# Parsed JSON/YAML config files keyed by (resolved path, mtime_ns, size).
+# Repeated Config() constructions in one process reuse the parse until the file changes.
+_PARSED_CONFIG_CACHE: dict[tuple[str, int, int], dict[str, Any]] = {}
+
+
+def _config_cache_key(path: Path) -> tuple[str, int, int] | None:
+    """Return the parse-cache key for a config file, or None if it cannot be stat'ed."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (str(path.resolve()), st.st_mtime_ns, st.st_size)
+
+
+def _clear_config_cache() -> None:
+    """Drop all cached config file parses (used by tests)."""
+    _PARSED_CONFIG_CACHE.clear()
+
+
+# Default config file names, in discovery priority order
+_DEFAULT_CONFIG_NAMES = ("config.json", "config.yaml", "config.yml")
+
+# macOS and Windows file systems are case-insensitive by default, so "Config.json"
+# must still be discovered there when matching against a directory listing
+_CASE_INSENSITIVE_FS = sys.platform in ("darwin", "win32")
+
+
+# Environment variables consulted by Config; read once per instance in __init__
+_ENV_KEYS = (
+    "ZOOM_ACCOUNT_ID",
+    "ZOOM_CLIENT_ID",
+    "ZOOM_CLIENT_SECRET",
+    "OUTPUT_DIR",
+    "LOG_LEVEL",
+    "ZOOM_API_BASE_URL",
+    "ZOOM_OAUTH_TOKEN_URL",
+    "DLZOOM_AUTH_URL",
+    "DLZOOM_TOKENS_PATH",
+    "ZOOM_S2S_DEFAULT_USER",
+)
+
+# Shared defaults; Path is immutable so one instance can back every Config
+_DEFAULT_OUTPUT_DIR = Path(".")
+_DEFAULT_LOG_LEVEL = "INFO"
+_DEFAULT_API_BASE_URL = "https://api.zoom.us/v2"
+
+# Required S2S credentials as (environment variable, private attribute), in message order
+_REQUIRED_CREDENTIALS = (
+    ("ZOOM_ACCOUNT_ID", "_zoom_account_id"),
+    ("ZOOM_CLIENT_ID", "_zoom_client_id"),
+    ("ZOOM_CLIENT_SECRET", "_zoom_client_secret"),
+)
 
 
 class Config:
     """Configuration loader and validator with multi-source support"""
 
+    __slots__ = (
+        "config_dir",
+        "_zoom_account_id",
+        "_zoom_client_id",
+        "_zoom_client_secret",
+        "output_dir",
+        "log_level",
+        "zoom_api_base_url",
+        "zoom_oauth_token_url",
+        "auth_url",
+        "tokens_path",
+        "s2s_default_user",
+        "_auth_mode",
+    )
+
     # Schema for validation
     REQUIRED_FIELDS = ["zoom_account_id", "zoom_client_id", "zoom_client_secret"]
     OPTIONAL_FIELDS = {
-        "output_dir": ".",
-        "log_level": "INFO",
-        "zoom_api_base_url": "https://api.zoom.us/v2",
+        "output_dir": str(_DEFAULT_OUTPUT_DIR),
+        "log_level": _DEFAULT_LOG_LEVEL,
+        "zoom_api_base_url": _DEFAULT_API_BASE_URL,
         "zoom_oauth_token_url": None,
         "zoom_s2s_default_user": None,
         # End-user auth via hosted OAuth broker (open source, auditable code in zoom-broker/)
@@ -40,18 +129,25 @@ class Config:
         "tokens_path": None,
     }
 
-    def __init__(self, env_file: str | None = None):
+    _REPR_FMT = "Config(output_dir=%r, log_level=%r, zoom_api_base_url=%r, credentials=%s)"
+
+    def __init__(self, env_file: str | Literal[False] | None = None):
         # Configuration priority:
         # 1. Config file (JSON/YAML)
         # 2. Environment variables
         # 3. .env file
         # 4. Defaults
+        #
+        # env_file=False skips config files entirely (no discovery, stat, or open),
+        # leaving environment variables and defaults as the only sources.
 
         self.config_dir = Path(user_config_dir("dlzoom"))
         config_data = {}
 
         # Load from config file if provided
-        if env_file is not None:
+        if env_file is False:
+            pass
+        elif env_file is not None:
             config_data = self._load_config_file(env_file)
         else:
             default_config = self._find_default_config()
@@ -64,9 +160,12 @@ class Config:
 
         prefer_env_over_file = env_file is None
 
+        # Snapshot the relevant environment once (after any .env file was loaded above)
+        env = {key: os.environ.get(key) for key in _ENV_KEYS}
+
         def _resolve_s2s_field(config_key: str, env_key: str) -> str | None:
             config_value = config_data.get(config_key)
-            env_value = os.getenv(env_key)
+            env_value = env[env_key]
             if prefer_env_over_file:
                 return env_value if env_value is not None else config_value
             return config_value if config_value is not None else env_value
@@ -78,16 +177,12 @@ class Config:
         self._zoom_client_secret = _resolve_s2s_field("zoom_client_secret", "ZOOM_CLIENT_SECRET")
 
         # Optional settings
-        output_dir_val = config_data.get("output_dir") or os.getenv("OUTPUT_DIR", ".")
-        self.output_dir = Path(str(output_dir_val))
-        self.log_level = config_data.get("log_level") or os.getenv("LOG_LEVEL", "INFO")
-        api_base = config_data.get("zoom_api_base_url") or os.getenv(
-            "ZOOM_API_BASE_URL", self.OPTIONAL_FIELDS["zoom_api_base_url"]
-        )
-        self.zoom_api_base_url = str(api_base).rstrip("/")
-        token_override = config_data.get("zoom_oauth_token_url") or os.getenv(
-            "ZOOM_OAUTH_TOKEN_URL"
-        )
+        output_dir_val = config_data.get("output_dir") or env["OUTPUT_DIR"]
+        self.output_dir = Path(str(output_dir_val)) if output_dir_val else _DEFAULT_OUTPUT_DIR
+        self.log_level = config_data.get("log_level") or env["LOG_LEVEL"] or _DEFAULT_LOG_LEVEL
+        api_base = config_data.get("zoom_api_base_url") or env["ZOOM_API_BASE_URL"]
+        self.zoom_api_base_url = str(api_base).rstrip("/") if api_base else _DEFAULT_API_BASE_URL
+        token_override = config_data.get("zoom_oauth_token_url") or env["ZOOM_OAUTH_TOKEN_URL"]
         self.zoom_oauth_token_url = (
             str(token_override).strip()
             if token_override
@@ -97,13 +192,13 @@ class Config:
         # Hosted auth service URL (flag/env/config/default precedence handled in CLI commands)
         raw_auth_url = (
             config_data.get("auth_url")
-            or os.getenv("DLZOOM_AUTH_URL")
+            or env["DLZOOM_AUTH_URL"]
             or self.OPTIONAL_FIELDS["auth_url"]
         )
         self.auth_url = str(raw_auth_url).strip()
 
         # Token file path: default under platform-specific user config directory
-        configured_tokens_path = config_data.get("tokens_path") or os.getenv("DLZOOM_TOKENS_PATH")
+        configured_tokens_path = config_data.get("tokens_path") or env["DLZOOM_TOKENS_PATH"]
         if configured_tokens_path:
             self.tokens_path = Path(str(configured_tokens_path))
         else:
@@ -115,11 +210,14 @@ class Config:
         if raw_config_default is not None:
             s2s_default_source = str(raw_config_default)
         else:
-            env_default = os.getenv("ZOOM_S2S_DEFAULT_USER")
+            env_default = env["ZOOM_S2S_DEFAULT_USER"]
             s2s_default_source = env_default if env_default is not None else ""
         cleaned_default = s2s_default_source.strip()
         self.s2s_default_user = cleaned_default or None
 
+        # Memoized "s2s" get_auth_mode() result; see _invalidate_auth_cache()
+        self._auth_mode: Literal["s2s"] | None = None
+
     @property
     def zoom_account_id(self) -> str | None:
         """Zoom account ID (read-only property)"""
@@ -135,6 +233,11 @@ class Config:
         """Zoom client secret (read-only property)"""
         return self._zoom_client_secret
 
+    @property
+    def s2s_token_cache_dir(self) -> Path:
+        """Directory where S2S access tokens are cached between CLI invocations."""
+        return Path(user_cache_dir("dlzoom")) / "s2s_tokens"
+
     def __repr__(self) -> str:
         """
         String representation that excludes credentials
@@ -142,16 +245,14 @@ class Config:
         Prevents accidental credential exposure in logs, tracebacks, and debugging
         """
         # Check all three credentials for S2S auth
-        s2s_configured = bool(
-            self._zoom_account_id and self._zoom_client_id and self._zoom_client_secret
+        s2s_configured = all(
+            (self._zoom_account_id, self._zoom_client_id, self._zoom_client_secret)
         )
-        return (
-            f"Config("
-            f"output_dir={self.output_dir!r}, "
-            f"log_level={self.log_level!r}, "
-            f"zoom_api_base_url={self.zoom_api_base_url!r}, "
-            f"credentials={'configured' if s2s_configured else 'missing'}"
-            f")"
+        return self._REPR_FMT % (
+            self.output_dir,
+            self.log_level,
+            self.zoom_api_base_url,
+            "configured" if s2s_configured else "missing",
         )
 
     def clear_credentials(self) -> None:
@@ -166,9 +267,18 @@ class Config:
         self._zoom_account_id = None
         self._zoom_client_id = None
         self._zoom_client_secret = None
+        self._invalidate_auth_cache()
+
+    def _invalidate_auth_cache(self) -> None:
+        """Forget the memoized auth mode so the next get_auth_mode() recomputes it."""
+        self._auth_mode = None
 
     def __del__(self) -> None:
         """Attempt to clear credentials when object is destroyed (best-effort only)"""
+        # If __init__ raised before credentials were resolved (e.g. a bad config file),
+        # the slots were never filled and there is nothing to clear.
+        if not hasattr(self, "_zoom_client_secret"):
+            return
         try:
             self.clear_credentials()
         except Exception:
@@ -216,16 +326,23 @@ class Config:
             )
 
         # Check YAML availability early if trying to load YAML file
-        if path.suffix.lower() in [".yaml", ".yml"] and not YAML_AVAILABLE:
+        if path.suffix.lower() in [".yaml", ".yml"] and not _yaml_available():
             raise ConfigError(
                 f"Cannot load YAML config file '{path.name}': PyYAML not installed. "
                 "Install with: pip install pyyaml"
             )
 
+        cache_key = None
+        if path.suffix.lower() in [".json", ".yaml", ".yml"]:
+            cache_key = _config_cache_key(path)
+            cached = _PARSED_CONFIG_CACHE.get(cache_key) if cache_key else None
+            if cached is not None:
+                return dict(cached)
+
         try:
-            with open(path) as f:
+            with open(path, "rb") as f:
                 if path.suffix.lower() == ".json":
-                    data = json.load(f)
+                    data = _json_loads(f.read())
                 elif path.suffix.lower() in [".yaml", ".yml"]:
                     data = self._load_yaml(f)
                 else:
@@ -235,6 +352,8 @@ class Config:
 
             # Validate schema
             self._validate_schema(data, path)
+            if cache_key:
+                _PARSED_CONFIG_CACHE[cache_key] = dict(data)
             return dict(data)
 
         except json.JSONDecodeError as e:
@@ -272,10 +391,17 @@ class Config:
         Returns:
             Path to the discovered config file or None if not present.
         """
-        for filename in ("config.json", "config.yaml", "config.yml"):
-            candidate = self.config_dir / filename
-            if candidate.exists():
-                return candidate
+        # One directory listing instead of an exists() probe per candidate name
+        try:
+            with os.scandir(self.config_dir) as entries:
+                present = {
+                    entry.name.lower() if _CASE_INSENSITIVE_FS else entry.name for entry in entries
+                }
+        except OSError:
+            return None
+        for filename in _DEFAULT_CONFIG_NAMES:
+            if filename in present:
+                return self.config_dir / filename
         return None
 
     def _validate_schema(self, data: dict[str, Any], path: Path) -> None:
@@ -318,17 +444,13 @@ class Config:
         if "tokens_path" in data and not isinstance(data["tokens_path"], str):
             raise ConfigError(f"tokens_path must be a string in {path}")
 
+    def _missing_required(self) -> list[str]:
+        """Return the environment variable names of unset required credentials."""
+        return [env_key for env_key, attr in _REQUIRED_CREDENTIALS if not getattr(self, attr)]
+
     def validate(self) -> None:
         """Validate required configuration"""
-        missing = []
-
-        if not self.zoom_account_id:
-            missing.append("ZOOM_ACCOUNT_ID")
-        if not self.zoom_client_id:
-            missing.append("ZOOM_CLIENT_ID")
-        if not self.zoom_client_secret:
-            missing.append("ZOOM_CLIENT_SECRET")
-
+        missing = self._missing_required()
         if missing:
             raise ConfigError(
                 f"Missing required environment variables: {', '.join(missing)}\n"
@@ -337,15 +459,19 @@ class Config:
 
     def is_valid(self) -> bool:
         """Check if configuration is valid"""
-        try:
-            self.validate()
-            return True
-        except ConfigError:
-            return False
+        return not self._missing_required()
 
     def get_auth_mode(self) -> Literal["s2s", "oauth", "none"]:
-        """Return the active authentication mode based on available credentials."""
+        """Return the active authentication mode based on available credentials.
+
+        Only "s2s" is memoized: it depends solely on values read at construction.
+        The tokens file is checked on every call, so a login or logout during the
+        process (which writes or deletes it) is reflected immediately.
+        """
+        if self._auth_mode is not None:
+            return self._auth_mode
         if self.zoom_account_id and self.zoom_client_id and self.zoom_client_secret:
+            self._auth_mode = "s2s"
             return "s2s"
         try:
             if self.tokens_path.exists():
@@ -5,8 +5,10 @@ File downloader with streaming, progress tracking, and retry logic
 import copy
 import logging
 import os
+import re
 import shutil
 import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -22,6 +24,58 @@ from rich.progress import (
 
 from dlzoom.exceptions import DownloadFailedError as DownloadError
 
+# Streaming read size for recording downloads. requests defaults to tiny chunks,
+# which makes multi-GB recordings spend most of their time in per-chunk overhead.
+CHUNK_SIZE = 1 << 20  # 1 MiB
+
+# How long (seconds) a free-space reading is reused before statting the disk again
+_DISK_USAGE_TTL = 1.0
+
+# Sidecar bucket -> (skip log label, missing-URL label, download-error label)
+_SIDECAR_LABELS = {
+    "vtt": ("transcript", "VTT", "VTT"),
+    "txt": ("chat", "Chat", "chat"),
+    "timeline": ("timeline", "Timeline", "timeline"),
+}
+
+# Characters replaced with "_" in topic-derived filenames (keeps letters, digits,
+# spaces, hyphens and underscores) and in identifier suffixes (keeps alphanumerics)
+_TOPIC_UNSAFE_RE = re.compile(r"[^\w \-]")
+_SUFFIX_UNSAFE_RE = re.compile(r"\W")
+
+
+def _tolerance(expected_size: int) -> float:
+    """Allowed relative size drift: 2% for files under 10 MB, 5% for larger files."""
+    return 0.02 if expected_size < 10_000_000 else 0.05
+
+
+def _open_for_write(path: Path, mode: str) -> int:
+    """Open ``path`` as a raw fd: truncate for "wb", append for "ab" (resume).
+
+    New files get 0o666 so the umask alone decides permissions, as with ``open()``.
+    """
+    flags = os.O_WRONLY | os.O_CREAT | getattr(os, "O_BINARY", 0)
+    flags |= os.O_APPEND if mode == "ab" else os.O_TRUNC
+    return os.open(str(path), flags, 0o666)
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """Write ``data`` to ``fd`` unbuffered, looping over short writes."""
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
+@lru_cache(maxsize=64)
+def _instance_slug(instance_start: str) -> str:
+    """Filename-safe form of an instance start time, e.g. "2025-01-03_10-00-00Z".
+
+    Every file of a meeting instance shares the same start time, so the slug is
+    computed once per instance rather than once per file.
+    """
+    return instance_start.replace(":", "-").replace("T", "_").split(".")[0]
+
 
 class Downloader:
     """Download files with streaming, progress bars, and retry logic"""
@@ -42,6 +96,21 @@ class Downloader:
         self.logger = logging.getLogger(__name__)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.stj_context = stj_context
+        # (monotonic timestamp, free bytes) from the last disk_usage() call
+        self._free_cache: tuple[float, int] | None = None
+        # Keep-alive session so the files of one meeting reuse the same HTTPS connection.
+        # The token travels as a query parameter, never as a session header.
+        self._session = requests.Session()
+
+    def close(self) -> None:
+        """Release pooled download connections."""
+        self._session.close()
+
+    def __enter__(self) -> "Downloader":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
     def _context_for_stj(self, *, timeline_path: Path, stj_path: Path) -> dict[str, Any] | None:
         if not self.stj_context:
@@ -68,10 +137,17 @@ class Downloader:
         Note:
             This check has a TOCTOU (Time-Of-Check-Time-Of-Use) race condition.
             Actual writes are also wrapped in try/except to catch ENOSPC errors.
+            The free-space reading is reused for ``_DISK_USAGE_TTL`` seconds so
+            batch downloads do not stat the disk once per file.
         """
         try:
-            stat = shutil.disk_usage(self.output_dir)
-            available = stat.free
+            now = time.monotonic()
+            cached = self._free_cache
+            if cached is not None and now - cached[0] < _DISK_USAGE_TTL:
+                available = cached[1]
+            else:
+                available = shutil.disk_usage(self.output_dir).free
+                self._free_cache = (now, available)
             # Add 100MB buffer
             required_with_buffer = required_bytes + (100 * 1024 * 1024)
 
@@ -102,11 +178,11 @@ class Downloader:
         for raw in candidates:
             raw = raw.strip()
             if raw:
-                safe = "".join(c if c.isalnum() else "_" for c in raw)
+                safe = _SUFFIX_UNSAFE_RE.sub("_", raw)
                 return f"_{safe}"
         recording_type = file_info.get("recording_type") or file_info.get("file_type")
         if recording_type:
-            safe = "".join(c if c.isalnum() else "_" for c in str(recording_type))
+            safe = _SUFFIX_UNSAFE_RE.sub("_", str(recording_type))
             return f"_{safe.lower()}"
         return ""
 
@@ -173,17 +249,14 @@ class Downloader:
 
         # Fallback: Use meeting topic and timestamp (original logic)
         # Sanitize meeting topic
-        safe_topic = "".join(
-            c if c.isalnum() or c in (" ", "-", "_") else "_" for c in meeting_topic
-        ).strip()
+        safe_topic = _TOPIC_UNSAFE_RE.sub("_", meeting_topic).strip()
 
         recording_type = file_info.get("recording_type", "")
 
         # Build filename with unique identifier
         base_name = safe_topic
         if instance_start:
-            timestamp = instance_start.replace(":", "-").replace("T", "_").split(".")[0]
-            base_name = f"{base_name}_{timestamp}"
+            base_name = f"{base_name}_{_instance_slug(instance_start)}"
 
         # Add recording type if it's informative
         if recording_type and recording_type.lower() != file_type.lower():
@@ -320,7 +393,9 @@ class Downloader:
                     headers["Range"] = f"bytes={resume_from}-"
 
                 # Stream download with progress bar
-                response = requests.get(url_with_token, stream=True, timeout=30, headers=headers)
+                response = self._session.get(
+                    url_with_token, stream=True, timeout=30, headers=headers
+                )
 
                 # Handle resume
                 if resume_from > 0:
@@ -389,9 +464,7 @@ class Downloader:
                         size_diff = abs(total_size - expected_size)
                         size_diff_pct = size_diff / expected_size
 
-                        # Use smaller tolerance for small files, larger for big files
-                        # 2% for files < 10MB, 5% for larger files
-                        tolerance = 0.02 if expected_size < 10_000_000 else 0.05
+                        tolerance = _tolerance(expected_size)
 
                         if size_diff_pct > tolerance:
                             self.logger.warning(
@@ -420,9 +493,7 @@ class Downloader:
                         size_diff = abs(actual_size - expected_size)
                         size_diff_pct = size_diff / expected_size
 
-                        # Use smaller tolerance for small files, larger for big files
-                        # 2% for files < 10MB, 5% for larger files
-                        tolerance = 0.02 if expected_size < 10_000_000 else 0.05
+                        tolerance = _tolerance(expected_size)
 
                         if size_diff_pct > tolerance:
                             self.logger.error(
@@ -437,13 +508,9 @@ class Downloader:
                                 f"{filename}: expected {expected_size}, got {actual_size}"
                             )
 
-                # Move temp file to final location (atomic operation)
-                try:
-                    # os.replace() is atomic on POSIX systems
-                    os.replace(str(temp_path), str(output_path))
-                except OSError:
-                    # Fallback for cross-filesystem moves
-                    shutil.move(str(temp_path), str(output_path))
+                # Move temp file to final location. temp_path sits next to output_path,
+                # so this never crosses filesystems and os.replace() stays atomic.
+                os.replace(temp_path, output_path)
 
                 self.logger.info(f"Downloaded: {filename}")
                 return output_path
@@ -511,11 +578,14 @@ class Downloader:
             )
 
             try:
-                with open(output_path, mode) as f:
-                    for chunk in response.iter_content(chunk_size=8192):
+                fd = _open_for_write(output_path, mode)
+                try:
+                    for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
                         if chunk:
-                            f.write(chunk)
+                            _write_all(fd, chunk)
                             progress.update(task, advance=len(chunk))
+                finally:
+                    os.close(fd)
             except OSError as e:
                 # Handle disk full error (ENOSPC)
                 if e.errno == 28:  # errno.ENOSPC
@@ -533,10 +603,13 @@ class Downloader:
     ) -> None:
         """Download without progress bar"""
         try:
-            with open(output_path, mode) as f:
-                for chunk in response.iter_content(chunk_size=8192):
+            fd = _open_for_write(output_path, mode)
+            try:
+                for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
                     if chunk:
-                        f.write(chunk)
+                        _write_all(fd, chunk)
+            finally:
+                os.close(fd)
         except OSError as e:
             # Handle disk full error (ENOSPC)
             if e.errno == 28:  # errno.ENOSPC
@@ -626,126 +699,111 @@ class Downloader:
             Dict with keys: vtt, txt, timeline, speakers (values are lists of Paths)
         """
         result: dict[str, list[Path]] = {"vtt": [], "txt": [], "timeline": [], "speakers": []}
+        skip = {"vtt": skip_transcript, "txt": skip_chat, "timeline": skip_timeline}
 
+        # Single pass in the API's file order; each result lands in its file's bucket.
+        # Downloads stay sequential: sidecars can share a target filename, and the
+        # session and free-space cache are not safe to share across threads.
         for file_info in recording_files:
-            file_ext = (file_info.get("file_extension") or "").upper()
-            file_type_value = (file_info.get("file_type") or "").upper()
-            recording_type_value = (file_info.get("recording_type") or "").upper()
-            combined_type = f"{file_type_value} {recording_type_value}"
-
-            # VTT (closed captions/transcripts)
-            if file_ext == "VTT":
-                if skip_transcript:
-                    self.logger.info("Skipping transcript download")
-                    continue
-
-                download_url = file_info.get("download_url")
-                if not download_url:
-                    self.logger.warning("VTT file has no download URL, skipping")
-                    continue
-
-                try:
-                    path = self.download_file(
-                        str(download_url),
-                        file_info,
-                        meeting_topic,
-                        instance_start,
-                        show_progress,
-                    )
-                    result["vtt"].append(path)
-                except DownloadError as e:
-                    self.logger.error(f"Failed to download VTT: {e}")
-
-            # TXT (chat)
-            elif file_ext == "TXT":
-                if skip_chat:
-                    self.logger.info("Skipping chat download")
-                    continue
-
-                download_url = file_info.get("download_url")
-                if not download_url:
-                    self.logger.warning("Chat file has no download URL, skipping")
-                    continue
-
-                try:
-                    path = self.download_file(
-                        str(download_url),
-                        file_info,
-                        meeting_topic,
-                        instance_start,
-                        show_progress,
-                    )
-                    result["txt"].append(path)
-                except DownloadError as e:
-                    self.logger.error(f"Failed to download chat: {e}")
-
-            # JSON/TIMELINE
-            elif "TIMELINE" in combined_type:
-                if skip_timeline:
-                    self.logger.info("Skipping timeline download")
-                    continue
+            bucket = self._sidecar_bucket(file_info)
+            if bucket is None:
+                continue
+            skip_label, file_label, error_label = _SIDECAR_LABELS[bucket]
+            if skip[bucket]:
+                self.logger.info(f"Skipping {skip_label} download")
+                continue
 
-                download_url = file_info.get("download_url")
-                if not download_url:
-                    self.logger.warning("Timeline file has no download URL, skipping")
-                    continue
+            download_url = file_info.get("download_url")
+            if not download_url:
+                self.logger.warning(f"{file_label} file has no download URL, skipping")
+                continue
 
-                try:
-                    path = self.download_file(
-                        str(download_url),
-                        file_info,
-                        meeting_topic,
-                        instance_start,
-                        show_progress,
-                    )
-                    result["timeline"].append(path)
-
-                    # Generate minimal STJ speakers file by default unless disabled
-                    try:
-                        # honor explicit skip_speakers if provided; else check env default
-                        do_skip_speakers = False
-                        if skip_speakers is None:
-                            import os as _os
-
-                            env_val = _os.getenv("DLZOOM_SPEAKERS", "1")
-                            normalized = env_val.strip().lower()
-                            do_skip_speakers = normalized in ("0", "false", "no", "off")
-                        else:
-                            do_skip_speakers = bool(skip_speakers)
+            try:
+                path = self.download_file(
+                    str(download_url), file_info, meeting_topic, instance_start, show_progress
+                )
+            except DownloadError as e:
+                self.logger.error(f"Failed to download {error_label}: {e}")
+                continue
+            result[bucket].append(path)
+
+            if bucket == "timeline":
+                stj_path = self._generate_speakers_stj(
+                    path,
+                    file_info,
+                    skip_speakers=skip_speakers,
+                    speakers_mode=speakers_mode,
+                    stj_min_segment_sec=stj_min_segment_sec,
+                    stj_merge_gap_sec=stj_merge_gap_sec,
+                    include_unknown=include_unknown,
+                )
+                if stj_path is not None:
+                    result["speakers"].append(stj_path)
 
-                        if not do_skip_speakers:
-                            from dlzoom.stj_minimizer import write_minimal_stj_from_file
+        return result
 
-                            # Compute output path using template-driven base name when available
-                            if self.output_name:
-                                stj_filename = f"{self.output_name}_speakers.stjson"
-                            else:
-                                stj_base = Path(path).stem
-                                speaker_suffix = self._unique_suffix(file_info)
-                                stj_filename = f"{stj_base}_speakers{speaker_suffix}.stjson"
+    @staticmethod
+    def _sidecar_bucket(file_info: dict[str, Any]) -> str | None:
+        """Classify a recording file as "vtt", "txt", "timeline", or None (not a sidecar)"""
+        file_ext = (file_info.get("file_extension") or "").upper()
+        if file_ext == "VTT":
+            return "vtt"
+        if file_ext == "TXT":
+            return "txt"
+        file_type_value = (file_info.get("file_type") or "").upper()
+        recording_type_value = (file_info.get("recording_type") or "").upper()
+        if "TIMELINE" in f"{file_type_value} {recording_type_value}":
+            return "timeline"
+        return None
+
+    def _generate_speakers_stj(
+        self,
+        timeline_path: Path,
+        file_info: dict[str, Any],
+        *,
+        skip_speakers: bool | None,
+        speakers_mode: str,
+        stj_min_segment_sec: float,
+        stj_merge_gap_sec: float,
+        include_unknown: bool,
+    ) -> Path | None:
+        """Write the minimal STJ speakers file for a timeline unless disabled"""
+        try:
+            # honor explicit skip_speakers if provided; else check env default
+            if skip_speakers is None:
+                env_val = os.getenv("DLZOOM_SPEAKERS", "1")
+                do_skip_speakers = env_val.strip().lower() in ("0", "false", "no", "off")
+            else:
+                do_skip_speakers = bool(skip_speakers)
 
-                            stj_path = self._ensure_unique_path(self.output_dir / stj_filename)
+            if do_skip_speakers:
+                return None
 
-                            self.logger.info(
-                                f"Generating minimal STJ speakers file: {stj_path.name}"
-                            )
-                            context_payload = self._context_for_stj(
-                                timeline_path=path, stj_path=stj_path
-                            )
-                            write_minimal_stj_from_file(
-                                timeline_path=path,
-                                output_path=stj_path,
-                                duration_sec=None,
-                                mode=speakers_mode,
-                                min_segment_sec=stj_min_segment_sec,
-                                merge_gap_sec=stj_merge_gap_sec,
-                                include_unknown=include_unknown,
-                                context=context_payload,
-                            )
-                            result["speakers"].append(stj_path)
-                    except Exception as e:
-                        self.logger.error(f"Failed to generate STJ speakers file: {e}")
-                except DownloadError as e:
-                    self.logger.error(f"Failed to download timeline: {e}")
+            from dlzoom.stj_minimizer import write_minimal_stj_from_file
 
-        return result
+            # Compute output path using template-driven base name when available
+            if self.output_name:
+                stj_filename = f"{self.output_name}_speakers.stjson"
+            else:
+                stj_base = Path(timeline_path).stem
+                speaker_suffix = self._unique_suffix(file_info)
+                stj_filename = f"{stj_base}_speakers{speaker_suffix}.stjson"
+
+            stj_path = self._ensure_unique_path(self.output_dir / stj_filename)
+
+            self.logger.info(f"Generating minimal STJ speakers file: {stj_path.name}")
+            context_payload = self._context_for_stj(timeline_path=timeline_path, stj_path=stj_path)
+            write_minimal_stj_from_file(
+                timeline_path=timeline_path,
+                output_path=stj_path,
+                duration_sec=None,
+                mode=speakers_mode,
+                min_segment_sec=stj_min_segment_sec,
+                merge_gap_sec=stj_merge_gap_sec,
+                include_unknown=include_unknown,
+                context=context_payload,
+            )
+            return stj_path
+        except Exception as e:
+            self.logger.error(f"Failed to generate STJ speakers file: {e}")
+            return None
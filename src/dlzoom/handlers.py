@@ -24,6 +24,7 @@ BUG_VALIDATION_REPORT.md and docs/architecture.md (Recording Fetching Modes).
 
 from __future__ import annotations
 
+import calendar
 import json as _json
 import time
 import urllib.parse
@@ -36,6 +37,11 @@ from typing import Any, Literal
 
 from rich.console import Console
 
+try:
+    import orjson as _orjson  # type: ignore[import-not-found]
+except ImportError:  # optional speedup; see json_dumps()
+    _orjson = None  # type: ignore[assignment]
+
 from dlzoom import __version__ as dlzoom_version
 from dlzoom.audio_extractor import AudioExtractor
 from dlzoom.downloader import Downloader, DownloadError
@@ -92,11 +98,12 @@ def _resolve_scope(
             details=f"Got: {scope_flag}",
         )
 
+    resolved_scope: str
     if requested_scope == "auto":
         resolved_scope = "account" if use_s2s else "user"
         reason = "auto-s2s" if use_s2s else "auto-user-token"
     else:
-        resolved_scope = requested_scope  # type: ignore[assignment]
+        resolved_scope = requested_scope
         reason = "explicit"
 
     # Account scope only works with S2S credentials
@@ -139,24 +146,25 @@ def _chunk_by_month(
     if not from_date or not to_date:
         return [(from_date, to_date)]
 
-    start = datetime.strptime(from_date, "%Y-%m-%d").date()
-    end = datetime.strptime(to_date, "%Y-%m-%d").date()
+    # Inputs are already validated as YYYY-MM-DD; fromisoformat is the C fast path
+    start = date.fromisoformat(from_date)
+    end = date.fromisoformat(to_date)
     if start > end:
         raise ConfigError("from_date must be before or equal to to_date for recording fetches")
 
     # Use calendar-month slices because Zoom rejects requests spanning >30 days.
+    # Walk a single year*12+month counter instead of building date objects per chunk.
+    first = start.year * 12 + start.month - 1
+    last = end.year * 12 + end.month - 1
     chunks: list[tuple[str | None, str | None]] = []
-    current = start
-    while current <= end:
-        if current.month == 12:
-            next_month = date(current.year + 1, 1, 1)
-        else:
-            next_month = date(current.year, current.month + 1, 1)
-        month_end = next_month - timedelta(days=1)
-        chunk_start = current
-        chunk_end = month_end if month_end <= end else end
-        chunks.append((chunk_start.strftime("%Y-%m-%d"), chunk_end.strftime("%Y-%m-%d")))
-        current = chunk_end + timedelta(days=1)
+    for index in range(first, last + 1):
+        year, month = divmod(index, 12)
+        month += 1
+        first_day = start.day if index == first else 1
+        last_day = end.day if index == last else calendar.monthrange(year, month)[1]
+        chunks.append(
+            (f"{year:04d}-{month:02d}-{first_day:02d}", f"{year:04d}-{month:02d}-{last_day:02d}")
+        )
 
     return chunks
 
@@ -274,7 +282,43 @@ def _raise_account_scope_error(exc: ZoomAPIError) -> None:
     raise ConfigError(scope_hint, details=details) from exc
 
 
+def _renders_like_stdlib(obj: Any) -> bool:
+    """Return True when orjson output for ``obj`` is byte-identical to the stdlib's.
+
+    Only exact JSON-native types qualify. Floats are excluded because exponent and
+    NaN/Infinity formatting differ. Strings must be ASCII without DEL, which orjson
+    leaves unescaped. Anything else (datetime, UUID, dataclasses, subclasses) is left
+    to the stdlib encoder, which keeps raising TypeError for unsupported values.
+    """
+    kind = type(obj)
+    if kind is str:
+        return obj.isascii() and "\x7f" not in obj
+    if kind is int or kind is bool or obj is None:
+        return True
+    if kind is dict:
+        return all(
+            type(key) is str and _renders_like_stdlib(key) and _renders_like_stdlib(value)
+            for key, value in obj.items()
+        )
+    if kind is list or kind is tuple:
+        return all(_renders_like_stdlib(item) for item in obj)
+    return False
+
+
 def json_dumps(data: Any) -> str:
+    """Serialize CLI output as indented JSON, via orjson when it is installed.
+
+    orjson is only used for payloads it renders exactly like ``json.dumps(..., indent=2)``
+    (see ``_renders_like_stdlib``); everything else goes through the stdlib encoder,
+    so the output is the same with or without the ``fast`` extra.
+    """
+    if _orjson is not None and _renders_like_stdlib(data):
+        try:
+            text: str = _orjson.dumps(data, option=_orjson.OPT_INDENT_2).decode()
+        except TypeError:
+            pass  # ints beyond 64 bits
+        else:
+            return text
     return _json.dumps(data, indent=2)
 
 
@@ -502,7 +546,7 @@ def _handle_check_availability(
         ) -> dict[str, Any]:
             if not capture_result:
                 if json_mode:
-                    print(_json.dumps(result, indent=2))
+                    print(json_dumps(result))
                 else:
                     if human_error:
                         formatter.output_error(human_error)
@@ -873,7 +917,7 @@ def _handle_batch_download(
             "results": results,
             "log_file": log_path_str,
         }
-        print(_json.dumps(batch_result, indent=2))
+        print(json_dumps(batch_result))
     else:
         console.print("\n[bold]Batch download complete:[/bold]")
         console.print(f"  Success: {success_count}/{total_meetings}")
@@ -1266,7 +1310,7 @@ def _handle_download_mode(
             if log_file_str:
                 dry_run_result["log_file"] = log_file_str
             _append_scope_fields(dry_run_result)
-            print(_json.dumps(dry_run_result, indent=2))
+            print(json_dumps(dry_run_result))
         else:
             formatter.output_info(
                 "Dry run: would download "
@@ -1357,59 +1401,64 @@ def _handle_download_mode(
     if not audio_download_url:
         raise DownloadError("Audio file has no download URL")
 
-    audio_path: Path = downloader.download_file(
-        str(audio_download_url),
-        audio_file,
-        meeting_topic,
-        instance_start,
-        show_progress=not json_mode,
-    )
-    _track_downloaded_file(audio_path)
-    delivered_audio_path = audio_path
-
-    if audio_path.suffix.lower() == ".mp4":
-        _track_video_file(audio_path)
-        if not extractor.check_ffmpeg_available():
-            raise FFmpegNotFoundError(
-                "ffmpeg not found",
-                details=(
-                    "Install ffmpeg to extract audio from MP4 files: "
-                    "https://ffmpeg.org/download.html"
-                ),
-            )
-        formatter.output_info("Extracting audio from MP4...")
-        audio_m4a_path = extractor.extract_audio(audio_path, verbose=debug or verbose)
-        formatter.output_success(f"Audio extracted: {audio_m4a_path}")
-        formatter.output_info(f"MP4 file retained: {audio_path}")
-        audio_extracted_from_video = True
-        _track_generated_file(audio_m4a_path)
-        delivered_audio_path = audio_m4a_path
-        _track_audio_file(audio_m4a_path)
-    else:
-        _track_audio_file(audio_path)
-
-    if delivered_audio_path:
-        _track_audio_file(delivered_audio_path)
-
-    if not skip_transcript or not skip_chat or not skip_timeline:
-        transcript_files = downloader.download_transcripts_and_chat(
-            recording_files,
+    try:
+        audio_path: Path = downloader.download_file(
+            str(audio_download_url),
+            audio_file,
             meeting_topic,
             instance_start,
             show_progress=not json_mode,
-            skip_transcript=skip_transcript,
-            skip_chat=skip_chat,
-            skip_timeline=skip_timeline,
-            skip_speakers=skip_speakers,
-            speakers_mode=speakers_mode,
-            stj_min_segment_sec=stj_min_segment_sec,
-            stj_merge_gap_sec=stj_merge_gap_sec,
-            include_unknown=include_unknown,
         )
-        for category, paths in transcript_files.items():
-            tracker = _track_generated_file if category == "speakers" else _track_downloaded_file
-            for path in paths:
-                tracker(path)
+        _track_downloaded_file(audio_path)
+        delivered_audio_path = audio_path
+
+        if audio_path.suffix.lower() == ".mp4":
+            _track_video_file(audio_path)
+            if not extractor.check_ffmpeg_available():
+                raise FFmpegNotFoundError(
+                    "ffmpeg not found",
+                    details=(
+                        "Install ffmpeg to extract audio from MP4 files: "
+                        "https://ffmpeg.org/download.html"
+                    ),
+                )
+            formatter.output_info("Extracting audio from MP4...")
+            audio_m4a_path = extractor.extract_audio(audio_path, verbose=debug or verbose)
+            formatter.output_success(f"Audio extracted: {audio_m4a_path}")
+            formatter.output_info(f"MP4 file retained: {audio_path}")
+            audio_extracted_from_video = True
+            _track_generated_file(audio_m4a_path)
+            delivered_audio_path = audio_m4a_path
+            _track_audio_file(audio_m4a_path)
+        else:
+            _track_audio_file(audio_path)
+
+        if delivered_audio_path:
+            _track_audio_file(delivered_audio_path)
+
+        if not skip_transcript or not skip_chat or not skip_timeline:
+            transcript_files = downloader.download_transcripts_and_chat(
+                recording_files,
+                meeting_topic,
+                instance_start,
+                show_progress=not json_mode,
+                skip_transcript=skip_transcript,
+                skip_chat=skip_chat,
+                skip_timeline=skip_timeline,
+                skip_speakers=skip_speakers,
+                speakers_mode=speakers_mode,
+                stj_min_segment_sec=stj_min_segment_sec,
+                stj_merge_gap_sec=stj_merge_gap_sec,
+                include_unknown=include_unknown,
+            )
+            for category, paths in transcript_files.items():
+                tracker = (
+                    _track_generated_file if category == "speakers" else _track_downloaded_file
+                )
+                for path in paths:
+                    tracker(path)
+    finally:
+        downloader.close()
 
     participants: list[dict[str, Any]] = []
     if meeting_uuid and isinstance(client, ZoomClient):
@@ -1640,4 +1689,4 @@ def _handle_download_mode(
             result["status"] = "partial_success"
             result["warnings"] = warnings
 
-        print(_json.dumps(result, indent=2))
+        print(json_dumps(result))
@@ -5,6 +5,11 @@ Recording selector - chooses best recording from multiple instances
 import logging
 from typing import Any
 
+# Audio source priority: audio_only (any format) > other M4A > MP4 video
+_RANK_AUDIO_ONLY = 3
+_RANK_M4A = 2
+_EXTENSION_RANKS: dict[Any, int] = {"M4A": _RANK_M4A, "MP4": 1}
+
 
 class RecordingSelector:
     """Select best recording from meeting instances"""
@@ -18,42 +23,49 @@ class RecordingSelector:
 
         self.logger.info(f"Selecting best audio from {len(recording_files)} recording files")
 
-        # Check for audio_only (any format)
+        # Single pass: keep the first file of the highest rank seen so far
+        best: dict[str, Any] | None = None
+        best_rank = 0
         for file in recording_files:
-            if file.get("file_type") == "audio_only":
-                file_ext = file.get("file_extension")
+            rank = self._audio_rank(file)
+            if rank > best_rank:
+                best, best_rank = file, rank
+                if rank == _RANK_AUDIO_ONLY:
+                    break
+
+        if best is not None:
+            file_ext = best.get("file_extension")
+            if best_rank == _RANK_AUDIO_ONLY:
                 if file_ext != "M4A":
                     self.logger.warning(
                         f"Zoom bug: audio_only returned as {file_ext}, expected M4A"
                     )
                 self.logger.info(f"Selected audio_only file: {file_ext} (highest priority)")
-                return file
-
-        # Check for other M4A files
-        for file in recording_files:
-            if file.get("file_extension") == "M4A":
-                file_type = file.get("file_type", "unknown")
+            elif best_rank == _RANK_M4A:
+                file_type = best.get("file_type", "unknown")
                 self.logger.info(f"Selected M4A file (type: {file_type})")
-                return file
-
-        # Fallback to MP4 video (will need extraction)
-        for file in recording_files:
-            if file.get("file_extension") == "MP4":
+            else:
                 self.logger.info("Selected MP4 video file (will extract audio)")
-                return file
+            return best
 
         self.logger.warning("No suitable audio file found (no M4A or MP4)")
         return None
 
+    @staticmethod
+    def _audio_rank(file: dict[str, Any]) -> int:
+        """Rank a recording file for audio extraction (0 = unusable)"""
+        if file.get("file_type") == "audio_only":
+            return _RANK_AUDIO_ONLY
+        return _EXTENSION_RANKS.get(file.get("file_extension"), 0)
+
     def select_most_recent_instance(self, instances: list[dict[str, Any]]) -> dict[str, Any] | None:
         """Select most recent meeting instance"""
         if not instances:
             return None
 
-        # Sort by start_time descending
-        sorted_instances = sorted(instances, key=lambda x: x.get("start_time", ""), reverse=True)
-
-        return sorted_instances[0]
+        # Zoom start_time values are UTC ISO-8601 ("YYYY-MM-DDTHH:MM:SSZ"), which order
+        # lexically; a single max() pass avoids sorting or parsing timestamps
+        return max(instances, key=lambda x: x.get("start_time", ""))
 
     def filter_by_uuid(self, instances: list[dict[str, Any]], uuid: str) -> dict[str, Any] | None:
         """Find specific instance by UUID"""
@@ -64,5 +76,4 @@ class RecordingSelector:
 
     def detect_multiple_instances(self, recordings: dict[str, Any]) -> bool:
         """Detect if recording has multiple instances (PMI/recurring)"""
-        meetings = recordings.get("meetings", [])
-        return len(meetings) > 1
+        return len(recordings.get("meetings", ())) > 1
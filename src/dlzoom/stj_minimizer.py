@@ -18,9 +18,16 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson as _orjson  # type: ignore[import-not-found]
+except ImportError:  # optional speedup; see _load_json() and _dump_stj()
+    _orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 _MAX_SPEAKER_ID_LEN = 64
+_SLUG_SEPARATOR_RE = re.compile(r"[^A-Za-z0-9]+")
+_TIMESTAMP_RE = re.compile(r"(\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,3}))?")
 
 
 def _parse_hhmmss_ms(ts: str) -> float:
@@ -35,7 +42,7 @@ def _parse_hhmmss_ms(ts: str) -> float:
         return int(h) * 3600 + int(mm_str) * 60 + sec
     except Exception:
         # Fallback: extract numerical parts
-        match = re.match(r"^(\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,3}))?$", ts.strip())
+        match = _TIMESTAMP_RE.fullmatch(ts.strip())
         if not match:
             raise ValueError(f"Invalid timestamp: {ts!r}")
         hh, mm, ss, ms = match.groups()
@@ -48,8 +55,8 @@ def _parse_hhmmss_ms(ts: str) -> float:
 
 
 def _slugify(name: str) -> str:
-    s = re.sub(r"[^A-Za-z0-9]+", "-", name).strip("-")
-    s = re.sub(r"-+", "-", s)
+    # One substitution: each run of non-alphanumerics (dashes included) becomes one dash
+    s = _SLUG_SEPARATOR_RE.sub("-", name).strip("-")
     return s.lower() or "speaker"
 
 
@@ -130,14 +137,12 @@ class _SpeakerRegistry:
 
     def _get_or_create(self, user: dict[str, Any]) -> str:
         key = _user_identity_key(user)
-        if key in self._identity_to_id:
-            return self._identity_to_id[key]
+        existing = self._identity_to_id.get(key)
+        if existing is not None:
+            return existing
         name = _display_name(user)
-        base_slug = _slugify(name)
-        if not base_slug:
-            base_slug = "speaker"
-        base_slug = base_slug[:_MAX_SPEAKER_ID_LEN]
-        slug = self._reserve_slug(base_slug or "speaker")
+        # _reserve_slug applies the "speaker" fallback and the length cap
+        slug = self._reserve_slug(_slugify(name))
         extensions = _speaker_extensions(user)
         speaker = _Speaker(id=slug, name=name, extensions=extensions)
         self._speakers[slug] = speaker
@@ -320,22 +325,22 @@ def timeline_to_minimal_stj(
     registry.ingest(entries)
     used_speakers: set[str] = set()
 
-    # Build raw segments
-    raw_segments: list[tuple[float, float, str]] = []
-    for i, e in enumerate(entries):
-        ts = e.get("ts")
+    # Parse every timestamp once; each one is both a segment start and the previous end
+    starts: list[float | None] = []
+    for e in entries:
         try:
-            s = _parse_hhmmss_ms(str(ts))
+            starts.append(_parse_hhmmss_ms(str(e.get("ts"))))
         except Exception:
+            starts.append(None)
+    # Sentinel end for the last entry
+    starts.append(duration_sec)
+
+    # Build raw segments
+    raw_segments: list[tuple[float, float, str]] = []
+    for e, s, next_start in zip(entries, starts, starts[1:]):
+        if s is None:
             continue
-        if i + 1 < len(entries):
-            e2 = entries[i + 1]
-            try:
-                end = _parse_hhmmss_ms(str(e2.get("ts")))
-            except Exception:
-                end = s
-        else:
-            end = duration_sec if duration_sec is not None else s
+        end = s if next_start is None else next_start
         sid = registry.speaker_id_for_users(e.get("users"))
         if sid is None:
             if include_unknown:
@@ -398,6 +403,34 @@ def timeline_to_minimal_stj(
     return stj
 
 
+def _load_json(path: Path) -> Any:
+    """Parse a JSON file from raw bytes, using orjson when the ``fast`` extra is installed."""
+    raw = Path(path).read_bytes()
+    if _orjson is not None:
+        return _orjson.loads(raw)
+    return json.loads(raw.decode("utf-8"))
+
+
+def _dump_stj(stj: dict[str, Any]) -> bytes:
+    """Serialize STJ as indented UTF-8 JSON with a trailing newline.
+
+    With orjson the document is equivalent JSON, not byte-identical to
+    ``json.dumps(indent=2, ensure_ascii=False)``: float exponents are written
+    differently (``1e16`` vs ``1e+16``) and non-finite floats become ``null``.
+    Segment times come from parsed timestamps, so they are always finite. Payloads
+    orjson rejects (non-str keys, oversized ints) fall back to the stdlib encoder.
+    """
+    if _orjson is not None:
+        try:
+            data: bytes = _orjson.dumps(
+                stj, option=_orjson.OPT_INDENT_2 | _orjson.OPT_APPEND_NEWLINE
+            )
+            return data
+        except TypeError:
+            pass
+    return (json.dumps(stj, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+
+
 def write_minimal_stj_from_file(
     timeline_path: Path,
     output_path: Path,
@@ -411,11 +444,16 @@ def write_minimal_stj_from_file(
 ) -> Path:
     """Read a Zoom timeline JSON file and write minimal STJ to output_path."""
     try:
-        with open(timeline_path, encoding="utf-8") as f:
-            data = json.load(f)
+        data = _load_json(timeline_path)
     except Exception as e:
         raise RuntimeError(f"Failed to read timeline JSON: {timeline_path}: {e}")
 
+    # Only one timeline variant is converted (timeline_refine wins); release the other
+    # before building segments so long meetings do not hold both lists in memory.
+    if isinstance(data, dict) and isinstance(data.get("timeline_refine"), list):
+        if data["timeline_refine"]:
+            data.pop("timeline", None)
+
     stj = timeline_to_minimal_stj(
         data,
         duration_sec=duration_sec,
@@ -427,7 +465,5 @@ def write_minimal_stj_from_file(
     )
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(stj, f, indent=2, ensure_ascii=False)
-        f.write("\n")
+    output_path.write_bytes(_dump_stj(stj))
     return output_path
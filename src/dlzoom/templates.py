@@ -5,9 +5,28 @@ Template parsing for custom filenames and folders
 import logging
 import re
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+logger = logging.getLogger(__name__)
+
+# {start_time:<strftime format>} placeholders
+_START_TIME_RE = re.compile(r"\{start_time:([^}]+)\}")
+# Characters that are unsafe in filenames on common platforms
+_UNSAFE_FILENAME_TABLE = str.maketrans(dict.fromkeys('<>:"/\\|?*', "_"))
+_UNDERSCORE_RUN_RE = re.compile(r"[_\s]+")
+
+
+@lru_cache(maxsize=1024)
+def _parse_start_time(start_time: str) -> datetime:
+    """Parse a Zoom ISO timestamp (2025-09-30T12:00:35Z), memoized per value.
+
+    A template with several {start_time:...} placeholders, or a batch of files from
+    the same meeting, parses each distinct timestamp only once.
+    """
+    return datetime.fromisoformat(start_time.replace("Z", "+00:00"))
+
 
 class TemplateParser:
     """Parse and apply filename/folder templates"""
@@ -15,7 +34,6 @@ class TemplateParser:
     def __init__(self, filename_template: str | None = None, folder_template: str | None = None):
         self.filename_template = filename_template
         self.folder_template = folder_template
-        self.logger = logging.getLogger(__name__)
 
     def apply_filename_template(
         self, meeting_data: dict[str, Any], file_type: str = "audio"
@@ -74,27 +92,25 @@ class TemplateParser:
         result = template
 
         # Handle datetime formatting: {start_time:%Y%m%d}
-        datetime_pattern = r"\{start_time:([^}]+)\}"
-        for match in re.finditer(datetime_pattern, result):
+        for match in _START_TIME_RE.finditer(template):
             format_str = match.group(1)
             start_time = data.get("start_time", "")
 
             if start_time:
                 try:
-                    # Parse ISO format: 2025-09-30T12:00:35Z
-                    dt = datetime.fromisoformat(start_time.replace("Z", "+00:00"))
+                    dt = _parse_start_time(start_time)
                     formatted = dt.strftime(format_str)
                     result = result.replace(match.group(0), formatted)
                 except (ValueError, TypeError) as e:
                     # Parse error - log and fall back to empty string (expected by tests)
-                    self.logger.warning(
+                    logger.warning(
                         f"Failed to parse date '{start_time}' with format "
                         f"'{format_str}' in template: {e}. Using empty string."
                     )
                     result = result.replace(match.group(0), "")
                 except Exception as e:
                     # Unexpected error - log error and re-raise
-                    self.logger.error(
+                    logger.error(
                         f"Unexpected error parsing template date placeholder {match.group(0)}: {e}"
                     )
                     raise RuntimeError(f"Template parsing failed for date placeholder: {e}") from e
@@ -127,12 +143,11 @@ class TemplateParser:
         Returns:
             Safe filename string
         """
-        # Replace unsafe characters
-        unsafe_chars = r'[<>:"/\\|?*]'
-        safe_name = re.sub(unsafe_chars, "_", name)
+        # Replace unsafe characters (single C-level pass)
+        safe_name = name.translate(_UNSAFE_FILENAME_TABLE)
 
         # Collapse multiple underscores/spaces
-        safe_name = re.sub(r"[_\s]+", "_", safe_name)
+        safe_name = _UNDERSCORE_RUN_RE.sub("_", safe_name)
 
         # Remove leading/trailing underscores/dots
         safe_name = safe_name.strip("_. ")
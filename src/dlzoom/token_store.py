@@ -85,7 +85,6 @@ def load(path: Path) -> Tokens | None:
 
 
 def save(path: Path, tokens: Tokens) -> None:
-    _ensure_dir(path)
     payload: dict[str, Any] = {
         "version": VERSION,
         "token_type": tokens.token_type,
@@ -96,6 +95,12 @@ def save(path: Path, tokens: Tokens) -> None:
         "scope": tokens.scope,
         "auth_url": tokens.auth_url,
     }
+    write_private_json(path, payload)
+
+
+def write_private_json(path: Path, payload: dict[str, Any]) -> None:
+    """Atomically write a JSON secret file readable only by the current user."""
+    _ensure_dir(path)
 
     # Atomic write
     tmp_fd, tmp_name = tempfile.mkstemp(dir=str(path.parent), prefix=path.name, text=True)
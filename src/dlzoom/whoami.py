@@ -46,6 +46,7 @@ def main(json_mode: bool, verbose: bool, debug: bool) -> None:
                 str(cfg.zoom_account_id),
                 str(cfg.zoom_client_id),
                 str(cfg.zoom_client_secret),
+                token_cache_dir=cfg.s2s_token_cache_dir,
             )
             client.base_url = cfg.zoom_api_base_url.rstrip("/")
             client.token_url = cfg.zoom_oauth_token_url or client.token_url
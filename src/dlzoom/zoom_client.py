@@ -3,12 +3,22 @@ Zoom API Client with Server-to-Server OAuth authentication
 """
 
 import base64
+import email.utils
+import hashlib
+import json
 import logging
+import random
+import re
 import time
 import urllib.parse
+from collections.abc import Callable
+from datetime import UTC, datetime
+from functools import lru_cache
+from pathlib import Path
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from dlzoom.exceptions import (
     AuthenticationError,
@@ -17,11 +27,124 @@ from dlzoom.exceptions import (
     RateLimitedError,
     RecordingNotFoundError,
 )
+from dlzoom.token_store import write_private_json
+
+# Upper bound for a single computed retry backoff, in seconds
+_MAX_BACKOFF_SEC = 30.0
+
+
+# Characters quote() never escapes; UUIDs made only of these encode to themselves
+_UNRESERVED_RE = re.compile(r"[A-Za-z0-9._~-]+")
+
+
+@lru_cache(maxsize=1024)
+def _double_encode_uuid(uuid: str) -> str:
+    """Double URL-encode a meeting UUID; memoized since the same UUID recurs per meeting."""
+    if _UNRESERVED_RE.fullmatch(uuid):
+        return uuid
+    return urllib.parse.quote(urllib.parse.quote(uuid, safe=""), safe="")
+
+
+def _retry_after_seconds(response: Any) -> float | None:
+    """Return the server's Retry-After hint in seconds, clamped to [0, 30].
+
+    Accepts both delta-seconds and HTTP-date forms; returns None when absent or unparseable.
+    """
+    try:
+        hdrs = getattr(response, "headers", None)
+        value = hdrs.get("Retry-After") if hdrs else None
+    except Exception:
+        return None
+    if isinstance(value, bytes):
+        value = value.decode("latin-1")
+    if not isinstance(value, str):
+        return None
+    value = value.strip()
+    # isdigit() alone also accepts non-ASCII digits such as "²", which float() rejects
+    if value.isascii() and value.isdigit():
+        seconds = float(value)
+    else:
+        try:
+            when = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=UTC)
+        seconds = (when - datetime.now(UTC)).total_seconds()
+    return min(_MAX_BACKOFF_SEC, max(0.0, seconds))
+
+
+class _TokenBucket:
+    """Client-side request pacing that adapts to the server's sustainable rate.
+
+    Each 429 halves the refill rate; each success nudges it back up towards the initial
+    rate, so a busy account settles below Zoom's limit instead of bouncing off it.
+    """
+
+    __slots__ = ("rate", "capacity", "_max_rate", "_tokens", "_last", "_clock", "_sleep")
+
+    # Floor for the adaptive rate so a burst of 429s cannot stall requests indefinitely
+    MIN_RATE = 1.0
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleeper: Callable[[float], None] = time.sleep,
+    ):
+        self.rate = rate
+        self.capacity = capacity
+        self._max_rate = rate
+        self._tokens = capacity
+        self._clock = clock
+        self._sleep = sleeper
+        self._last = clock()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until it has accrued if the bucket is empty."""
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + max(0.0, now - self._last) * self.rate)
+        self._last = now
+        if self._tokens < 1:
+            self._sleep((1 - self._tokens) / self.rate)
+            # The missing fraction accrued while sleeping and is spent by this request
+            self._tokens = 0.0
+            self._last = self._clock()
+        else:
+            self._tokens -= 1
+
+    def fail(self) -> None:
+        """Record a rate-limit response: halve the send rate."""
+        self.rate = max(self.MIN_RATE, self.rate / 2)
+
+    def success(self) -> None:
+        """Record a successful response: grow the send rate by 10%, up to the initial rate."""
+        self.rate = min(self._max_rate, self.rate * 1.1)
 
 
 class ZoomClient:
     """Client for Zoom API with Server-to-Server OAuth and token caching"""
 
+    # Fixed attribute set: no per-instance __dict__ when one client is built per user
+    __slots__ = (
+        "account_id",
+        "client_id",
+        "client_secret",
+        "_basic_auth_header",
+        "base_url",
+        "token_url",
+        "_sleep",
+        "_clock",
+        "_session",
+        "_access_token",
+        "_token_deadline",
+        "_token_cache_dir",
+        "_token_cache_loaded",
+        "_limiter",
+    )
+
     def __init__(
         self,
         account_id: str,
@@ -30,16 +153,39 @@ class ZoomClient:
         *,
         base_url: str = "https://api.zoom.us/v2",
         token_url: str | None = None,
+        sleeper: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.monotonic,
+        token_cache_dir: Path | None = None,
     ):
         self.account_id = account_id
         self.client_id = client_id
         self.client_secret = client_secret
+        # OAuth Basic credentials never change after construction; encode them once
+        self._basic_auth_header = (
+            "Basic " + base64.b64encode(f"{client_id}:{client_secret}".encode()).decode()
+        )
         self.base_url = base_url.rstrip("/")
         self.token_url = token_url.rstrip("/") if token_url else self._derive_token_url(base_url)
+        # Retry backoff waits go through this hook so callers can substitute a scheduler
+        self._sleep = sleeper
+        # Token expiry is tracked on a monotonic clock so wall-clock jumps cannot
+        # trigger spurious refreshes
+        self._clock = clock
+        # One pooled session for OAuth and API calls so consecutive requests reuse the
+        # TLS connection instead of handshaking per call
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+        # Pace API calls client-side so sustained listing stays under Zoom's rate limit
+        self._limiter = _TokenBucket(rate=10.0, capacity=20, clock=clock, sleeper=sleeper)
 
         # Token caching (in memory during execution)
         self._access_token: str | None = None
-        self._token_expires_at: float = 0
+        # Clock reading after which the cached token must be refreshed (60s early)
+        self._token_deadline: float = 0.0
+        # Optional on-disk cache so back-to-back CLI runs can skip the OAuth round-trip.
+        # Read lazily: callers may still adjust token_url after construction.
+        self._token_cache_dir = token_cache_dir
+        self._token_cache_loaded = False
 
     def __repr__(self) -> str:
         """
@@ -48,12 +194,8 @@ class ZoomClient:
         Prevents accidental credential exposure in logs, tracebacks, and debugging
         """
         return (
-            f"ZoomClient("
-            f"base_url={self.base_url!r}, "
-            f"account_id_set={bool(self.account_id)}, "
-            f"client_id_set={bool(self.client_id)}, "
-            f"token_cached={bool(self._access_token)}"
-            f")"
+            f"ZoomClient(base_url={self.base_url!r}, account_id_set={bool(self.account_id)}, "
+            f"client_id_set={bool(self.client_id)}, token_cached={self._access_token is not None})"
         )
 
     def clear_credentials(self) -> None:
@@ -68,36 +210,47 @@ class ZoomClient:
         self.account_id = ""
         self.client_id = ""
         self.client_secret = ""
+        self._basic_auth_header = ""
         self._access_token = None
 
+    def close(self) -> None:
+        """Clear credentials and release pooled connections."""
+        self.clear_credentials()
+        self._session.close()
+
+    def __enter__(self) -> "ZoomClient":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
     def __del__(self) -> None:
-        """Attempt to clear credentials when object is destroyed (best-effort only)"""
+        """Fallback cleanup when close() was not called (best-effort only)"""
         try:
-            self.clear_credentials()
+            self.close()
         except Exception:
             pass  # Ignore errors during finalization
 
     def _get_access_token(self) -> str:
         """Get access token with caching (refresh only when expired)"""
-        current_time = time.time()
+        if not self._token_cache_loaded:
+            self._token_cache_loaded = True
+            self._load_cached_token()
 
-        # Return cached token if still valid (with 60s buffer)
-        if self._access_token and current_time < (self._token_expires_at - 60):
+        # Return cached token if still valid (deadline already includes a 60s buffer)
+        if self._access_token and self._clock() < self._token_deadline:
             return self._access_token
 
         # Request new token
-        credentials = f"{self.client_id}:{self.client_secret}"
-        encoded_credentials = base64.b64encode(credentials.encode()).decode()
-
         headers = {
-            "Authorization": f"Basic {encoded_credentials}",
+            "Authorization": self._basic_auth_header,
             "Content-Type": "application/x-www-form-urlencoded",
         }
 
         data = {"grant_type": "account_credentials", "account_id": self.account_id}
 
         try:
-            response = requests.post(
+            response = self._session.post(
                 self.token_url,
                 headers=headers,
                 data=data,
@@ -154,10 +307,57 @@ class ZoomClient:
 
         self._access_token = token_data["access_token"]
         expires_in = token_data.get("expires_in", 3600)
-        self._token_expires_at = current_time + expires_in
+        self._token_deadline = self._clock() + expires_in - 60
+        self._persist_token(expires_in - 60)
 
         return str(self._access_token)
 
+    def _token_cache_file(self) -> Path | None:
+        """Per-credential cache file; hashed so the account ID never appears in the path."""
+        if self._token_cache_dir is None:
+            return None
+        key = f"{self.account_id}:{self.client_id}:{self.token_url}"
+        return self._token_cache_dir / f"{hashlib.sha256(key.encode()).hexdigest()[:16]}.json"
+
+    def _load_cached_token(self) -> None:
+        """Adopt a token persisted by an earlier run if it is still valid."""
+        path = self._token_cache_file()
+        if path is None:
+            return
+        try:
+            data = json.loads(path.read_bytes())
+            token = str(data["access_token"])
+            # Stored as wall-clock time; the monotonic clock does not survive the process
+            remaining = float(data["refresh_at"]) - time.time()
+        except (OSError, ValueError, KeyError, TypeError):
+            return
+        if remaining > 0:
+            self._access_token = token
+            self._token_deadline = self._clock() + remaining
+
+    def _persist_token(self, valid_for: float) -> None:
+        """Save the current token for later runs; failures only cost a future OAuth call."""
+        path = self._token_cache_file()
+        if path is None:
+            return
+        payload = {"access_token": self._access_token, "refresh_at": time.time() + valid_for}
+        try:
+            write_private_json(path, payload)
+        except OSError as e:
+            logging.debug(f"Could not persist S2S token cache to {path}: {e}")
+
+    def _discard_token(self) -> None:
+        """Forget a rejected token, including its persisted copy, so the next run re-auths."""
+        self._access_token = None
+        self._token_deadline = 0.0
+        path = self._token_cache_file()
+        if path is None:
+            return
+        try:
+            path.unlink(missing_ok=True)
+        except OSError as e:
+            logging.debug(f"Could not remove S2S token cache {path}: {e}")
+
     @staticmethod
     def _derive_token_url(api_base: str) -> str:
         """Infer the OAuth token endpoint from the API base host (Zoom vs ZoomGov)."""
@@ -171,7 +371,16 @@ class ZoomClient:
     @staticmethod
     def encode_uuid(uuid: str) -> str:
         """Double URL-encode UUID for past_meetings endpoints"""
-        return urllib.parse.quote(urllib.parse.quote(uuid, safe=""), safe="")
+        return _double_encode_uuid(uuid)
+
+    @staticmethod
+    def _backoff_delay(backoff_factor: float, attempt: int) -> float:
+        """Exponential backoff (factor * 2**attempt) with +/-50% jitter, capped.
+
+        Jitter keeps concurrent clients that hit the same 429/5xx from retrying in lockstep.
+        """
+        delay = backoff_factor * (1 << attempt) * random.uniform(0.5, 1.5)
+        return min(_MAX_BACKOFF_SEC, delay)
 
     def _make_request(
         self,
@@ -195,8 +404,9 @@ class ZoomClient:
             headers["Content-Type"] = "application/json"
 
         for attempt in range(retry_count):
+            self._limiter.acquire()
             try:
-                response = requests.request(
+                response = self._session.request(
                     method,
                     url,
                     headers=headers,
@@ -205,42 +415,30 @@ class ZoomClient:
                 )
 
                 # Handle rate limiting and server errors with exponential backoff
+                if response.status_code == 429:
+                    self._limiter.fail()
                 if response.status_code in (429, 500, 502, 503, 504):
                     if attempt < retry_count - 1:
                         # For rate limits, use Retry-After header if provided
                         if response.status_code == 429:
-                            wait_time = backoff_factor * (2**attempt)
-                            retry_after_val = None
-                            try:
-                                hdrs = getattr(response, "headers", None)
-                                if hdrs:
-                                    retry_after_val = hdrs.get("Retry-After")
-                            except Exception:
-                                retry_after_val = None
-
-                            if isinstance(retry_after_val, str | bytes):
-                                try:
-                                    s = (
-                                        retry_after_val.decode()
-                                        if isinstance(retry_after_val, bytes)
-                                        else retry_after_val
-                                    ).strip()
-                                    if s.isdigit():
-                                        wait_time = int(s)
-                                except Exception:
-                                    # Ignore parse errors; keep exponential backoff
-                                    pass
+                            retry_after = _retry_after_seconds(response)
+                            wait_time = (
+                                retry_after
+                                if retry_after is not None
+                                else self._backoff_delay(backoff_factor, attempt)
+                            )
                             logging.warning(
-                                f"Rate limit (HTTP 429), retrying in {wait_time}s "
+                                f"Rate limit (HTTP 429), retrying in {wait_time:.1f}s "
                                 f"(attempt {attempt + 1}/{retry_count})"
                             )
                         else:
-                            wait_time = backoff_factor * (2**attempt)
+                            wait_time = self._backoff_delay(backoff_factor, attempt)
                             logging.warning(
                                 f"Server error (HTTP {response.status_code}), "
-                                f"retrying in {wait_time}s (attempt {attempt + 1}/{retry_count})"
+                                f"retrying in {wait_time:.1f}s "
+                                f"(attempt {attempt + 1}/{retry_count})"
                             )
-                        time.sleep(wait_time)
+                        self._sleep(wait_time)
                         continue
                     else:
                         # Max retries exceeded
@@ -259,7 +457,10 @@ class ZoomClient:
                             )
 
                 response.raise_for_status()
-                result: dict[str, Any] = response.json()
+                self._limiter.success()
+                # Zoom always answers in UTF-8 JSON; decoding the bytes directly skips
+                # requests' charset sniffing on large listing pages
+                result: dict[str, Any] = json.loads(response.content)
                 return result
 
             except (
@@ -269,12 +470,12 @@ class ZoomClient:
             ) as e:
                 # Network errors should be retried with exponential backoff
                 if attempt < retry_count - 1:
-                    wait_time = backoff_factor * (2**attempt)
+                    wait_time = self._backoff_delay(backoff_factor, attempt)
                     logging.warning(
                         f"Network error ({type(e).__name__}), "
-                        f"retrying in {wait_time}s (attempt {attempt + 1}/{retry_count}): {e}"
+                        f"retrying in {wait_time:.1f}s (attempt {attempt + 1}/{retry_count}): {e}"
                     )
-                    time.sleep(wait_time)
+                    self._sleep(wait_time)
                     continue
                 else:
                     raise ZoomAPIError(
@@ -295,7 +496,7 @@ class ZoomClient:
 
                 # Raise specific exceptions based on status code
                 if status_code == 401:
-                    self._access_token = None
+                    self._discard_token()
                     raise AuthenticationError(
                         "Authentication failed",
                         details="Check ZOOM_ACCOUNT_ID, ZOOM_CLIENT_ID, and ZOOM_CLIENT_SECRET",
@@ -14,6 +14,7 @@ import requests
 
 from dlzoom.token_store import Tokens
 from dlzoom.token_store import save as save_tokens
+from dlzoom.zoom_client import _double_encode_uuid
 
 
 class ZoomUserClient:
@@ -191,9 +192,7 @@ class ZoomUserClient:
     # Public API (mirror subset used by CLI)
     @staticmethod
     def encode_uuid(uuid: str) -> str:
-        import urllib.parse
-
-        return urllib.parse.quote(urllib.parse.quote(uuid, safe=""), safe="")
+        return _double_encode_uuid(uuid)
 
     def get_meeting_recordings(self, meeting_id: str) -> dict[str, Any]:
         if not str(meeting_id).isdigit():
@@ -1,8 +1,29 @@
-import re
+from collections.abc import Iterable, Mapping
 from pathlib import Path
 
+from dlzoom import cli as cli_mod
+
+ZOOM_S2S_ENV_KEYS = ("ZOOM_ACCOUNT_ID", "ZOOM_CLIENT_ID", "ZOOM_CLIENT_SECRET")
+
+# Resolved once so tests skip the group dispatch; setup_user_cli disables the
+# group's only side effect (.env autoload) anyway.
+DOWNLOAD_CMD = cli_mod.cli.commands["download"]
+
 
 class DummyConfig:
+    __slots__ = (
+        "output_dir",
+        "zoom_account_id",
+        "zoom_client_id",
+        "zoom_client_secret",
+        "tokens_path",
+        "zoom_api_base_url",
+        "zoom_oauth_token_url",
+        "s2s_default_user",
+        "auth_url",
+        "config_dir",
+    )
+
     def __init__(self, output_dir: Path):
         self.output_dir = output_dir
         self.zoom_account_id = None
@@ -20,25 +41,33 @@ class DummyConfig:
 
 
 class DummyUserClient:
+    __slots__ = ("base_url",)
+
     def __init__(self, tokens, tokens_path):
         self.base_url = None
 
 
-def setup_user_cli(monkeypatch, tmp_path: Path) -> None:
-    """Prepare CLI environment to use stubbed user client/config."""
-    monkeypatch.setenv("DLZOOM_NO_DOTENV", "1")
-    monkeypatch.delenv("ZOOM_ACCOUNT_ID", raising=False)
-    monkeypatch.delenv("ZOOM_CLIENT_ID", raising=False)
-    monkeypatch.delenv("ZOOM_CLIENT_SECRET", raising=False)
-
-    monkeypatch.setattr("dlzoom.cli.load_tokens", lambda path: object())
-    monkeypatch.setattr("dlzoom.cli.ZoomUserClient", DummyUserClient)
-    monkeypatch.setattr("dlzoom.cli.Config", lambda *args, **kwargs: DummyConfig(tmp_path))
+def patch_environ(
+    monkeypatch, set_vars: Mapping[str, str], unset: Iterable[str] = ZOOM_S2S_ENV_KEYS
+) -> None:
+    """Unset ``unset`` and set ``set_vars`` in the real environment via monkeypatch."""
+    for key in unset:
+        monkeypatch.delenv(key, raising=False)
+    for key, value in set_vars.items():
+        monkeypatch.setenv(key, value)
 
 
-_ANSI_RE = re.compile(r"\x1b\[[0-9;]*[A-Za-z]")
+def setup_user_cli(
+    monkeypatch, tmp_path: Path, extra_env: Mapping[str, str] | None = None
+) -> DummyConfig:
+    """Prepare CLI environment to use stubbed user client/config.
 
+    Returns the DummyConfig instance the patched ``Config`` hands to the CLI.
+    """
+    patch_environ(monkeypatch, {"DLZOOM_NO_DOTENV": "1", **(extra_env or {})})
 
-def strip_ansi(text: str) -> str:
-    """Utility for tests to assert on CLI output irrespective of color codes."""
-    return _ANSI_RE.sub("", text)
+    monkeypatch.setattr(cli_mod, "load_tokens", lambda path: object())
+    monkeypatch.setattr(cli_mod, "ZoomUserClient", DummyUserClient)
+    cfg = DummyConfig(tmp_path)
+    monkeypatch.setattr(cli_mod, "Config", lambda *args, **kwargs: cfg)
+    return cfg
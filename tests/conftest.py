@@ -0,0 +1,16 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _isolated_user_cache(tmp_path_factory, monkeypatch):
+    """Keep S2S token caching away from the real user cache directory."""
+    cache_dir = tmp_path_factory.mktemp("user_cache")
+    monkeypatch.setattr("dlzoom.config.user_cache_dir", lambda _: str(cache_dir))
+
+
+@pytest.fixture(scope="session")
+def runner():
+    """Shared Click test runner; ``CliRunner.invoke`` keeps no per-call state."""
+    from click.testing import CliRunner
+
+    return CliRunner()
@@ -267,7 +267,8 @@ class TestDownloadFlowIntegration:
             mock_response.status_code = 200
             mock_response.headers = {"content-length": "1024000"}
             mock_response.iter_content = Mock(return_value=[b"test_data"])
-            mock_requests.get = Mock(return_value=mock_response)
+            mock_session = mock_requests.Session.return_value
+            mock_session.get = Mock(return_value=mock_response)
 
             # Execute download
             _handle_download_mode(
@@ -291,9 +292,9 @@ class TestDownloadFlowIntegration:
                 folder_template=None,
             )
 
-            # Verify requests.get was called with token in URL
-            assert mock_requests.get.called
-            call_args = mock_requests.get.call_args
+            # Verify the session GET was called with token in URL
+            assert mock_session.get.called
+            call_args = mock_session.get.call_args
             url_used = call_args[0][0] if call_args[0] else call_args[1].get("url", "")
 
             # The URL should contain the access token as a query parameter
@@ -364,6 +365,9 @@ class TestDownloadFlowIntegration:
                 speaker_path.write_text("{}")
                 return {"vtt": [], "txt": [], "timeline": [], "speakers": [speaker_path]}
 
+            def close(self) -> None:
+                pass
+
         with patch("dlzoom.handlers.Downloader", FakeDownloader):
             _handle_download_mode(
                 client=mock_zoom_client,
@@ -2,14 +2,26 @@ import json
 
 import click
 import pytest
-from click.testing import CliRunner
 
+from dlzoom import cli as cli_mod
 from dlzoom.cli import cli as dlzoom_cli
 from dlzoom.cli import validate_meeting_id
 from dlzoom.exceptions import ConfigError
 from dlzoom.templates import TemplateParser
 
 
+class DummyZoomClient:
+    __slots__ = ("creds", "base_url", "token_url")
+
+    def __init__(self, account_id: str, client_id: str, client_secret: str, **_options):
+        self.creds = (account_id, client_id, client_secret)
+        self.base_url = ""
+        self.token_url = ""
+
+    def close(self) -> None:
+        pass
+
+
 class TestValidateMeetingId:
     def _ctx_param(self):
         ctx = click.Context(click.Command("test"))
@@ -77,6 +89,12 @@ class TestValidateMeetingId:
         with pytest.raises(click.BadParameter, match="path traversal"):
             validate_meeting_id(ctx, param, ".. /etc/passwd")
 
+        # Dots split by whitespace are rejoined by normalization
+        with pytest.raises(click.BadParameter, match="path traversal"):
+            validate_meeting_id(ctx, param, ". ./etc/passwd")
+        with pytest.raises(click.BadParameter, match="path traversal"):
+            validate_meeting_id(ctx, param, ".\t.\x0b/etc/passwd")
+
         # Backslashes (Windows paths)
         with pytest.raises(click.BadParameter, match="path traversal"):
             validate_meeting_id(ctx, param, "..\\windows\\system32")
@@ -121,13 +139,11 @@ class TestOutputNameSanitization:
 
 
 class TestCliConfigErrors:
-    def test_download_json_config_error_uses_invalid_config_code(self, monkeypatch):
-        runner = CliRunner()
-
+    def test_download_json_config_error_uses_invalid_config_code(self, monkeypatch, runner):
         def fake_config(*args, **kwargs):
             raise ConfigError("Missing Zoom credentials", details="set env vars")
 
-        monkeypatch.setattr("dlzoom.cli.Config", fake_config)
+        monkeypatch.setattr(cli_mod, "Config", fake_config)
 
         result = runner.invoke(dlzoom_cli, ["download", "123456789", "--json"])
         assert result.exit_code != 0
@@ -138,17 +154,13 @@ class TestCliConfigErrors:
 
 
 class TestCliUserConfigDiscovery:
-    def test_download_uses_user_config_file(self, tmp_path, monkeypatch):
+    def test_download_uses_user_config_file(self, tmp_path, monkeypatch, runner):
         config_dir = tmp_path / "dlzoom"
         config_dir.mkdir()
         (config_dir / "config.json").write_text(
-            json.dumps(
-                {
-                    "zoom_account_id": "file_account",
-                    "zoom_client_id": "file_client",
-                    "zoom_client_secret": "file_secret",
-                }
-            )
+            '{"zoom_account_id": "file_account", '
+            '"zoom_client_id": "file_client", '
+            '"zoom_client_secret": "file_secret"}'
         )
 
         # Point platformdirs to our temp config dir and clear env vars
@@ -158,23 +170,16 @@ class TestCliUserConfigDiscovery:
 
         captured: dict[str, object] = {}
 
-        class DummyZoomClient:
-            def __init__(self, account_id: str, client_id: str, client_secret: str):
-                captured["creds"] = (account_id, client_id, client_secret)
-                self.base_url = ""
-                self.token_url = ""
-
         def fake_handle_download_mode(**kwargs):
             captured["handled"] = True
             captured["scope"] = kwargs.get("scope")
             captured["client"] = kwargs.get("client")
 
-        monkeypatch.setattr("dlzoom.cli.ZoomClient", DummyZoomClient)
-        monkeypatch.setattr("dlzoom.cli._h._handle_download_mode", fake_handle_download_mode)
-        monkeypatch.setattr("dlzoom.cli.load_tokens", lambda path: None)
+        monkeypatch.setattr(cli_mod, "ZoomClient", DummyZoomClient)
+        monkeypatch.setattr(cli_mod._h, "_handle_download_mode", fake_handle_download_mode)
+        monkeypatch.setattr(cli_mod, "load_tokens", lambda path: None)
         monkeypatch.setenv("DLZOOM_NO_DOTENV", "1")
 
-        runner = CliRunner()
         result = runner.invoke(
             dlzoom_cli,
             [
@@ -188,4 +193,4 @@ class TestCliUserConfigDiscovery:
 
         assert result.exit_code == 0, result.output
         assert captured.get("handled") is True
-        assert captured.get("creds") == ("file_account", "file_client", "file_secret")
+        assert captured["client"].creds == ("file_account", "file_client", "file_secret")
@@ -33,3 +33,18 @@ def test_utc_today_requests_timezone_aware_now(monkeypatch):
 
     assert result == date(2025, 2, 3)
     assert captured["tz"] is cli_mod.timezone.utc
+
+
+def test_calc_range_reuses_supplied_today(monkeypatch):
+    """A precomputed date should be used without consulting the clock again."""
+
+    def fail():
+        raise AssertionError("_utc_today should not be called")
+
+    monkeypatch.setattr(cli_mod, "_utc_today", fail)
+
+    assert cli_mod._calc_range("today", today=date(2025, 3, 1)) == ("2025-03-01", "2025-03-01")
+    assert cli_mod._calc_range("yesterday", today=date(2025, 3, 1)) == (
+        "2025-02-28",
+        "2025-02-28",
+    )
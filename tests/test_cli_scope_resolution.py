@@ -41,3 +41,13 @@ def test_user_tokens_default_to_me():
     ctx = _resolve_scope(use_s2s=False, scope_flag="auto", user_id=None, default_s2s_user=None)
     assert ctx.scope == "user"
     assert ctx.user_id == "me"
+
+
+def test_user_tokens_reject_account_scope():
+    with pytest.raises(ConfigError):
+        _resolve_scope(use_s2s=False, scope_flag="account", user_id=None, default_s2s_user=None)
+
+
+def test_s2s_user_scope_rejects_me():
+    with pytest.raises(ConfigError):
+        _resolve_scope(use_s2s=True, scope_flag="user", user_id="me", default_s2s_user=None)
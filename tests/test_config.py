@@ -38,8 +38,8 @@ def test_config_validation_fails_missing_vars(monkeypatch):
     for key in ["ZOOM_ACCOUNT_ID", "ZOOM_CLIENT_ID", "ZOOM_CLIENT_SECRET"]:
         monkeypatch.delenv(key, raising=False)
 
-    # Pass empty env_file to prevent loading from .env
-    config = Config(env_file=os.devnull)
+    # Skip config files so only the (cleared) environment is consulted
+    config = Config(env_file=False)
     with pytest.raises(ConfigError) as exc_info:
         config.validate()
 
@@ -75,7 +75,7 @@ def test_config_is_valid(monkeypatch):
     for key in ["ZOOM_ACCOUNT_ID", "ZOOM_CLIENT_ID", "ZOOM_CLIENT_SECRET"]:
         monkeypatch.delenv(key, raising=False)
 
-    config = Config(env_file=os.devnull)
+    config = Config(env_file=False)
     assert not config.is_valid()
 
     # Valid config
@@ -83,7 +83,7 @@ def test_config_is_valid(monkeypatch):
     monkeypatch.setenv("ZOOM_CLIENT_ID", "test_client")
     monkeypatch.setenv("ZOOM_CLIENT_SECRET", "test_secret")
 
-    config = Config(env_file=os.devnull)
+    config = Config(env_file=False)
     assert config.is_valid()
 
 
@@ -145,6 +145,13 @@ def test_config_del_zeros_credentials(monkeypatch):
     assert config._zoom_client_secret is None
 
 
+def test_config_del_on_partially_initialized_instance():
+    """__del__ must be a no-op when __init__ never populated the credential slots."""
+    config = Config.__new__(Config)
+    config.__del__()
+    assert not hasattr(config, "_zoom_account_id")
+
+
 def test_yaml_dependency_check_yaml_not_available(tmp_path, monkeypatch):
     """Test that YAML file loading fails gracefully when PyYAML not installed"""
     # Create a YAML config file
@@ -307,7 +314,7 @@ def test_get_auth_mode(tmp_path, monkeypatch):
     monkeypatch.setattr("dlzoom.config.user_config_dir", lambda _: str(config_dir))
 
     # No credentials defaults to "none"
-    cfg = Config(env_file=os.devnull)
+    cfg = Config(env_file=False)
     assert cfg.get_auth_mode() == "none"
 
     # Tokens path present should return oauth
@@ -316,9 +323,131 @@ def test_get_auth_mode(tmp_path, monkeypatch):
     tokens_file.write_text("{}")
     assert cfg.get_auth_mode() == "oauth"
 
+    # Removing the tokens file (logout) is noticed by the same Config
+    tokens_file.unlink()
+    assert cfg.get_auth_mode() == "none"
+
     # S2S credentials should take precedence
     monkeypatch.setenv("ZOOM_ACCOUNT_ID", "acct")
     monkeypatch.setenv("ZOOM_CLIENT_ID", "client")
     monkeypatch.setenv("ZOOM_CLIENT_SECRET", "secret")
-    cfg_with_s2s = Config(env_file=os.devnull)
+    cfg_with_s2s = Config(env_file=False)
     assert cfg_with_s2s.get_auth_mode() == "s2s"
+
+
+def test_config_file_parse_is_cached_until_file_changes(tmp_path, monkeypatch):
+    """Repeated loads of an unchanged config file should reuse the parsed data."""
+    import dlzoom.config
+
+    dlzoom.config._clear_config_cache()
+    config_file = tmp_path / "config.json"
+    config_file.write_text(
+        '{"zoom_account_id": "first", "zoom_client_id": "client", "zoom_client_secret": "secret"}'
+    )
+
+    calls = []
+    real_loads = dlzoom.config._json_loads
+
+    def counting_loads(raw):
+        calls.append(1)
+        return real_loads(raw)
+
+    monkeypatch.setattr(dlzoom.config, "_json_loads", counting_loads)
+
+    assert Config(env_file=str(config_file)).zoom_account_id == "first"
+    assert Config(env_file=str(config_file)).zoom_account_id == "first"
+    assert len(calls) == 1
+
+    config_file.write_text(
+        '{"zoom_account_id": "second", "zoom_client_id": "client", "zoom_client_secret": "secret"}'
+    )
+    os.utime(config_file, ns=(0, config_file.stat().st_mtime_ns + 1_000_000))
+
+    assert Config(env_file=str(config_file)).zoom_account_id == "second"
+    assert len(calls) == 2
+    dlzoom.config._clear_config_cache()
+
+
+def test_config_snapshots_environment_at_construction(monkeypatch):
+    """Later environment changes should not leak into an existing Config."""
+    monkeypatch.setenv("ZOOM_ACCOUNT_ID", "before")
+    monkeypatch.setenv("OUTPUT_DIR", "/tmp/before")
+    config = Config(env_file=False)
+
+    monkeypatch.setenv("ZOOM_ACCOUNT_ID", "after")
+    monkeypatch.setenv("OUTPUT_DIR", "/tmp/after")
+
+    assert config.zoom_account_id == "before"
+    assert config.output_dir == Path("/tmp/before")
+
+
+def test_get_auth_mode_is_memoized_until_credentials_cleared(monkeypatch):
+    """Repeated get_auth_mode() calls reuse the result until credentials change."""
+    monkeypatch.setenv("ZOOM_ACCOUNT_ID", "acct")
+    monkeypatch.setenv("ZOOM_CLIENT_ID", "client")
+    monkeypatch.setenv("ZOOM_CLIENT_SECRET", "secret")
+    cfg = Config(env_file=False)
+
+    assert cfg.get_auth_mode() == "s2s"
+    assert cfg._auth_mode == "s2s"
+
+    cfg.clear_credentials()
+    assert cfg._auth_mode is None
+    assert cfg.get_auth_mode() != "s2s"
+
+
+def test_config_created_after_missing_dir_is_discovered(tmp_path, monkeypatch):
+    """A config dir missing at first is still picked up once it is created."""
+    config_dir = tmp_path / "dlzoom"
+    monkeypatch.setattr("dlzoom.config.user_config_dir", lambda _: str(config_dir))
+    for key in ["ZOOM_ACCOUNT_ID", "ZOOM_CLIENT_ID", "ZOOM_CLIENT_SECRET"]:
+        monkeypatch.delenv(key, raising=False)
+
+    assert Config().zoom_account_id is None
+
+    config_dir.mkdir()
+    (config_dir / "config.json").write_text(
+        '{"zoom_account_id": "late", "zoom_client_id": "c", "zoom_client_secret": "s"}'
+    )
+    assert Config().zoom_account_id == "late"
+
+
+@pytest.mark.parametrize("case_insensitive,found", [(True, True), (False, False)])
+def test_find_default_config_name_case(tmp_path, monkeypatch, case_insensitive, found):
+    """Mixed-case config names are found only where the file system ignores case."""
+    config_dir = tmp_path / "dlzoom"
+    config_dir.mkdir()
+    (config_dir / "Config.JSON").write_text("{}")
+    monkeypatch.setattr("dlzoom.config.user_config_dir", lambda _: str(config_dir))
+    monkeypatch.setattr("dlzoom.config._CASE_INSENSITIVE_FS", case_insensitive)
+
+    cfg = Config(env_file=False)
+    expected = config_dir / "config.json" if found else None
+    assert cfg._find_default_config() == expected
+
+
+def test_config_env_file_false_skips_config_discovery(tmp_path, monkeypatch):
+    """env_file=False must ignore config files in the user config directory."""
+    config_dir = tmp_path / "dlzoom"
+    config_dir.mkdir()
+    (config_dir / "config.json").write_text(
+        '{"zoom_account_id": "file_account", "zoom_client_id": "c", "zoom_client_secret": "s"}'
+    )
+    monkeypatch.setattr("dlzoom.config.user_config_dir", lambda _: str(config_dir))
+    for key in ["ZOOM_ACCOUNT_ID", "ZOOM_CLIENT_ID", "ZOOM_CLIENT_SECRET"]:
+        monkeypatch.delenv(key, raising=False)
+
+    cfg = Config(env_file=False)
+    assert cfg.zoom_account_id is None
+
+
+def test_tokens_path_defaults_under_config_dir(tmp_path, monkeypatch):
+    """tokens_path honors DLZOOM_TOKENS_PATH and otherwise defaults under config_dir."""
+    monkeypatch.setattr("dlzoom.config.user_config_dir", lambda _: str(tmp_path / "dlzoom"))
+    monkeypatch.delenv("DLZOOM_TOKENS_PATH", raising=False)
+    cfg = Config(env_file=False)
+    assert cfg.tokens_path == tmp_path / "dlzoom" / "tokens.json"
+
+    custom = tmp_path / "custom" / "tokens.json"
+    monkeypatch.setenv("DLZOOM_TOKENS_PATH", str(custom))
+    assert Config(env_file=False).tokens_path == custom
@@ -44,3 +44,15 @@ def test_chunk_by_month_invalid_range_raises():
 def test_chunk_by_month_returns_single_chunk_when_missing_dates():
     assert _chunk_by_month(None, None) == [(None, None)]
     assert _chunk_by_month("2024-01-01", None) == [("2024-01-01", None)]
+
+
+def test_chunk_by_month_applies_century_leap_rules():
+    assert _chunk_by_month("1900-02-01", "1900-03-01")[0] == ("1900-02-01", "1900-02-28")
+    assert _chunk_by_month("2000-02-01", "2000-03-01")[0] == ("2000-02-01", "2000-02-29")
+
+
+def test_chunk_by_month_crosses_year_boundary():
+    assert _chunk_by_month("2023-12-15", "2024-01-10") == [
+        ("2023-12-15", "2023-12-31"),
+        ("2024-01-01", "2024-01-10"),
+    ]
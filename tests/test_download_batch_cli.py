@@ -1,12 +1,22 @@
-from click.testing import CliRunner
+import pytest
+import rich_click
 
-from dlzoom.cli import cli as dlzoom_cli
 from dlzoom.exceptions import DownloadFailedError
 
-from .cli_test_utils import setup_user_cli, strip_ansi
+from .cli_test_utils import DOWNLOAD_CMD, setup_user_cli
 
 
-def test_cli_batch_download_success(monkeypatch, tmp_path):
+@pytest.fixture
+def plain_output(monkeypatch):
+    """Disable rich-click styling so usage errors can be matched without ANSI stripping.
+
+    rich-click forces a terminal when FORCE_COLOR/GITHUB_ACTIONS is set, so color=False
+    on invoke alone is not enough in CI.
+    """
+    monkeypatch.setattr(rich_click.rich_click, "COLOR_SYSTEM", None)
+
+
+def test_cli_batch_download_success(monkeypatch, tmp_path, runner):
     setup_user_cli(monkeypatch, tmp_path)
 
     called = {}
@@ -16,11 +26,9 @@ def test_cli_batch_download_success(monkeypatch, tmp_path):
 
     monkeypatch.setattr("dlzoom.cli._h._handle_batch_download", fake_batch_download)
 
-    runner = CliRunner()
     result = runner.invoke(
-        dlzoom_cli,
+        DOWNLOAD_CMD,
         [
-            "download",
             "--from-date",
             "2024-01-01",
             "--to-date",
@@ -35,7 +43,7 @@ def test_cli_batch_download_success(monkeypatch, tmp_path):
     assert called["scope"] == "user"
 
 
-def test_cli_batch_download_passes_page_size(monkeypatch, tmp_path):
+def test_cli_batch_download_passes_page_size(monkeypatch, tmp_path, runner):
     setup_user_cli(monkeypatch, tmp_path)
 
     captured = {}
@@ -45,11 +53,9 @@ def test_cli_batch_download_passes_page_size(monkeypatch, tmp_path):
 
     monkeypatch.setattr("dlzoom.cli._h._handle_batch_download", fake_batch_download)
 
-    runner = CliRunner()
     result = runner.invoke(
-        dlzoom_cli,
+        DOWNLOAD_CMD,
         [
-            "download",
             "--from-date",
             "2024-01-01",
             "--to-date",
@@ -66,7 +72,7 @@ def test_cli_batch_download_passes_page_size(monkeypatch, tmp_path):
     assert captured["page_size"] == 42
 
 
-def test_cli_batch_download_failure(monkeypatch, tmp_path):
+def test_cli_batch_download_failure(monkeypatch, tmp_path, runner):
     setup_user_cli(monkeypatch, tmp_path)
 
     def fake_batch_download(**kwargs):
@@ -74,11 +80,9 @@ def test_cli_batch_download_failure(monkeypatch, tmp_path):
 
     monkeypatch.setattr("dlzoom.cli._h._handle_batch_download", fake_batch_download)
 
-    runner = CliRunner()
     result = runner.invoke(
-        dlzoom_cli,
+        DOWNLOAD_CMD,
         [
-            "download",
             "--from-date",
             "2024-01-01",
             "--to-date",
@@ -93,7 +97,7 @@ def test_cli_batch_download_failure(monkeypatch, tmp_path):
     assert "DOWNLOAD_FAILED" in result.output
 
 
-def test_cli_batch_check_availability_passes_page_size(monkeypatch, tmp_path):
+def test_cli_batch_check_availability_passes_page_size(monkeypatch, tmp_path, runner):
     setup_user_cli(monkeypatch, tmp_path)
 
     captured = {}
@@ -103,11 +107,9 @@ def test_cli_batch_check_availability_passes_page_size(monkeypatch, tmp_path):
 
     monkeypatch.setattr("dlzoom.cli._h._handle_batch_check_availability", fake_batch_check)
 
-    runner = CliRunner()
     result = runner.invoke(
-        dlzoom_cli,
+        DOWNLOAD_CMD,
         [
-            "download",
             "--from-date",
             "2024-01-01",
             "--to-date",
@@ -125,42 +127,41 @@ def test_cli_batch_check_availability_passes_page_size(monkeypatch, tmp_path):
     assert captured["page_size"] == 12
 
 
-def test_cli_download_requires_meeting_id_without_dates(monkeypatch, tmp_path):
+def test_cli_download_requires_meeting_id_without_dates(
+    monkeypatch, tmp_path, runner, plain_output
+):
     setup_user_cli(monkeypatch, tmp_path)
-    runner = CliRunner()
-    result = runner.invoke(dlzoom_cli, ["download"])
+    result = runner.invoke(DOWNLOAD_CMD, [], color=False)
     assert result.exit_code != 0
-    assert "MEETING_ID argument is required" in strip_ansi(result.output)
+    assert "MEETING_ID argument is required" in result.output
 
 
-def test_cli_download_requires_both_dates(monkeypatch, tmp_path):
+def test_cli_download_requires_both_dates(monkeypatch, tmp_path, runner, plain_output):
     setup_user_cli(monkeypatch, tmp_path)
-    runner = CliRunner()
     result = runner.invoke(
-        dlzoom_cli,
+        DOWNLOAD_CMD,
         [
-            "download",
             "--from-date",
             "2024-01-01",
         ],
+        color=False,
     )
     assert result.exit_code != 0
-    assert "Both --from-date and --to-date must be provided together" in strip_ansi(result.output)
+    assert "Both --from-date and --to-date must be provided together" in result.output
 
 
-def test_cli_download_rejects_meeting_id_with_dates(monkeypatch, tmp_path):
+def test_cli_download_rejects_meeting_id_with_dates(monkeypatch, tmp_path, runner, plain_output):
     setup_user_cli(monkeypatch, tmp_path)
-    runner = CliRunner()
     result = runner.invoke(
-        dlzoom_cli,
+        DOWNLOAD_CMD,
         [
-            "download",
             "123456789",
             "--from-date",
             "2024-01-01",
             "--to-date",
             "2024-01-02",
         ],
+        color=False,
     )
     assert result.exit_code != 0
-    assert "cannot be used together with --from-date/--to-date" in strip_ansi(result.output)
+    assert "cannot be used together with --from-date/--to-date" in result.output
@@ -1,12 +1,9 @@
-from click.testing import CliRunner
-
-from dlzoom.cli import cli as dlzoom_cli
 from dlzoom.exceptions import RecordingNotFoundError
 
-from .cli_test_utils import setup_user_cli
+from .cli_test_utils import DOWNLOAD_CMD, setup_user_cli
 
 
-def test_cli_check_availability_success(monkeypatch, tmp_path):
+def test_cli_check_availability_success(monkeypatch, tmp_path, runner):
     setup_user_cli(monkeypatch, tmp_path)
 
     calls = {}
@@ -16,13 +13,12 @@ def test_cli_check_availability_success(monkeypatch, tmp_path):
 
     monkeypatch.setattr("dlzoom.cli._h._handle_check_availability", fake_handle)
 
-    runner = CliRunner()
-    result = runner.invoke(dlzoom_cli, ["download", "123456789", "--check-availability"])
+    result = runner.invoke(DOWNLOAD_CMD, ["123456789", "--check-availability"])
     assert result.exit_code == 0, result.output
     assert calls["meeting_id"] == "123456789"
 
 
-def test_cli_check_availability_failure(monkeypatch, tmp_path):
+def test_cli_check_availability_failure(monkeypatch, tmp_path, runner):
     setup_user_cli(monkeypatch, tmp_path)
 
     def fake_handle(*args, **kwargs):
@@ -30,7 +26,6 @@ def test_cli_check_availability_failure(monkeypatch, tmp_path):
 
     monkeypatch.setattr("dlzoom.cli._h._handle_check_availability", fake_handle)
 
-    runner = CliRunner()
-    result = runner.invoke(dlzoom_cli, ["download", "123456789", "--check-availability"])
+    result = runner.invoke(DOWNLOAD_CMD, ["123456789", "--check-availability"])
     assert result.exit_code != 0
     assert "RECORDING_NOT_FOUND" in result.output
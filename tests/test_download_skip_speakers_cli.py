@@ -1,11 +1,7 @@
-from click.testing import CliRunner
+from .cli_test_utils import DOWNLOAD_CMD, setup_user_cli
 
-from dlzoom.cli import cli as dlzoom_cli
 
-from .cli_test_utils import setup_user_cli
-
-
-def test_cli_download_passes_skip_speakers_none_by_default(monkeypatch, tmp_path):
+def test_cli_download_passes_skip_speakers_none_by_default(monkeypatch, tmp_path, runner):
     setup_user_cli(monkeypatch, tmp_path)
 
     observed = {}
@@ -15,13 +11,12 @@ def test_cli_download_passes_skip_speakers_none_by_default(monkeypatch, tmp_path
 
     monkeypatch.setattr("dlzoom.cli._h._handle_download_mode", fake_handle_download_mode)
 
-    runner = CliRunner()
-    result = runner.invoke(dlzoom_cli, ["download", "123456789"])
+    result = runner.invoke(DOWNLOAD_CMD, ["123456789"])
     assert result.exit_code == 0, result.output
     assert observed["skip_speakers"] is None
 
 
-def test_cli_download_honors_skip_speakers_flag(monkeypatch, tmp_path):
+def test_cli_download_honors_skip_speakers_flag(monkeypatch, tmp_path, runner):
     setup_user_cli(monkeypatch, tmp_path)
 
     observed = {}
@@ -31,7 +26,6 @@ def test_cli_download_honors_skip_speakers_flag(monkeypatch, tmp_path):
 
     monkeypatch.setattr("dlzoom.cli._h._handle_download_mode", fake_handle_download_mode)
 
-    runner = CliRunner()
-    result = runner.invoke(dlzoom_cli, ["download", "123456789", "--skip-speakers"])
+    result = runner.invoke(DOWNLOAD_CMD, ["123456789", "--skip-speakers"])
     assert result.exit_code == 0, result.output
     assert observed["skip_speakers"] is True
@@ -3,84 +3,87 @@ Tests for Downloader robustness: atomic operations, disk space, size validation
 """
 
 import os
-import shutil
+import time
+from pathlib import Path
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
-from dlzoom.downloader import Downloader
+from dlzoom.downloader import Downloader, _tolerance
 from dlzoom.exceptions import DiskSpaceError
 
 
+@pytest.fixture
+def downloader(tmp_path):
+    return Downloader(output_dir=tmp_path, access_token="test_token")
+
+
 class TestDiskSpaceCheck:
     """Test disk space validation"""
 
-    def test_check_disk_space_sufficient(self, tmp_path):
+    def test_check_disk_space_sufficient(self, downloader):
         """Should pass when sufficient disk space available"""
-        downloader = Downloader(output_dir=tmp_path, access_token="test_token")
-
         # Request 1 MB (should be available on any system)
         result = downloader.check_disk_space(1024 * 1024)
         assert result is True
 
-    @patch("shutil.disk_usage")
-    def test_check_disk_space_insufficient(self, mock_disk_usage, tmp_path):
+    def test_check_disk_space_insufficient(self, monkeypatch, downloader):
         """Should raise DiskSpaceError when insufficient space"""
-        # Mock 50 MB available
-        mock_disk_usage.return_value = Mock(free=50 * 1024 * 1024)
-
-        downloader = Downloader(output_dir=tmp_path, access_token="test_token")
+        # Pretend 50 MB available
+        monkeypatch.setattr(downloader, "_free_cache", (time.monotonic(), 50 * 1024 * 1024))
 
         # Request 1 GB (with 100 MB buffer = 1.1 GB total needed)
         with pytest.raises(DiskSpaceError, match="Insufficient disk space"):
             downloader.check_disk_space(1024 * 1024 * 1024)
 
-    @patch("shutil.disk_usage")
-    def test_check_disk_space_includes_buffer(self, mock_disk_usage, tmp_path):
+    def test_check_disk_space_includes_buffer(self, monkeypatch, downloader):
         """Should include 100 MB buffer in calculation"""
-        # Mock exactly 200 MB available
-        mock_disk_usage.return_value = Mock(free=200 * 1024 * 1024)
-
-        downloader = Downloader(output_dir=tmp_path, access_token="test_token")
+        # Pretend exactly 200 MB available
+        monkeypatch.setattr(downloader, "_free_cache", (time.monotonic(), 200 * 1024 * 1024))
 
         # Request 150 MB (with 100 MB buffer = 250 MB needed, but only 200 MB available)
         with pytest.raises(DiskSpaceError):
             downloader.check_disk_space(150 * 1024 * 1024)
 
     @patch("shutil.disk_usage")
-    def test_check_disk_space_oserror_proceeds(self, mock_disk_usage, tmp_path):
+    def test_check_disk_space_oserror_proceeds(self, mock_disk_usage, downloader):
         """Should proceed optimistically if disk_usage fails"""
         mock_disk_usage.side_effect = OSError("Permission denied")
 
-        downloader = Downloader(output_dir=tmp_path, access_token="test_token")
-
         # Should return True and log warning instead of failing
         result = downloader.check_disk_space(1024 * 1024 * 1024)
         assert result is True
 
+    @patch("shutil.disk_usage")
+    def test_check_disk_space_reuses_recent_reading(self, mock_disk_usage, downloader):
+        """Should stat the disk once for back-to-back checks"""
+        mock_disk_usage.return_value = Mock(free=10 * 1024 * 1024 * 1024)
+
+        assert downloader.check_disk_space(1024 * 1024) is True
+        assert downloader.check_disk_space(1024 * 1024) is True
+        mock_disk_usage.assert_called_once()
+
 
 class TestENOSPCHandling:
     """Test ENOSPC (disk full) error handling during writes"""
 
-    @patch("builtins.open")
-    @patch("requests.get")
-    def test_enospc_during_download_with_progress(self, mock_get, mock_open, tmp_path):
+    @patch("dlzoom.downloader.os.write")
+    @patch("requests.Session.get")
+    def test_enospc_during_download_with_progress(self, mock_get, mock_write, downloader, tmp_path):
         """Should raise DiskSpaceError when ENOSPC occurs during download"""
         # Mock response
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.headers = {"content-length": "1000"}
-        mock_response.iter_content = lambda chunk_size: [b"chunk1", b"chunk2"]
+        mock_response.iter_content = MagicMock(
+            side_effect=lambda chunk_size: [b"chunk1", b"chunk2"]
+        )
         mock_response.__enter__ = Mock(return_value=mock_response)
         mock_response.__exit__ = Mock(return_value=False)
         mock_get.return_value = mock_response
 
-        # Mock file write to raise ENOSPC
-        mock_file = MagicMock()
-        mock_file.write.side_effect = OSError(28, "No space left on device")
-        mock_open.return_value.__enter__.return_value = mock_file
-
-        downloader = Downloader(output_dir=tmp_path, access_token="test_token")
+        # Mock raw write to raise ENOSPC
+        mock_write.side_effect = OSError(28, "No space left on device")
 
         with pytest.raises(DiskSpaceError, match="Disk full"):
             downloader._download_with_progress(
@@ -89,26 +92,23 @@ class TestENOSPCHandling:
                 total_size=1000,
                 filename="test.mp4",
             )
+        mock_response.iter_content.assert_called_with(chunk_size=1048576)
 
-    @patch("builtins.open")
-    @patch("requests.get")
-    def test_other_oserror_reraises(self, mock_get, mock_open, tmp_path):
+    @patch("dlzoom.downloader.os.write")
+    @patch("requests.Session.get")
+    def test_other_oserror_reraises(self, mock_get, mock_write, downloader, tmp_path):
         """Should re-raise other OSErrors (not ENOSPC)"""
         # Mock response
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.headers = {"content-length": "1000"}
-        mock_response.iter_content = lambda chunk_size: [b"chunk1"]
+        mock_response.iter_content = MagicMock(side_effect=lambda chunk_size: [b"chunk1"])
         mock_response.__enter__ = Mock(return_value=mock_response)
         mock_response.__exit__ = Mock(return_value=False)
         mock_get.return_value = mock_response
 
-        # Mock file write to raise different OSError
-        mock_file = MagicMock()
-        mock_file.write.side_effect = OSError(13, "Permission denied")
-        mock_open.return_value.__enter__.return_value = mock_file
-
-        downloader = Downloader(output_dir=tmp_path, access_token="test_token")
+        # Mock raw write to raise different OSError
+        mock_write.side_effect = OSError(13, "Permission denied")
 
         # Should raise original OSError, not DiskSpaceError
         with pytest.raises(OSError, match="Permission denied"):
@@ -118,139 +118,114 @@ class TestENOSPCHandling:
                 total_size=1000,
                 filename="test.mp4",
             )
+        mock_response.iter_content.assert_called_with(chunk_size=1048576)
 
 
-class TestAtomicFileOperations:
-    """Test atomic file operations with os.replace() and fallback"""
+class TestStreamWrites:
+    """Test raw fd writes for fresh and resumed downloads"""
 
-    @patch("os.replace")
-    @patch("shutil.move")
-    def test_atomic_replace_success(self, mock_move, mock_replace, tmp_path):
-        """Should use os.replace() for atomic move (POSIX)"""
-        # Create real temp file
-        temp_file = tmp_path / ".tmp.test.mp4"
-        temp_file.write_text("test content")
+    def test_write_modes_truncate_and_append(self, downloader, tmp_path):
+        """'wb' should replace existing bytes, 'ab' should append to them"""
+        target = tmp_path / "partial.mp4"
+        target.write_bytes(b"stale")
+        response = Mock()
+        response.iter_content = Mock(return_value=[b"abc", b"", b"def"])
 
-        final_file = tmp_path / "test.mp4"
+        downloader._download_without_progress(response, target, "wb")
+        assert target.read_bytes() == b"abcdef"
 
-        Downloader(output_dir=tmp_path, access_token="test_token")
+        downloader._download_without_progress(response, target, "ab")
+        assert target.read_bytes() == b"abcdefabcdef"
 
-        # Mock successful os.replace
-        mock_replace.return_value = None
+    @pytest.mark.skipif(os.name != "posix", reason="POSIX permission bits")
+    def test_new_files_follow_umask(self, downloader, tmp_path):
+        """Fresh downloads get 0o666 & ~umask, like files created with open()"""
+        target = tmp_path / "shared.mp4"
+        response = Mock()
+        response.iter_content = Mock(return_value=[b"abc"])
 
-        # Simulate the atomic move code
+        old_umask = os.umask(0o002)
         try:
-            os.replace(str(temp_file), str(final_file))
-        except OSError:
-            shutil.move(str(temp_file), str(final_file))
+            downloader._download_without_progress(response, target, "wb")
+        finally:
+            os.umask(old_umask)
+        assert target.stat().st_mode & 0o777 == 0o664
 
-        # Should call os.replace, not shutil.move
-        mock_replace.assert_called_once()
-        mock_move.assert_not_called()
 
-    @patch("os.replace")
-    @patch("shutil.move")
-    def test_atomic_replace_fallback(self, mock_move, mock_replace, tmp_path):
-        """Should fallback to shutil.move() if os.replace() fails"""
-        temp_file = tmp_path / ".tmp.test.mp4"
-        final_file = tmp_path / "test.mp4"
+class TestSessionLifecycle:
+    """Test release of the pooled download session"""
 
-        # Mock os.replace failure (cross-filesystem)
-        mock_replace.side_effect = OSError("Cross-device link")
-        mock_move.return_value = None
+    def test_context_manager_closes_session(self, tmp_path):
+        """Leaving the with-block should close the keep-alive session"""
+        with Downloader(output_dir=tmp_path, access_token="token") as downloader:
+            downloader._session = Mock()
+        downloader._session.close.assert_called_once_with()
 
-        Downloader(output_dir=tmp_path, access_token="test_token")
 
-        # Simulate the fallback code
-        try:
-            os.replace(str(temp_file), str(final_file))
-        except OSError:
-            shutil.move(str(temp_file), str(final_file))
+class TestAtomicFileOperations:
+    """Test atomic file operations with os.replace()"""
+
+    @staticmethod
+    def _ok_response(body: bytes) -> Mock:
+        response = Mock()
+        response.status_code = 200
+        response.headers = {"content-length": str(len(body))}
+        response.iter_content = Mock(return_value=[body])
+        return response
+
+    @patch("requests.Session.get")
+    def test_atomic_replace_success(self, mock_get, downloader, tmp_path):
+        """Should publish the finished file with a single os.replace()"""
+        mock_get.return_value = self._ok_response(b"test content")
+        file_info = {"file_type": "MP4", "file_extension": "MP4", "id": "rec1"}
+
+        with patch("dlzoom.downloader.os.replace", wraps=os.replace) as mock_replace:
+            path = downloader.download_file(
+                "https://zoom.us/rec/download/abc", file_info, "Topic", show_progress=False
+            )
 
-        # Should call both os.replace (fails) and shutil.move (succeeds)
         mock_replace.assert_called_once()
-        mock_move.assert_called_once()
+        assert path.read_bytes() == b"test content"
+        assert list(tmp_path.glob("*.tmp")) == []
+
+    @patch("requests.Session.get")
+    def test_temp_file_colocated_with_output(self, mock_get, downloader):
+        """Temp file must share the output directory so os.replace() never hits EXDEV"""
+        mock_get.return_value = self._ok_response(b"data")
+        file_info = {"file_type": "MP4", "file_extension": "MP4", "id": "rec2"}
+
+        with patch("dlzoom.downloader.os.replace", wraps=os.replace) as mock_replace:
+            downloader.download_file(
+                "https://zoom.us/rec/download/def", file_info, "Topic", show_progress=False
+            )
+
+        src, dst = (Path(arg) for arg in mock_replace.call_args[0])
+        assert src.parent == dst.parent
 
 
 class TestAdaptiveSizeValidation:
     """Test adaptive size validation with 2% and 5% tolerances"""
 
-    def test_size_validation_small_file_within_tolerance(self, tmp_path):
-        """Small file (<10MB) within 2% tolerance should pass"""
-        Downloader(output_dir=tmp_path, access_token="test_token")
-
-        # 5 MB file, 1% difference = 51.2 KB (within 2%)
-        expected_size = 5 * 1024 * 1024  # 5 MB
-        actual_size = expected_size + 51_200  # 1% larger
-
-        size_diff = abs(actual_size - expected_size)
-        size_diff_pct = size_diff / expected_size
-        tolerance = 0.02 if expected_size < 10_000_000 else 0.05
-
-        assert size_diff_pct < tolerance
-
-    def test_size_validation_small_file_exceeds_tolerance(self, tmp_path):
-        """Small file (<10MB) exceeding 2% tolerance should warn"""
-        Downloader(output_dir=tmp_path, access_token="test_token")
-
-        # 5 MB file, 3% difference (exceeds 2% tolerance)
-        expected_size = 5 * 1024 * 1024  # 5 MB
-        actual_size = int(expected_size * 1.03)  # 3% larger
-
-        size_diff = abs(actual_size - expected_size)
-        size_diff_pct = size_diff / expected_size
-        tolerance = 0.02 if expected_size < 10_000_000 else 0.05
-
-        assert size_diff_pct > tolerance
-
-    def test_size_validation_large_file_within_tolerance(self, tmp_path):
-        """Large file (>=10MB) within 5% tolerance should pass"""
-        Downloader(output_dir=tmp_path, access_token="test_token")
-
-        # 50 MB file, 4% difference = 2 MB (within 5%)
-        expected_size = 50 * 1024 * 1024  # 50 MB
-        actual_size = int(expected_size * 1.04)  # 4% larger
-
-        size_diff = abs(actual_size - expected_size)
-        size_diff_pct = size_diff / expected_size
-        tolerance = 0.02 if expected_size < 10_000_000 else 0.05
-
-        assert size_diff_pct < tolerance
-
-    def test_size_validation_large_file_exceeds_tolerance(self, tmp_path):
-        """Large file (>=10MB) exceeding 5% tolerance should warn"""
-        Downloader(output_dir=tmp_path, access_token="test_token")
-
-        # 50 MB file, 6% difference (exceeds 5% tolerance)
-        expected_size = 50 * 1024 * 1024  # 50 MB
-        actual_size = int(expected_size * 1.06)  # 6% larger
-
-        size_diff = abs(actual_size - expected_size)
-        size_diff_pct = size_diff / expected_size
-        tolerance = 0.02 if expected_size < 10_000_000 else 0.05
-
-        assert size_diff_pct > tolerance
-
-    def test_size_validation_boundary_10mb(self, tmp_path):
+    @pytest.mark.parametrize(
+        "expected_size,factor,within",
+        [
+            (5 * 1024 * 1024, 1.01, True),  # small file, 1% drift
+            (5 * 1024 * 1024, 1.03, False),  # small file, 3% drift
+            (50 * 1024 * 1024, 1.04, True),  # large file, 4% drift
+            (50 * 1024 * 1024, 1.06, False),  # large file, 6% drift
+        ],
+    )
+    def test_size_validation(self, expected_size, factor, within):
+        """2% tolerance below 10 MB, 5% at or above"""
+        actual_size = int(expected_size * factor)
+        size_diff_pct = abs(actual_size - expected_size) / expected_size
+        assert (size_diff_pct <= _tolerance(expected_size)) is within
+
+    def test_size_validation_boundary_10mb(self):
         """Test boundary at exactly 10 MB"""
-        Downloader(output_dir=tmp_path, access_token="test_token")
-
-        # File at exactly 10 MB threshold
-        expected_size_below = 10_000_000 - 1  # Just under 10 MB
-        expected_size_at = 10_000_000  # Exactly 10 MB
-        expected_size_above = 10_000_000 + 1  # Just over 10 MB
-
-        # Below threshold: 2% tolerance
-        tolerance_below = 0.02 if expected_size_below < 10_000_000 else 0.05
-        assert tolerance_below == 0.02
-
-        # At threshold: 5% tolerance
-        tolerance_at = 0.02 if expected_size_at < 10_000_000 else 0.05
-        assert tolerance_at == 0.05
-
-        # Above threshold: 5% tolerance
-        tolerance_above = 0.02 if expected_size_above < 10_000_000 else 0.05
-        assert tolerance_above == 0.05
+        assert _tolerance(10_000_000 - 1) == 0.02
+        assert _tolerance(10_000_000) == 0.05
+        assert _tolerance(10_000_000 + 1) == 0.05
 
 
 class TestFilenameGeneration:
@@ -277,10 +252,16 @@ class TestFilenameGeneration:
         filename = downloader.generate_filename(file_info, "Topic")
         assert filename == "session_transcript_en_US.vtt"
 
-    def test_generate_filename_sanitizes_topic(self, tmp_path):
-        """Should sanitize meeting topic for filename"""
-        downloader = Downloader(output_dir=tmp_path, access_token="test_token")
+    def test_generate_filename_includes_instance_start(self, downloader):
+        """Should append a filename-safe instance timestamp"""
+        file_info = {"file_type": "audio_only", "file_extension": "M4A", "id": "rec123"}
+
+        filename = downloader.generate_filename(file_info, "Standup", "2025-01-03T10:00:00.000Z")
 
+        assert filename == "Standup_2025-01-03_10-00-00_audio_only_rec123.m4a"
+
+    def test_generate_filename_sanitizes_topic(self, downloader):
+        """Should sanitize meeting topic for filename"""
         file_info = {"file_type": "audio_only", "file_extension": "M4A", "id": "rec123"}
 
         # Meeting topic with special characters
@@ -342,6 +323,70 @@ class TestTranscriptDownloadLists:
         assert len(vtts) == 2
         assert vtts[0] != vtts[1]
 
+    @patch("requests.Session.get")
+    def test_download_transcripts_same_name_downloads_once(self, mock_get, tmp_path):
+        """Transcripts sharing a target filename are fetched once, then skipped"""
+        downloader = Downloader(output_dir=tmp_path, access_token="token", output_name="session")
+        body = b"WEBVTT\n"
+        response = Mock()
+        response.status_code = 200
+        response.headers = {"content-length": str(len(body))}
+        response.iter_content = Mock(return_value=[body])
+        mock_get.return_value = response
+        # No id and the same file_type, so both map to one output path
+        vtt = {"file_extension": "VTT", "file_type": "TRANSCRIPT", "file_size": len(body)}
+
+        files = downloader.download_transcripts_and_chat(
+            recording_files=[
+                {**vtt, "download_url": "https://zoom.us/rec/vtt1"},
+                {**vtt, "download_url": "https://zoom.us/rec/vtt2"},
+            ],
+            meeting_topic="Topic",
+            instance_start=None,
+            show_progress=False,
+            skip_chat=True,
+            skip_timeline=True,
+        )
+
+        assert mock_get.call_count == 1
+        assert files["vtt"][0] == files["vtt"][1]
+        assert files["vtt"][0].read_bytes() == body
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_download_sidecars_in_api_order(self, monkeypatch, tmp_path):
+        """Sidecars download in the API's file order, not grouped by kind"""
+        downloader = Downloader(output_dir=tmp_path, access_token="token", output_name="session")
+        fetched: list[str] = []
+
+        def fake_download(self, download_url, file_info, *args, **kwargs):
+            fetched.append(download_url)
+            path = tmp_path / download_url.rsplit("/", 1)[-1]
+            path.write_text("dummy")
+            return path
+
+        monkeypatch.setattr(Downloader, "download_file", fake_download)
+
+        files = downloader.download_transcripts_and_chat(
+            recording_files=[
+                {"file_extension": "TXT", "download_url": "https://zoom.us/rec/chat"},
+                {
+                    "file_extension": "JSON",
+                    "file_type": "TIMELINE",
+                    "download_url": "https://zoom.us/rec/timeline",
+                },
+                {"file_extension": "VTT", "download_url": "https://zoom.us/rec/vtt"},
+            ],
+            meeting_topic="Topic",
+            instance_start=None,
+            show_progress=False,
+            skip_speakers=True,
+        )
+
+        assert [url.rsplit("/", 1)[-1] for url in fetched] == ["chat", "timeline", "vtt"]
+        assert [p.name for p in files["vtt"]] == ["vtt"]
+        assert [p.name for p in files["txt"]] == ["chat"]
+        assert [p.name for p in files["timeline"]] == ["timeline"]
+
     def test_download_transcripts_skips_non_timeline_json(self, monkeypatch, tmp_path):
         downloader = Downloader(output_dir=tmp_path, access_token="token", output_name="session")
 
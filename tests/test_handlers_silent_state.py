@@ -1,24 +1,34 @@
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any
+
 from dlzoom.handlers import _handle_check_availability
 from dlzoom.output import OutputFormatter
 from dlzoom.recorder_selector import RecordingSelector
 
 
+# Shared, read-only payload; a handler that mutated it would raise TypeError
+_FAKE_RECORDINGS: Mapping[str, Any] = MappingProxyType(
+    {
+        "meetings": [
+            {
+                "uuid": "uuid-123",
+                "recording_files": [
+                    {
+                        "status": "completed",
+                        "file_extension": "M4A",
+                        "file_type": "audio_only",
+                    }
+                ],
+            }
+        ]
+    }
+)
+
+
 class _DummyClient:
-    def get_meeting_recordings(self, meeting_id: str) -> dict:
-        return {
-            "meetings": [
-                {
-                    "uuid": "uuid-123",
-                    "recording_files": [
-                        {
-                            "status": "completed",
-                            "file_extension": "M4A",
-                            "file_type": "audio_only",
-                        }
-                    ],
-                }
-            ]
-        }
+    def get_meeting_recordings(self, meeting_id: str) -> Mapping[str, Any]:
+        return _FAKE_RECORDINGS
 
 
 def test_check_availability_restores_formatter_state():
@@ -2,32 +2,36 @@
 Unit tests for recorder selector module
 """
 
+from types import MappingProxyType
+
 import pytest
 
 from dlzoom.recorder_selector import RecordingSelector
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def selector():
+    # RecordingSelector holds no per-call state, so one instance serves the module
     return RecordingSelector()
 
 
-@pytest.fixture
+# Session-scoped samples are frozen so a test that mutated them would fail loudly
+@pytest.fixture(scope="session")
 def sample_recording_files():
-    return [
-        {"file_type": "audio_only", "file_extension": "M4A"},
-        {"file_type": "MP4", "file_extension": "MP4"},
-        {"file_type": "chat_file", "file_extension": "TXT"},
-    ]
+    return (
+        MappingProxyType({"file_type": "audio_only", "file_extension": "M4A"}),
+        MappingProxyType({"file_type": "MP4", "file_extension": "MP4"}),
+        MappingProxyType({"file_type": "chat_file", "file_extension": "TXT"}),
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_instances():
-    return [
-        {"uuid": "abc123", "start_time": "2025-01-01T10:00:00Z"},
-        {"uuid": "def456", "start_time": "2025-01-02T10:00:00Z"},
-        {"uuid": "ghi789", "start_time": "2025-01-03T10:00:00Z"},
-    ]
+    return (
+        MappingProxyType({"uuid": "abc123", "start_time": "2025-01-01T10:00:00Z"}),
+        MappingProxyType({"uuid": "def456", "start_time": "2025-01-02T10:00:00Z"}),
+        MappingProxyType({"uuid": "ghi789", "start_time": "2025-01-03T10:00:00Z"}),
+    )
 
 
 def test_select_best_audio_m4a_audio_only(selector, sample_recording_files):
@@ -47,6 +51,17 @@ def test_select_best_audio_m4a_fallback(selector):
     assert result["file_extension"] == "M4A"
 
 
+def test_select_best_audio_prefers_audio_only_listed_last(selector):
+    """Test that a later audio_only file still beats earlier M4A/MP4 files"""
+    files = [
+        {"file_type": "MP4", "file_extension": "MP4"},
+        {"file_type": "recording", "file_extension": "M4A"},
+        {"file_type": "audio_only", "file_extension": "M4A", "id": "audio"},
+    ]
+    result = selector.select_best_audio(files)
+    assert result["id"] == "audio"
+
+
 def test_select_best_audio_mp4_fallback(selector):
     """Test that MP4 is used as last resort"""
     files = [
@@ -72,6 +87,18 @@ def test_select_most_recent_instance(selector, sample_instances):
     assert result["uuid"] == "ghi789"  # 2025-01-03
 
 
+def test_select_most_recent_instance_lex_sort(selector):
+    """Test that ISO timestamps pick the latest regardless of input order"""
+    instances = [
+        {"uuid": "b", "start_time": "2025-01-10T09:00:00Z"},
+        {"uuid": "c", "start_time": "2024-12-31T23:59:59Z"},
+        {"uuid": "missing"},
+        {"uuid": "a", "start_time": "2025-01-10T10:00:00Z"},
+    ]
+    result = selector.select_most_recent_instance(instances)
+    assert result["uuid"] == "a"
+
+
 def test_select_most_recent_instance_empty(selector):
     """Test that None is returned for empty list"""
     result = selector.select_most_recent_instance([])
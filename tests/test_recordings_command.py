@@ -1,14 +1,97 @@
 import json
+from datetime import UTC, datetime
+from types import MappingProxyType
 
-from click.testing import CliRunner
+import pytest
+import requests
 
 from dlzoom.cli import cli as dlzoom_cli
+from dlzoom.handlers import json_dumps
+from dlzoom.zoom_user_client import ZoomUserAPIError
 
+from .cli_test_utils import ZOOM_S2S_ENV_KEYS
 
-def _prep_user_tokens(monkeypatch, tmp_path):
-    tokens_file = tmp_path / "tokens.json"
-    tokens_file.write_text("{}")
-    monkeypatch.setenv("DLZOOM_TOKENS_PATH", str(tokens_file))
+# Invoke the subcommand directly; the group callback only autoloads .env, which
+# these tests disable via DLZOOM_NO_DOTENV anyway.
+_RECORDINGS_CMD = dlzoom_cli.commands["recordings"]
+
+
+@pytest.fixture(autouse=True)
+def _clean_zoom_env(monkeypatch):
+    """Disable .env autoload and start every test without S2S credentials."""
+    monkeypatch.setenv("DLZOOM_NO_DOTENV", "1")
+    for key in ZOOM_S2S_ENV_KEYS:
+        monkeypatch.delenv(key, raising=False)
+
+
+@pytest.fixture(scope="session")
+def _empty_tokens_path(tmp_path_factory):
+    """Placeholder tokens file, written once; load_tokens is patched so it is never parsed."""
+    path = tmp_path_factory.mktemp("tokens") / "tokens.json"
+    path.write_text("{}")
+    return path
+
+
+@pytest.fixture
+def prepped_tokens(monkeypatch, _empty_tokens_path):
+    monkeypatch.setenv("DLZOOM_TOKENS_PATH", str(_empty_tokens_path))
+
+
+@pytest.fixture
+def user_token_cli(monkeypatch, tmp_path, prepped_tokens):
+    """Route the recordings command through FakeUserClient with placeholder tokens."""
+    monkeypatch.setattr("dlzoom.cli.load_tokens", lambda path: object())
+    monkeypatch.setattr("dlzoom.cli.ZoomUserClient", FakeUserClient)
+    # DLZOOM_TOKENS_PATH only covers the tokens file; Config still discovers config.json
+    # under user_config_dir, so point it away from the developer's real config.
+    monkeypatch.setattr("dlzoom.config.user_config_dir", lambda _: str(tmp_path))
+
+
+# Canned pages shared by every FakeUserClient call; read-only so the CLI cannot
+# silently mutate them between tests.
+_USER_PAGE1 = MappingProxyType(
+    {
+        "meetings": [
+            {
+                "id": "123456789",
+                "uuid": "AAA+BBB/CCC==",
+                "topic": "Weekly Standup",
+                "start_time": "2025-01-15T10:00:00Z",
+                "duration": 30,
+                "recording_files": [{"recording_type": "MP4"}],
+            }
+        ],
+        "next_page_token": "PAGE2",
+    }
+)
+_USER_PAGE2 = MappingProxyType(
+    {
+        "meetings": [
+            {
+                "id": "123456789",
+                "uuid": "DDD+EEE/FFF==",
+                "topic": "Weekly Standup",
+                "start_time": "2025-01-22T10:00:00Z",
+                "duration": 30,
+                "recording_files": [
+                    {"recording_type": "MP4"},
+                    {"recording_type": "M4A"},
+                ],
+            }
+        ]
+    }
+)
+_EMPTY_PAGE = MappingProxyType({"meetings": []})
+
+
+def _user_api_error(status: int, zoom_code: int | None = None) -> ZoomUserAPIError:
+    # Mirror ZoomUserClient._request: the HTTPError is chained as the cause
+    response = requests.Response()
+    response.status_code = status
+    response._content = json.dumps({"code": zoom_code, "message": "error"}).encode()
+    err = ZoomUserAPIError(f"Zoom API error: HTTP {status}")
+    err.__cause__ = requests.HTTPError(f"{status} Client Error", response=response)
+    return err
 
 
 class FakeUserClient:
@@ -25,46 +108,28 @@ class FakeUserClient:
     ):
         # Simulate two pages when no token, then stop
         if next_page_token is None:
-            return {
-                "meetings": [
-                    {
-                        "id": "123456789",
-                        "uuid": "AAA+BBB/CCC==",
-                        "topic": "Weekly Standup",
-                        "start_time": "2025-01-15T10:00:00Z",
-                        "duration": 30,
-                        "recording_files": [{"recording_type": "MP4"}],
-                    }
-                ],
-                "next_page_token": "PAGE2",
-            }
-        elif next_page_token == "PAGE2":
-            return {
-                "meetings": [
-                    {
-                        "id": "123456789",
-                        "uuid": "DDD+EEE/FFF==",
-                        "topic": "Weekly Standup",
-                        "start_time": "2025-01-22T10:00:00Z",
-                        "duration": 30,
-                        "recording_files": [
-                            {"recording_type": "MP4"},
-                            {"recording_type": "M4A"},
-                        ],
-                    }
-                ]
-            }
-        return {"meetings": []}
+            return _USER_PAGE1
+        if next_page_token == "PAGE2":
+            return _USER_PAGE2
+        return _EMPTY_PAGE
 
     def get_meeting(self, meeting_id: str):
         # Simulate absence of meeting:read scope (fallback to heuristic)
-        raise Exception("permission denied")
+        raise _user_api_error(403)
+
+
+class EmptyUserClient(FakeUserClient):
+    def get_user_recordings(self, *a, **k):
+        return _EMPTY_PAGE
 
 
 class FakeS2SClient:
-    def __init__(self, account_id: str, client_id: str, client_secret: str):
+    def __init__(self, account_id: str, client_id: str, client_secret: str, **_options):
         self.account_id = account_id
 
+    def close(self) -> None:
+        pass
+
     def get_meeting_recordings(self, meeting_id: str):
         # Simulate a meeting with two instances
         return {
@@ -108,25 +173,10 @@ class FakeS2SClient:
         }
 
 
-def test_recordings_user_wide_json(monkeypatch, tmp_path):
-    # Disable .env autoload for test isolation
-    monkeypatch.setenv("DLZOOM_NO_DOTENV", "1")
-    # Ensure S2S is not used
-    monkeypatch.delenv("ZOOM_ACCOUNT_ID", raising=False)
-    monkeypatch.delenv("ZOOM_CLIENT_ID", raising=False)
-    monkeypatch.delenv("ZOOM_CLIENT_SECRET", raising=False)
-
-    monkeypatch.setattr("dlzoom.config.user_config_dir", lambda _: str(tmp_path))
-    _prep_user_tokens(monkeypatch, tmp_path)
-    # Patch token loader to pretend we have user tokens
-    monkeypatch.setattr("dlzoom.cli.load_tokens", lambda path: object())
-    # Patch client to use fake
-    monkeypatch.setattr("dlzoom.cli.ZoomUserClient", FakeUserClient)
-
-    runner = CliRunner()
-    result = runner.invoke(dlzoom_cli, ["recordings", "--range", "today", "--json"])
+def test_recordings_user_wide_json(runner, user_token_cli):
+    result = runner.invoke(_RECORDINGS_CMD, ["--range", "today", "--json"])
     assert result.exit_code == 0, result.output
-    data = json.loads(result.output)
+    data = json.loads(result.stdout_bytes)
     assert data["status"] == "success"
     assert data["command"] == "recordings"
     assert data["scope"] == "user"
@@ -135,137 +185,140 @@ def test_recordings_user_wide_json(monkeypatch, tmp_path):
     assert all(r.get("recurring") is True for r in data["meetings"])
 
 
-def test_recordings_account_scope_json(monkeypatch):
-    monkeypatch.setenv("DLZOOM_NO_DOTENV", "1")
+def test_recordings_account_scope_json(runner, monkeypatch):
     monkeypatch.setenv("ZOOM_ACCOUNT_ID", "acct")
     monkeypatch.setenv("ZOOM_CLIENT_ID", "cid")
     monkeypatch.setenv("ZOOM_CLIENT_SECRET", "sec")
     monkeypatch.setattr("dlzoom.cli.ZoomClient", FakeS2SClient)
 
-    runner = CliRunner()
     result = runner.invoke(
-        dlzoom_cli, ["recordings", "--from-date", "2025-02-01", "--to-date", "2025-02-02", "--json"]
+        _RECORDINGS_CMD, ["--from-date", "2025-02-01", "--to-date", "2025-02-02", "--json"]
     )
     assert result.exit_code == 0, result.output
-    data = json.loads(result.output)
+    data = json.loads(result.stdout_bytes)
     assert data["scope"] == "account"
     assert data["account_id"] == "acct"
     assert data["total_meetings"] == 1
     assert data["meetings"][0]["topic"] == "Account Sync"
 
 
-def test_recordings_meeting_scoped_json(monkeypatch):
-    # Disable .env autoload for test isolation
-    monkeypatch.setenv("DLZOOM_NO_DOTENV", "1")
+def test_recordings_meeting_scoped_json(runner, monkeypatch):
     # Make S2S present via env so CLI chooses S2S
     monkeypatch.setenv("ZOOM_ACCOUNT_ID", "acct")
     monkeypatch.setenv("ZOOM_CLIENT_ID", "cid")
     monkeypatch.setenv("ZOOM_CLIENT_SECRET", "sec")
 
-    monkeypatch.setattr("dlzoom.cli.ZoomClient", FakeS2SClient)
+    closed = []
+
+    class ClosingS2SClient(FakeS2SClient):
+        def close(self) -> None:
+            closed.append(self.account_id)
+
+    monkeypatch.setattr("dlzoom.cli.ZoomClient", ClosingS2SClient)
 
-    runner = CliRunner()
-    result = runner.invoke(dlzoom_cli, ["recordings", "--meeting-id", "123456789", "--json"])
+    result = runner.invoke(_RECORDINGS_CMD, ["--meeting-id", "123456789", "--json"])
     assert result.exit_code == 0, result.output
-    data = json.loads(result.output)
+    data = json.loads(result.stdout_bytes)
     assert data["status"] == "success"
     assert data["command"] == "recordings-instances"
     assert data["meeting_id"] == "123456789"
     assert data["total_instances"] == 2
-
-
-def test_recordings_mutual_exclusivity_error(monkeypatch, tmp_path):
-    # Disable .env autoload for test isolation
-    monkeypatch.setenv("DLZOOM_NO_DOTENV", "1")
-    # Tokens to avoid auth error
-    monkeypatch.delenv("ZOOM_ACCOUNT_ID", raising=False)
-    monkeypatch.delenv("ZOOM_CLIENT_ID", raising=False)
-    monkeypatch.delenv("ZOOM_CLIENT_SECRET", raising=False)
-    monkeypatch.setattr("dlzoom.config.user_config_dir", lambda _: str(tmp_path))
-    _prep_user_tokens(monkeypatch, tmp_path)
-    monkeypatch.setattr("dlzoom.cli.load_tokens", lambda path: object())
-    monkeypatch.setattr("dlzoom.cli.ZoomUserClient", FakeUserClient)
-
-    runner = CliRunner()
-    result = runner.invoke(
-        dlzoom_cli,
-        ["recordings", "--meeting-id", "123456789", "--range", "today"],
-    )
+    # The S2S client is closed when the command finishes
+    assert closed == ["acct"]
+
+
+@pytest.mark.parametrize(
+    "args,needle",
+    [
+        (["--meeting-id", "123456789", "--range", "today"], b"cannot be used with"),
+        (["--from-date", "2025-13-01", "--to-date", "2025-01-02"], b"Invalid date"),
+        (["--from-date", "2025-01-03", "--to-date", "2025-01-01"], b"before or equal"),
+    ],
+    ids=["mutual-exclusivity", "invalid-date", "from-after-to"],
+)
+def test_recordings_errors(runner, args, needle):
+    # Option validation runs before config/token loading, so no client setup is needed
+    result = runner.invoke(_RECORDINGS_CMD, args)
     assert result.exit_code != 0
-    assert "cannot be used with" in result.output
-
+    # Usage errors go to stderr; match on raw bytes rather than the decoded output
+    assert needle in result.stderr_bytes
 
-def test_recordings_invalid_date_rejected(monkeypatch, tmp_path):
-    # Disable .env autoload for test isolation
-    monkeypatch.setenv("DLZOOM_NO_DOTENV", "1")
-    monkeypatch.delenv("ZOOM_ACCOUNT_ID", raising=False)
-    monkeypatch.delenv("ZOOM_CLIENT_ID", raising=False)
-    monkeypatch.delenv("ZOOM_CLIENT_SECRET", raising=False)
-    monkeypatch.setattr("dlzoom.config.user_config_dir", lambda _: str(tmp_path))
-    _prep_user_tokens(monkeypatch, tmp_path)
-    monkeypatch.setattr("dlzoom.cli.load_tokens", lambda path: object())
-    monkeypatch.setattr("dlzoom.cli.ZoomUserClient", FakeUserClient)
 
-    runner = CliRunner()
-    result = runner.invoke(
-        dlzoom_cli, ["recordings", "--from-date", "2025-13-01", "--to-date", "2025-01-02"]
-    )
-    assert result.exit_code != 0
-    assert "YYYY-MM-DD" in result.output or "Invalid date" in result.output
-
-
-def test_recordings_from_gt_to_error(monkeypatch):
-    # Disable .env autoload for test isolation
-    monkeypatch.setenv("DLZOOM_NO_DOTENV", "1")
-    monkeypatch.delenv("ZOOM_ACCOUNT_ID", raising=False)
-    monkeypatch.delenv("ZOOM_CLIENT_ID", raising=False)
-    monkeypatch.delenv("ZOOM_CLIENT_SECRET", raising=False)
-    monkeypatch.setattr("dlzoom.cli.load_tokens", lambda path: object())
-    monkeypatch.setattr("dlzoom.cli.ZoomUserClient", FakeUserClient)
-
-    runner = CliRunner()
-    result = runner.invoke(
-        dlzoom_cli, ["recordings", "--from-date", "2025-01-03", "--to-date", "2025-01-01"]
-    )
-    assert result.exit_code != 0
-    assert "before or equal" in result.output
+def test_recordings_limit_zero_fetches_all(runner, user_token_cli):
+    result = runner.invoke(_RECORDINGS_CMD, ["--range", "today", "--limit", "0", "--json"])
+    assert result.exit_code == 0
+    data = json.loads(result.stdout_bytes)
+    assert data["total_meetings"] == 2
 
 
-def test_recordings_limit_zero_fetches_all(monkeypatch, tmp_path):
-    # Disable .env autoload for test isolation
-    monkeypatch.setenv("DLZOOM_NO_DOTENV", "1")
-    monkeypatch.delenv("ZOOM_ACCOUNT_ID", raising=False)
-    monkeypatch.delenv("ZOOM_CLIENT_ID", raising=False)
-    monkeypatch.delenv("ZOOM_CLIENT_SECRET", raising=False)
-    _prep_user_tokens(monkeypatch, tmp_path)
-    monkeypatch.setattr("dlzoom.config.user_config_dir", lambda _: str(tmp_path))
-    monkeypatch.setattr("dlzoom.cli.load_tokens", lambda path: object())
-    monkeypatch.setattr("dlzoom.cli.ZoomUserClient", FakeUserClient)
+def test_recordings_empty_results(runner, monkeypatch, user_token_cli):
+    monkeypatch.setattr("dlzoom.cli.ZoomUserClient", EmptyUserClient)
 
-    runner = CliRunner()
-    result = runner.invoke(dlzoom_cli, ["recordings", "--range", "today", "--limit", "0", "--json"])
+    result = runner.invoke(_RECORDINGS_CMD, ["--range", "today", "--json"])
     assert result.exit_code == 0
-    data = json.loads(result.output)
-    assert data["total_meetings"] == 2
+    data = json.loads(result.stdout_bytes)
+    assert data["total_meetings"] == 0
 
 
-def test_recordings_empty_results(monkeypatch, tmp_path):
-    class EmptyClient(FakeUserClient):
+@pytest.mark.parametrize(
+    ("status", "zoom_code", "expected_lookups"),
+    [
+        (403, None, ["111"]),  # missing meeting:read scope: stop enriching
+        (400, 4711, ["111"]),  # Zoom's "token does not contain scopes" code
+        (404, 3001, ["111", "222"]),  # one deleted meeting: keep enriching the rest
+    ],
+)
+def test_recordings_enrichment_after_failed_lookup(
+    runner, monkeypatch, user_token_cli, status, zoom_code, expected_lookups
+):
+    lookups = []
+
+    class FailingLookupUserClient(FakeUserClient):
         def get_user_recordings(self, *a, **k):
-            return {"meetings": []}
+            return {
+                "meetings": [
+                    {
+                        "id": "111",
+                        "uuid": "A1",
+                        "topic": "One",
+                        "start_time": "2025-01-01T10:00:00Z",
+                    },
+                    {
+                        "id": "222",
+                        "uuid": "B2",
+                        "topic": "Two",
+                        "start_time": "2025-01-02T10:00:00Z",
+                    },
+                ]
+            }
 
-    # Disable .env autoload for test isolation
-    monkeypatch.setenv("DLZOOM_NO_DOTENV", "1")
-    monkeypatch.delenv("ZOOM_ACCOUNT_ID", raising=False)
-    monkeypatch.delenv("ZOOM_CLIENT_ID", raising=False)
-    monkeypatch.delenv("ZOOM_CLIENT_SECRET", raising=False)
-    monkeypatch.setattr("dlzoom.config.user_config_dir", lambda _: str(tmp_path))
-    _prep_user_tokens(monkeypatch, tmp_path)
-    monkeypatch.setattr("dlzoom.cli.load_tokens", lambda path: object())
-    monkeypatch.setattr("dlzoom.cli.ZoomUserClient", EmptyClient)
+        def get_meeting(self, meeting_id: str):
+            lookups.append(meeting_id)
+            raise _user_api_error(status, zoom_code)
 
-    runner = CliRunner()
-    result = runner.invoke(dlzoom_cli, ["recordings", "--range", "today", "--json"])
-    assert result.exit_code == 0
-    data = json.loads(result.output)
-    assert data["total_meetings"] == 0
+    monkeypatch.setattr("dlzoom.cli.ZoomUserClient", FailingLookupUserClient)
+
+    result = runner.invoke(_RECORDINGS_CMD, ["--range", "today", "--json"])
+    assert result.exit_code == 0, result.output
+    data = json.loads(result.stdout_bytes)
+    assert [m["recurring"] for m in data["meetings"]] == [False, False]
+    assert lookups == expected_lookups
+
+
+def test_json_dumps_matches_stdlib_output():
+    payloads = [
+        {"status": "success", "meetings": [{"id": 1, "duration": 1.5, "files": []}]},
+        {"topic": "Réunion 会议"},  # non-ASCII stays \u-escaped
+        {1: "non-str key"},
+        {"big": 1e16, "small": 1.5e-7, "nan": float("nan"), "inf": float("inf")},
+        {"control": "a\x01b\x7fc\n"},
+        {"huge": 2**70, "ids": (1, 2), "flag": True, "none": None},
+    ]
+    for payload in payloads:
+        assert json_dumps(payload) == json.dumps(payload, indent=2)
+
+
+def test_json_dumps_rejects_non_json_types():
+    # Values orjson could serialize still raise, as with the stdlib encoder
+    with pytest.raises(TypeError):
+        json_dumps({"when": datetime(2025, 1, 1, tzinfo=UTC)})
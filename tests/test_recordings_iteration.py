@@ -1,22 +1,17 @@
-from collections import deque
+from types import SimpleNamespace
 
 from dlzoom.handlers import _iterate_account_recordings, _iterate_user_recordings
 
 
-class StubAccountClient:
-    def __init__(self, responses):
-        self.responses = deque(responses)
-        self.calls = []
+def _stub_account(responses):
+    """Account client stand-in that replays ``responses`` and records each call."""
+    calls = []
+    pages = iter(responses)
 
     def get_account_recordings(
-        self,
-        *,
-        from_date=None,
-        to_date=None,
-        page_size=300,
-        next_page_token=None,
+        *, from_date=None, to_date=None, page_size=300, next_page_token=None
     ):
-        self.calls.append(
+        calls.append(
             {
                 "from": from_date,
                 "to": to_date,
@@ -24,24 +19,20 @@ class StubAccountClient:
                 "next_page_token": next_page_token,
             }
         )
-        return self.responses.popleft()
+        return next(pages)
 
+    return SimpleNamespace(get_account_recordings=get_account_recordings, calls=calls)
 
-class StubUserClient:
-    def __init__(self, responses):
-        self.responses = deque(responses)
-        self.calls = []
+
+def _stub_user(responses):
+    """User client stand-in that replays ``responses`` and records each call."""
+    calls = []
+    pages = iter(responses)
 
     def get_user_recordings(
-        self,
-        *,
-        user_id,
-        from_date=None,
-        to_date=None,
-        page_size=300,
-        next_page_token=None,
+        *, user_id, from_date=None, to_date=None, page_size=300, next_page_token=None
     ):
-        self.calls.append(
+        calls.append(
             {
                 "user_id": user_id,
                 "from": from_date,
@@ -50,7 +41,9 @@ class StubUserClient:
                 "next_page_token": next_page_token,
             }
         )
-        return self.responses.popleft()
+        return next(pages)
+
+    return SimpleNamespace(get_user_recordings=get_user_recordings, calls=calls)
 
 
 def test_account_iteration_handles_pagination():
@@ -58,7 +51,7 @@ def test_account_iteration_handles_pagination():
         {"meetings": [{"uuid": "A"}], "next_page_token": "NEXT"},
         {"meetings": [{"uuid": "B"}]},
     ]
-    client = StubAccountClient(responses)
+    client = _stub_account(responses)
 
     meetings = list(
         _iterate_account_recordings(
@@ -80,7 +73,7 @@ def test_account_iteration_chunks_months():
         {"meetings": [{"uuid": "JAN"}]},
         {"meetings": [{"uuid": "FEB"}]},
     ]
-    client = StubAccountClient(responses)
+    client = _stub_account(responses)
 
     meetings = list(
         _iterate_account_recordings(
@@ -104,7 +97,7 @@ def test_account_iteration_resets_tokens_per_chunk():
         {"meetings": [{"uuid": "JAN-2"}]},
         {"meetings": [{"uuid": "FEB-1"}]},
     ]
-    client = StubAccountClient(responses)
+    client = _stub_account(responses)
 
     meetings = list(
         _iterate_account_recordings(
@@ -125,7 +118,7 @@ def test_user_iteration_passes_user_id():
     responses = [
         {"meetings": [{"uuid": "U1"}]},
     ]
-    client = StubUserClient(responses)
+    client = _stub_user(responses)
 
     meetings = list(
         _iterate_user_recordings(
@@ -1,8 +1,18 @@
 import json
+import sys
 from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
 
 from dlzoom.downloader import Downloader
 
+_TIMELINE_FILE = {
+    "file_extension": "JSON",
+    "file_type": "TIMELINE",
+    "download_url": "https://zoom.us/rec/download/foo",
+}
+
 
 def _make_timeline_file(tmp_path: Path) -> Path:
     p = tmp_path / "timeline.json"
@@ -16,196 +26,99 @@ def _make_timeline_file(tmp_path: Path) -> Path:
     return p
 
 
-def test_downloader_generates_stj_by_default(monkeypatch, tmp_path):
-    # Prepare
-    d = Downloader(output_dir=tmp_path, access_token="token", output_name="meeting")
-    timeline_path = _make_timeline_file(tmp_path)
+def _install_fake_writer(monkeypatch, writer):
+    """Stand in for dlzoom.stj_minimizer, which Downloader imports lazily."""
+    monkeypatch.setitem(
+        sys.modules, "dlzoom.stj_minimizer", SimpleNamespace(write_minimal_stj_from_file=writer)
+    )
+
 
-    # Monkeypatch download_file to return our local timeline path
-    monkeypatch.setattr(Downloader, "download_file", lambda *a, **k: timeline_path)
+@pytest.fixture
+def timeline_path(tmp_path, monkeypatch):
+    """Local timeline file served in place of any download."""
+    path = _make_timeline_file(tmp_path)
+    monkeypatch.setattr(Downloader, "download_file", lambda *a, **k: path)
+    return path
 
-    # Spy on writer to ensure it is invoked and writes to expected path
-    calls = {}
+
+@pytest.fixture
+def downloader(tmp_path, timeline_path):
+    return Downloader(output_dir=tmp_path, access_token="token", output_name="meeting")
+
+
+@pytest.fixture
+def writer_calls(monkeypatch):
+    """Install a fake STJ writer and return the list of (timeline, output) paths it saw."""
+    calls = []
 
     def fake_writer(timeline_path, output_path, **opts):
-        calls["timeline_path"] = Path(timeline_path)
-        calls["output_path"] = Path(output_path)
-        output_path.write_text("{}\n")
+        calls.append((Path(timeline_path), Path(output_path)))
+        Path(output_path).write_text("{}\n")
         return output_path
 
-    monkeypatch.setenv("DLZOOM_SPEAKERS", "1")
-    monkeypatch.setitem(
-        __import__("sys").modules,
-        "dlzoom.stj_minimizer",
-        __import__("types").SimpleNamespace(write_minimal_stj_from_file=fake_writer),
-    )
+    _install_fake_writer(monkeypatch, fake_writer)
+    return calls
 
-    files = d.download_transcripts_and_chat(
-        recording_files=[
-            {
-                "file_extension": "JSON",
-                "file_type": "TIMELINE",
-                "download_url": "https://zoom.us/rec/download/foo",
-            }
-        ],
+
+def _download_timeline(d, recording_file=_TIMELINE_FILE, **kwargs):
+    return d.download_transcripts_and_chat(
+        recording_files=[recording_file],
         meeting_topic="Topic",
         instance_start=None,
         show_progress=False,
         skip_transcript=True,
         skip_chat=True,
         skip_timeline=False,
+        **kwargs,
     )
 
+
+def test_downloader_generates_stj_by_default(monkeypatch, downloader, timeline_path, writer_calls):
+    monkeypatch.setenv("DLZOOM_SPEAKERS", "1")
+
+    files = _download_timeline(downloader)
+
     assert files["timeline"][0] == timeline_path
     assert files["speakers"][0].name == "meeting_speakers.stjson"
     # Ensure STJ was written with expected base name
-    assert calls["output_path"].name == "meeting_speakers.stjson"
-    assert calls["output_path"].exists()
+    [(written_from, output_path)] = writer_calls
+    assert written_from == timeline_path
+    assert output_path.name == "meeting_speakers.stjson"
+    assert output_path.exists()
 
 
-def test_downloader_stj_without_output_name_uses_unique_suffix(monkeypatch, tmp_path):
+def test_downloader_stj_without_output_name_uses_unique_suffix(
+    monkeypatch, tmp_path, timeline_path, writer_calls
+):
     d = Downloader(output_dir=tmp_path, access_token="token")
-    timeline_path = _make_timeline_file(tmp_path)
-    monkeypatch.setattr(Downloader, "download_file", lambda *a, **k: timeline_path)
-
-    def fake_writer(timeline_path, output_path, **opts):
-        Path(output_path).write_text("{}\n")
-        return output_path
-
     monkeypatch.setenv("DLZOOM_SPEAKERS", "1")
-    monkeypatch.setitem(
-        __import__("sys").modules,
-        "dlzoom.stj_minimizer",
-        __import__("types").SimpleNamespace(write_minimal_stj_from_file=fake_writer),
-    )
 
-    files = d.download_transcripts_and_chat(
-        recording_files=[
-            {
-                "file_extension": "JSON",
-                "file_type": "TIMELINE",
-                "download_url": "https://zoom.us/rec/download/foo",
-                "id": "abc123",
-            }
-        ],
-        meeting_topic="Topic",
-        instance_start=None,
-        show_progress=False,
-        skip_transcript=True,
-        skip_chat=True,
-        skip_timeline=False,
-    )
+    files = _download_timeline(d, {**_TIMELINE_FILE, "id": "abc123"})
 
     assert files["speakers"][0].name == "timeline_speakers_abc123.stjson"
 
 
-def test_downloader_stj_template_name_dedupes(monkeypatch, tmp_path):
+def test_downloader_stj_template_name_dedupes(monkeypatch, tmp_path, downloader, writer_calls):
     existing = tmp_path / "meeting_speakers.stjson"
     existing.write_text("{}")
-
-    d = Downloader(output_dir=tmp_path, access_token="token", output_name="meeting")
-    timeline_path = _make_timeline_file(tmp_path)
-    monkeypatch.setattr(Downloader, "download_file", lambda *a, **k: timeline_path)
-
-    def fake_writer(timeline_path, output_path, **opts):
-        Path(output_path).write_text("{}\n")
-        return output_path
-
     monkeypatch.setenv("DLZOOM_SPEAKERS", "1")
-    monkeypatch.setitem(
-        __import__("sys").modules,
-        "dlzoom.stj_minimizer",
-        __import__("types").SimpleNamespace(write_minimal_stj_from_file=fake_writer),
-    )
 
-    files = d.download_transcripts_and_chat(
-        recording_files=[
-            {
-                "file_extension": "JSON",
-                "file_type": "TIMELINE",
-                "download_url": "https://zoom.us/rec/download/foo",
-            }
-        ],
-        meeting_topic="Topic",
-        instance_start=None,
-        show_progress=False,
-        skip_transcript=True,
-        skip_chat=True,
-        skip_timeline=False,
-    )
+    files = _download_timeline(downloader)
 
     assert files["speakers"][0].name == "meeting_speakers_2.stjson"
 
 
-def test_downloader_skip_speakers(monkeypatch, tmp_path):
-    d = Downloader(output_dir=tmp_path, access_token="token", output_name="meeting")
-    timeline_path = _make_timeline_file(tmp_path)
-    monkeypatch.setattr(Downloader, "download_file", lambda *a, **k: timeline_path)
-
-    wrote = {"called": False}
-
-    def fake_writer(*a, **k):
-        wrote["called"] = True
+def test_downloader_skip_speakers(downloader, writer_calls):
+    files = _download_timeline(downloader, skip_speakers=True)
 
-    monkeypatch.setitem(
-        __import__("sys").modules,
-        "dlzoom.stj_minimizer",
-        __import__("types").SimpleNamespace(write_minimal_stj_from_file=fake_writer),
-    )
-
-    files = d.download_transcripts_and_chat(
-        recording_files=[
-            {
-                "file_extension": "JSON",
-                "file_type": "TIMELINE",
-                "download_url": "https://zoom.us/rec/download/foo",
-            }
-        ],
-        meeting_topic="Topic",
-        instance_start=None,
-        show_progress=False,
-        skip_transcript=True,
-        skip_chat=True,
-        skip_timeline=False,
-        skip_speakers=True,
-    )
-
-    assert wrote["called"] is False
+    assert writer_calls == []
     assert files["speakers"] == []
 
 
-def test_downloader_env_skip_speakers_case_insensitive(monkeypatch, tmp_path):
-    d = Downloader(output_dir=tmp_path, access_token="token", output_name="meeting")
-    timeline_path = _make_timeline_file(tmp_path)
-    monkeypatch.setattr(Downloader, "download_file", lambda *a, **k: timeline_path)
-
-    wrote = {"called": False}
-
-    def fake_writer(*a, **k):
-        wrote["called"] = True
-
-    monkeypatch.setitem(
-        __import__("sys").modules,
-        "dlzoom.stj_minimizer",
-        __import__("types").SimpleNamespace(write_minimal_stj_from_file=fake_writer),
-    )
+def test_downloader_env_skip_speakers_case_insensitive(monkeypatch, downloader, writer_calls):
     monkeypatch.setenv("DLZOOM_SPEAKERS", "FALSE ")
 
-    files = d.download_transcripts_and_chat(
-        recording_files=[
-            {
-                "file_extension": "JSON",
-                "file_type": "TIMELINE",
-                "download_url": "https://zoom.us/rec/download/foo",
-            }
-        ],
-        meeting_topic="Topic",
-        instance_start=None,
-        show_progress=False,
-        skip_transcript=True,
-        skip_chat=True,
-        skip_timeline=False,
-    )
+    files = _download_timeline(downloader)
 
-    assert wrote["called"] is False
+    assert writer_calls == []
     assert files["speakers"] == []
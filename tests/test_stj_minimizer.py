@@ -1,4 +1,14 @@
-from dlzoom.stj_minimizer import timeline_to_minimal_stj
+import json
+from datetime import datetime
+
+import pytest
+
+import dlzoom.stj_minimizer as stj_minimizer
+from dlzoom.stj_minimizer import (
+    _parse_hhmmss_ms,
+    timeline_to_minimal_stj,
+    write_minimal_stj_from_file,
+)
 
 
 def _synthetic_timeline():
@@ -102,6 +112,20 @@ def test_duplicate_names_get_slug_suffixes():
     assert "alex-2" in speaker_ids
 
 
+def test_repeat_speakers_keep_their_slug():
+    data = {
+        "timeline": [
+            {"ts": "00:00:00.000", "users": [{"username": "Alex", "zoom_userid": "Z1"}]},
+            {"ts": "00:00:02.000", "users": [{"username": "Alex", "zoom_userid": "Z2"}]},
+            {"ts": "00:00:04.000", "users": [{"username": "Alex", "zoom_userid": "Z1"}]},
+            {"ts": "00:00:06.000", "users": [{"username": "Alex", "zoom_userid": "Z3"}]},
+        ]
+    }
+    stj = timeline_to_minimal_stj(data, duration_sec=8.0)
+    segs = stj["stj"]["transcript"]["segments"]
+    assert [s["speaker_id"] for s in segs] == ["alex", "alex-2", "alex", "alex-3"]
+
+
 def test_context_metadata_applied():
     data = _synthetic_timeline()
     context = {
@@ -133,3 +157,68 @@ def test_context_metadata_applied():
     assert dlzoom_ext["topic"] == "Weekly Sync"
     assert dlzoom_ext["host"]["email"] == "host@example.com"
     assert dlzoom_ext["flags"]["has_chat"] is True
+
+
+def test_write_minimal_stj_keeps_timeline_refine_precedence(tmp_path):
+    data = _synthetic_timeline()
+    data["timeline_refine"] = [
+        {"ts": "00:00:09.500", "users": [{"username": "Alice", "zoom_userid": "Z_A"}]},
+    ]
+    timeline_path = tmp_path / "timeline.json"
+    timeline_path.write_text(json.dumps(data), encoding="utf-8")
+
+    out = write_minimal_stj_from_file(timeline_path, tmp_path / "out.stj.json", duration_sec=16.0)
+
+    stj = json.loads(out.read_bytes())["stj"]
+    assert stj["metadata"]["source"]["extensions"]["zoom"]["timeline_source"] == "timeline_refine"
+    assert [s["start"] for s in stj["transcript"]["segments"]] == [9.5]
+
+
+@pytest.mark.parametrize(
+    "ts,expected",
+    [("00:00:12.000", 12.0), ("01:02:03", 3723.0), ("00:00:01.5", 1.5), ("00:01:00.25", 60.25)],
+)
+def test_parse_timestamp_variants(ts, expected):
+    assert _parse_hhmmss_ms(ts) == pytest.approx(expected)
+
+
+def test_parse_timestamp_rejects_garbage():
+    with pytest.raises(ValueError):
+        _parse_hhmmss_ms("not-a-time")
+
+
+class _FrozenDatetime(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return datetime(2025, 1, 1, tzinfo=tz)
+
+
+def test_write_minimal_stj_output_parses_the_same_with_either_encoder(tmp_path, monkeypatch):
+    timeline_path = tmp_path / "timeline.json"
+    timeline_path.write_text(json.dumps(_synthetic_timeline()), encoding="utf-8")
+    context = {"meeting": {"topic": "Réunion 会议"}}
+    # Pin created_at so the two runs produce the same document
+    monkeypatch.setattr(stj_minimizer, "datetime", _FrozenDatetime)
+
+    fast = write_minimal_stj_from_file(
+        timeline_path, tmp_path / "fast.stj.json", duration_sec=16.0, context=context
+    ).read_bytes()
+    monkeypatch.setattr(stj_minimizer, "_orjson", None)
+    stdlib = write_minimal_stj_from_file(
+        timeline_path, tmp_path / "stdlib.stj.json", duration_sec=16.0, context=context
+    ).read_bytes()
+
+    expected = json.dumps(json.loads(stdlib), indent=2, ensure_ascii=False) + "\n"
+    assert stdlib == expected.encode("utf-8")
+    assert fast.endswith(b"\n")
+    assert json.loads(fast) == json.loads(stdlib)
+
+
+def test_dump_stj_floats_parse_the_same_with_either_encoder(monkeypatch):
+    # Exponent formatting differs between encoders; the parsed values must not
+    stj = {"segments": [{"start": 1.5e-7, "end": 1e16, "text": "Réunion"}]}
+    fast = stj_minimizer._dump_stj(stj)
+    monkeypatch.setattr(stj_minimizer, "_orjson", None)
+    stdlib = stj_minimizer._dump_stj(stj)
+
+    assert json.loads(fast) == json.loads(stdlib) == stj
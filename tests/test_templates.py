@@ -2,20 +2,17 @@
 Tests for template parsing with error visibility
 """
 
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 
-from dlzoom.templates import TemplateParser
+from dlzoom.templates import TemplateParser, _parse_start_time
 
 
 class TestTemplateErrorVisibility:
     """Test that template parsing errors are visible (not silent)"""
 
-    @patch("logging.getLogger")
-    def test_invalid_date_logs_warning(self, mock_logger):
+    @patch("dlzoom.templates.logger")
+    def test_invalid_date_logs_warning(self, mock_log):
         """Invalid date should log warning and use empty string"""
-        mock_log = Mock()
-        mock_logger.return_value = mock_log
-
         parser = TemplateParser(filename_template="{start_time:%Y%m%d}")
 
         # Invalid date format
@@ -32,12 +29,9 @@ class TestTemplateErrorVisibility:
         # Should use empty string (not silent failure)
         assert result == ""  # No date, no other content
 
-    @patch("logging.getLogger")
-    def test_missing_start_time_logs_warning(self, mock_logger):
+    @patch("dlzoom.templates.logger")
+    def test_missing_start_time_logs_warning(self, mock_log):
         """Missing start_time should leave placeholder unchanged"""
-        mock_log = Mock()
-        mock_logger.return_value = mock_log
-
         parser = TemplateParser(filename_template="recording_{start_time:%Y%m%d}")
 
         # No start_time in data
@@ -68,6 +62,17 @@ class TestTemplateErrorVisibility:
         result = parser.apply_filename_template(meeting_data)
         assert result == "2025/09/30"
 
+    def test_start_time_parsed_once_per_value(self):
+        """Repeated placeholders and files reuse one parse of the same start_time"""
+        _parse_start_time.cache_clear()
+        parser = TemplateParser(filename_template="{start_time:%Y}/{start_time:%m}/{start_time:%d}")
+        meeting_data = {"start_time": "2025-09-30T12:00:35Z"}
+
+        parser.apply_filename_template(meeting_data)
+        parser.apply_filename_template(meeting_data)
+
+        assert _parse_start_time.cache_info().misses == 1
+
 
 class TestSimplePlaceholders:
     """Test simple placeholder substitution"""
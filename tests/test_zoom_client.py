@@ -2,17 +2,32 @@
 Tests for ZoomClient network resilience and credential protection
 """
 
+import json
+from contextlib import nullcontext
+from types import SimpleNamespace
+from typing import Any
 from unittest.mock import Mock, patch
 
 import pytest
 import requests
 
 from dlzoom.exceptions import AuthenticationError, RateLimitedError
-from dlzoom.zoom_client import ZoomAPIError, ZoomClient
+from dlzoom.zoom_client import ZoomAPIError, ZoomClient, _TokenBucket
+
+
+def _resp(status_code: int, body: Any = None, headers: dict[str, str] | None = None):
+    """Lightweight stand-in for requests.Response (much cheaper to build than a Mock)"""
+    return SimpleNamespace(
+        status_code=status_code,
+        headers=headers or {},
+        content=json.dumps(body).encode(),
+        json=lambda: body,
+        raise_for_status=lambda: None,
+    )
 
 
 class TestCredentialProtection:
-    """Test credential protection in __repr__ and __del__"""
+    """Test credential protection in __repr__ and close()"""
 
     def test_repr_excludes_credentials(self):
         """__repr__ should not expose credentials"""
@@ -48,24 +63,42 @@ class TestCredentialProtection:
         repr_str = repr(client)
         assert "token_cached=False" in repr_str
 
-    def test_del_zeros_credentials(self):
-        """__del__ should zero out credentials"""
+    def test_client_has_no_instance_dict(self):
+        """Slots keep stray attributes (and the per-instance dict) off the client"""
+        client = ZoomClient("acc", "cli", "sec")
+
+        assert not hasattr(client, "__dict__")
+        with pytest.raises(AttributeError):
+            client.unexpected = "value"
+
+    def test_close_zeros_credentials(self):
+        """close() should zero out credentials"""
         client = ZoomClient("acc", "cli", "sec")
         client._access_token = "token"
 
-        # Call __del__ manually
-        client.__del__()
+        client.close()
 
         assert client.account_id == ""
         assert client.client_id == ""
         assert client.client_secret == ""
+        assert client._basic_auth_header == ""
         assert client._access_token is None
 
+    def test_context_manager_closes_session(self):
+        """Leaving the with-block should clear credentials and close the session"""
+        client = ZoomClient("acc", "cli", "sec")
+        with patch.object(client._session, "close") as mock_close:
+            with client as entered:
+                assert entered is client
+            mock_close.assert_called_once_with()
+
+        assert client.client_secret == ""
+
 
 class TestNetworkTimeouts:
     """Test timeout handling for OAuth and API requests"""
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_oauth_timeout(self, mock_post):
         """OAuth request should timeout after 30 seconds"""
         mock_post.side_effect = requests.exceptions.Timeout()
@@ -79,21 +112,20 @@ class TestNetworkTimeouts:
         mock_post.assert_called_once()
         call_kwargs = mock_post.call_args.kwargs
         assert call_kwargs["timeout"] == 30
+        # base64("cli:sec"), precomputed at construction
+        assert call_kwargs["headers"]["Authorization"] == "Basic Y2xpOnNlYw=="
 
-    @patch("time.sleep")  # Mock sleep to avoid delays
-    @patch("requests.post")
-    @patch("requests.request")
-    def test_api_request_timeout(self, mock_request, mock_post, mock_sleep):
+    @patch("requests.Session.post")
+    @patch("requests.Session.request")
+    def test_api_request_timeout(self, mock_request, mock_post):
         """API request should timeout after 30 seconds"""
         # Mock OAuth token
-        mock_post.return_value = Mock(
-            status_code=200, json=lambda: {"access_token": "token", "expires_in": 3600}
-        )
+        mock_post.return_value = _resp(200, {"access_token": "token", "expires_in": 3600})
 
         # Mock API timeout - will retry 3 times
         mock_request.side_effect = requests.exceptions.Timeout()
 
-        client = ZoomClient("acc", "cli", "sec")
+        client = ZoomClient("acc", "cli", "sec", sleeper=lambda _: None)
 
         with pytest.raises(ZoomAPIError, match="Network request failed"):
             client._make_request("GET", "meetings/123")
@@ -104,155 +136,131 @@ class TestNetworkTimeouts:
         assert mock_request.call_count == 3
 
 
-class TestRetryLogic:
-    """Test exponential backoff retry logic"""
+_OK = _resp(200, {"data": "success"})
+_CONNECTION_ERROR = requests.exceptions.ConnectionError("Connection failed")
 
-    @patch("requests.post")
-    @patch("requests.request")
-    @patch("time.sleep")
-    def test_retry_on_rate_limit_429(self, mock_sleep, mock_request, mock_post):
-        """Should retry on 429 rate limit with exponential backoff"""
-        # Mock OAuth
-        mock_post.return_value = Mock(
-            status_code=200, json=lambda: {"access_token": "token", "expires_in": 3600}
-        )
 
-        # Mock API: 429 twice, then success
-        mock_request.side_effect = [
-            Mock(status_code=429),
-            Mock(status_code=429),
-            Mock(status_code=200, json=lambda: {"data": "success"}),
-        ]
+@pytest.fixture
+def sleeps() -> list[float]:
+    return []
 
-        client = ZoomClient("acc", "cli", "sec")
-        result = client._make_request("GET", "meetings/123")
 
-        assert result == {"data": "success"}
-        assert mock_request.call_count == 3
+@pytest.fixture
+def zoom_client(sleeps):
+    """Client with a cached token and a stubbed session, recording every backoff sleep"""
+    client = ZoomClient("acc", "cli", "sec", sleeper=sleeps.append)
+    client._access_token = "token"
+    client._token_deadline = float("inf")
+    client._session = Mock()
+    return client
 
-        # Check exponential backoff: 1.0, 2.0 seconds
-        assert mock_sleep.call_count == 2
-        sleep_times = [call[0][0] for call in mock_sleep.call_args_list]
-        assert sleep_times[0] == 1.0  # backoff_factor * (2 ** 0)
-        assert sleep_times[1] == 2.0  # backoff_factor * (2 ** 1)
-
-    @patch("requests.post")
-    @patch("requests.request")
-    @patch("time.sleep")
-    def test_retry_on_server_error_503(self, mock_sleep, mock_request, mock_post):
-        """Should retry on 503 server error with exponential backoff"""
-        # Mock OAuth
-        mock_post.return_value = Mock(
-            status_code=200, json=lambda: {"access_token": "token", "expires_in": 3600}
-        )
 
-        # Mock API: 503 once, then success
-        mock_request.side_effect = [
-            Mock(status_code=503),
-            Mock(status_code=200, json=lambda: {"data": "success"}),
-        ]
+class TestRetryLogic:
+    """Test exponential backoff retry logic"""
 
-        client = ZoomClient("acc", "cli", "sec")
-        result = client._make_request("GET", "meetings/123")
-
-        assert result == {"data": "success"}
-        assert mock_request.call_count == 2
-        mock_sleep.assert_called_once_with(1.0)
-
-    @patch("requests.post")
-    @patch("requests.request")
-    @patch("time.sleep")
-    def test_retry_exhausted_429(self, mock_sleep, mock_request, mock_post):
-        """Should raise RateLimitedError after max retries"""
-        # Mock OAuth
-        mock_post.return_value = Mock(
-            status_code=200, json=lambda: {"access_token": "token", "expires_in": 3600}
-        )
-
-        # Mock API: always 429
-        mock_request.return_value = Mock(status_code=429)
-
-        client = ZoomClient("acc", "cli", "sec")
-
-        with pytest.raises(RateLimitedError, match="Rate limit exceeded"):
-            client._make_request("GET", "meetings/123", retry_count=3)
-
-        # Should try 3 times (no retry after last attempt)
-        assert mock_request.call_count == 3
-        # Should sleep 2 times (between attempts)
-        assert mock_sleep.call_count == 2
-
-    @patch("requests.post")
-    @patch("requests.request")
-    @patch("time.sleep")
-    def test_retry_exhausted_server_error(self, mock_sleep, mock_request, mock_post):
-        """Should raise ZoomAPIError after max retries on server error"""
-        # Mock OAuth
-        mock_post.return_value = Mock(
-            status_code=200, json=lambda: {"access_token": "token", "expires_in": 3600}
+    @pytest.mark.parametrize(
+        "side_effects,expected_exc,expected_match,expected_backoffs",
+        [
+            ([_resp(429), _resp(429), _OK], None, None, [1.0, 2.0]),
+            ([_resp(503), _OK], None, None, [1.0]),
+            ([_resp(429)] * 3, RateLimitedError, "Rate limit exceeded", [1.0, 2.0]),
+            ([_resp(503)] * 3, ZoomAPIError, "Zoom API server error", [1.0, 2.0]),
+            ([_CONNECTION_ERROR, _OK], None, None, [1.0]),
+            (
+                [_CONNECTION_ERROR] * 3,
+                ZoomAPIError,
+                "Network request failed after retries",
+                [1.0, 2.0],
+            ),
+        ],
+        ids=[
+            "429-recovers",
+            "503-recovers",
+            "429-exhausted",
+            "503-exhausted",
+            "network-recovers",
+            "network-exhausted",
+        ],
+    )
+    def test_retry_matrix(
+        self, zoom_client, sleeps, side_effects, expected_exc, expected_match, expected_backoffs
+    ):
+        """Retryable failures back off exponentially and either recover or raise"""
+        zoom_client._session.request.side_effect = side_effects
+
+        raises = (
+            pytest.raises(expected_exc, match=expected_match) if expected_exc else nullcontext()
         )
+        with raises:
+            result = zoom_client._make_request("GET", "meetings/123", retry_count=3)
+
+        if expected_exc is None:
+            assert result == {"data": "success"}
+        assert zoom_client._session.request.call_count == len(side_effects)
+        # Each sleep is the exponential base delay jittered by +/-50%, none after the last try
+        assert len(sleeps) == len(expected_backoffs)
+        for slept, base in zip(sleeps, expected_backoffs, strict=True):
+            assert 0.5 * base <= slept <= 1.5 * base
+
+    @pytest.mark.parametrize(
+        "retry_after,expected",
+        [
+            ("5", 5.0),
+            ("Wed, 21 Oct 2099 07:28:00 GMT", 30.0),  # far-future HTTP-date is clamped
+            ("Thu, 01 Jan 1970 00:00:00 GMT", 0.0),  # past HTTP-date means retry now
+            ("²", pytest.approx(1.0, abs=0.5)),  # unparseable: jittered backoff instead
+        ],
+    )
+    def test_retry_respects_retry_after_header(self, zoom_client, sleeps, retry_after, expected):
+        """429 with Retry-After should wait as instructed instead of backing off"""
+        zoom_client._session.request.side_effect = [
+            _resp(429, headers={"Retry-After": retry_after}),
+            _OK,
+        ]
 
-        # Mock API: always 503
-        mock_request.return_value = Mock(status_code=503)
+        assert zoom_client._make_request("GET", "meetings/123") == {"data": "success"}
+        assert sleeps == [expected]
 
-        client = ZoomClient("acc", "cli", "sec")
+    def test_backoff_delay_is_capped(self):
+        """Computed backoff should never exceed 30 seconds, even with jitter"""
+        assert ZoomClient._backoff_delay(1.0, 10) == 30.0
 
-        with pytest.raises(ZoomAPIError, match="Zoom API server error"):
-            client._make_request("GET", "meetings/123", retry_count=3)
-
-    @patch("requests.post")
-    @patch("requests.request")
-    @patch("time.sleep")
-    def test_retry_on_network_error(self, mock_sleep, mock_request, mock_post):
-        """Should retry on network errors (ConnectionError)"""
-        # Mock OAuth
-        mock_post.return_value = Mock(
-            status_code=200, json=lambda: {"access_token": "token", "expires_in": 3600}
-        )
 
-        # Mock API: ConnectionError once, then success
-        mock_request.side_effect = [
-            requests.exceptions.ConnectionError("Connection failed"),
-            Mock(status_code=200, json=lambda: {"data": "success"}),
-        ]
+class TestRateLimiter:
+    """Test client-side adaptive request pacing"""
 
-        client = ZoomClient("acc", "cli", "sec")
-        result = client._make_request("GET", "meetings/123")
-
-        assert result == {"data": "success"}
-        assert mock_request.call_count == 2
-        mock_sleep.assert_called_once_with(1.0)
-
-    @patch("requests.post")
-    @patch("requests.request")
-    @patch("time.sleep")
-    def test_retry_exhausted_network_error(self, mock_sleep, mock_request, mock_post):
-        """Should raise ZoomAPIError after max retries on network error"""
-        # Mock OAuth
-        mock_post.return_value = Mock(
-            status_code=200, json=lambda: {"access_token": "token", "expires_in": 3600}
+    def test_empty_bucket_delays_next_request(self, zoom_client, sleeps):
+        """Once the burst allowance is spent, the next request waits for a token"""
+        zoom_client._limiter = _TokenBucket(
+            rate=10.0, capacity=1, clock=lambda: 0.0, sleeper=sleeps.append
         )
+        zoom_client._session.request.return_value = _OK
 
-        # Mock API: always ConnectionError
-        mock_request.side_effect = requests.exceptions.ConnectionError("Connection failed")
+        zoom_client._make_request("GET", "meetings/123")
+        assert sleeps == []
+        zoom_client._make_request("GET", "meetings/456")
+        assert sleeps == [pytest.approx(0.1)]
 
-        client = ZoomClient("acc", "cli", "sec")
+    def test_rate_halves_on_429_and_recovers(self, zoom_client):
+        """429 halves the send rate; later successes grow it back, capped at the start rate"""
+        zoom_client._session.request.side_effect = [_resp(429), _OK]
 
-        with pytest.raises(ZoomAPIError, match="Network request failed after retries"):
-            client._make_request("GET", "meetings/123", retry_count=3)
+        zoom_client._make_request("GET", "meetings/123")
+        assert zoom_client._limiter.rate == pytest.approx(5.0 * 1.1)
 
-        assert mock_request.call_count == 3
+        zoom_client._session.request.side_effect = [_OK] * 20
+        for _ in range(20):
+            zoom_client._make_request("GET", "meetings/123")
+        assert zoom_client._limiter.rate == 10.0
 
 
 class TestTokenCaching:
     """Test OAuth token caching"""
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_token_cached(self, mock_post):
         """Token should be cached and reused"""
-        mock_post.return_value = Mock(
-            status_code=200, json=lambda: {"access_token": "token123", "expires_in": 3600}
-        )
+        mock_post.return_value = _resp(200, {"access_token": "token123", "expires_in": 3600})
 
         client = ZoomClient("acc", "cli", "sec")
 
@@ -266,35 +274,82 @@ class TestTokenCaching:
         assert token2 == "token123"
         assert mock_post.call_count == 1  # No additional request
 
-    @patch("requests.post")
-    @patch("time.time")
-    def test_token_refresh_when_expired(self, mock_time, mock_post):
+    @patch("requests.Session.post")
+    def test_token_refresh_when_expired(self, mock_post):
         """Token should be refreshed when expired"""
         # Different tokens for each request
         mock_post.side_effect = [
-            Mock(status_code=200, json=lambda: {"access_token": "token1", "expires_in": 3600}),
-            Mock(status_code=200, json=lambda: {"access_token": "token2", "expires_in": 3600}),
+            _resp(200, {"access_token": "token1", "expires_in": 3600}),
+            _resp(200, {"access_token": "token2", "expires_in": 3600}),
         ]
 
-        # Mock time progression
-        mock_time.side_effect = [
-            1000.0,  # First _get_access_token() call - current time
-            5000.0,  # Second _get_access_token() call - expired (5000 > 4600-60=4540)
-        ]
+        now = 1000.0
+        client = ZoomClient("acc", "cli", "sec", clock=lambda: now)
 
-        client = ZoomClient("acc", "cli", "sec")
-
-        # First call - gets token1
+        # First call - gets token1 (refresh deadline 1000 + 3600 - 60 = 4540)
         token1 = client._get_access_token()
         assert token1 == "token1"
 
-        # Second call (expired) - should refresh and get token2
+        # Just before the deadline the cached token is reused
+        now = 4539.0
+        assert client._get_access_token() == "token1"
+
+        # Past the deadline - should refresh and get token2
+        now = 5000.0
         token2 = client._get_access_token()
         assert token2 == "token2"
 
         # Should have called OAuth twice
         assert mock_post.call_count == 2
 
+    @patch("requests.Session.post")
+    def test_token_persisted_across_clients(self, mock_post, tmp_path):
+        """A later client with the same credentials reuses the persisted token"""
+        mock_post.return_value = _resp(200, {"access_token": "token123", "expires_in": 3600})
+
+        first = ZoomClient("acc", "cli", "sec", token_cache_dir=tmp_path)
+        assert first._get_access_token() == "token123"
+        [cache_file] = tmp_path.iterdir()
+        assert "acc" not in cache_file.name
+
+        second = ZoomClient("acc", "cli", "sec", token_cache_dir=tmp_path)
+        assert second._get_access_token() == "token123"
+        assert mock_post.call_count == 1
+
+    @patch("requests.Session.post")
+    def test_expired_persisted_token_ignored(self, mock_post, tmp_path):
+        """A persisted token past its refresh time triggers a fresh OAuth request"""
+        mock_post.return_value = _resp(200, {"access_token": "fresh", "expires_in": 3600})
+        client = ZoomClient("acc", "cli", "sec", token_cache_dir=tmp_path)
+        cache_file = client._token_cache_file()
+        cache_file.write_text(json.dumps({"access_token": "stale", "refresh_at": 0}))
+
+        assert client._get_access_token() == "fresh"
+        assert mock_post.call_count == 1
+
+    @patch("requests.Session.request")
+    @patch("requests.Session.post")
+    def test_rejected_token_removed_from_cache(self, mock_post, mock_request, tmp_path):
+        """A 401 deletes the persisted token so the next client re-authenticates"""
+        mock_post.side_effect = [
+            _resp(200, {"access_token": "revoked", "expires_in": 3600}),
+            _resp(200, {"access_token": "fresh", "expires_in": 3600}),
+        ]
+        rejected = _resp(401, {"code": 124, "message": "Invalid access token."})
+        rejected.raise_for_status = Mock(
+            side_effect=requests.exceptions.HTTPError(response=rejected)
+        )
+        mock_request.return_value = rejected
+
+        client = ZoomClient("acc", "cli", "sec", token_cache_dir=tmp_path)
+        with pytest.raises(AuthenticationError):
+            client._make_request("GET", "users/me")
+        assert not client._token_cache_file().exists()
+
+        later = ZoomClient("acc", "cli", "sec", token_cache_dir=tmp_path)
+        assert later._get_access_token() == "fresh"
+        assert mock_post.call_count == 2
+
 
 class TestUUIDEncoding:
     """Test UUID double encoding"""
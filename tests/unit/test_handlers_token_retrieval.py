@@ -6,14 +6,110 @@ access tokens from clients before constructing Downloader.
 """
 
 import json
+from collections.abc import Callable, Iterator
+from functools import partial
 from pathlib import Path
+from types import MappingProxyType
+from typing import Any
 from unittest.mock import Mock, patch
 
 import pytest
 
+from dlzoom.downloader import DownloadError
 from dlzoom.handlers import _handle_download_mode
 from dlzoom.output import OutputFormatter
 from dlzoom.recorder_selector import RecordingSelector
+from dlzoom.zoom_client import ZoomClient
+
+_DEFAULT_KWARGS = MappingProxyType(
+    dict(
+        recording_id=None,
+        skip_transcript=True,
+        skip_chat=True,
+        skip_timeline=True,
+        dry_run=False,
+        log_file=None,
+        verbose=False,
+        debug=False,
+        json_mode=False,
+        wait=None,
+    )
+)
+
+_RECORDING_PAYLOAD = MappingProxyType(
+    {
+        "recording_files": [
+            {
+                "id": "test123",
+                "file_extension": "M4A",
+                "file_size": 1000,
+                "download_url": "https://zoom.us/rec/test.m4a",
+                "status": "completed",
+            }
+        ],
+        "topic": "Test",
+        "start_time": "2024-01-01T10:00:00Z",
+        "uuid": "test-uuid",
+    }
+)
+
+
+def _recording(**overrides: Any) -> dict[str, Any]:
+    """A fresh recordings payload: the shared template with top-level keys replaced."""
+    return {**_RECORDING_PAYLOAD, **overrides}
+
+
+def _fake_download(out_dir: Path, *args: Any, **kwargs: Any) -> Path:
+    """Downloader.download_file stand-in that writes a 10-byte test.m4a."""
+    path = out_dir / "test.m4a"
+    path.write_bytes(b"1234567890")
+    return path
+
+
+def _invoke(**overrides):
+    """Call _handle_download_mode with the quiet single-file defaults plus overrides."""
+    return _handle_download_mode(**{**_DEFAULT_KWARGS, **overrides})
+
+
+@pytest.fixture
+def downloader_mock(tmp_path: Path) -> Iterator[Mock]:
+    """Patch the handler's Downloader with one that "downloads" test.m4a and no extras."""
+    with patch("dlzoom.handlers.Downloader") as cls:
+        cls.return_value = Mock(
+            **{
+                "download_file.return_value": tmp_path / "test.m4a",
+                "download_transcripts_and_chat.return_value": {
+                    "vtt": [],
+                    "txt": [],
+                    "timeline": [],
+                    "speakers": [],
+                },
+            }
+        )
+        yield cls
+
+
+@pytest.fixture(scope="module")
+def selector() -> Mock:
+    """Selector stand-in that always picks the template's audio file.
+
+    Keeps these tests about token handling, independent of RecordingSelector's ranking rules.
+    """
+    return Mock(
+        spec=RecordingSelector,
+        **{"select_best_audio.return_value": _RECORDING_PAYLOAD["recording_files"][0]},
+    )
+
+
+@pytest.fixture(scope="module")
+def human_formatter() -> OutputFormatter:
+    return OutputFormatter("human")
+
+
+@pytest.fixture(scope="module")
+def json_formatter() -> OutputFormatter:
+    # The handler silences JSON formatters itself, so sharing one across tests is safe
+    return OutputFormatter("json")
 
 
 class TestHandlersTokenRetrieval:
@@ -22,306 +118,277 @@ class TestHandlersTokenRetrieval:
     @pytest.fixture
     def mock_client_with_token(self) -> Mock:
         """Create a mock client with _get_access_token method."""
-        client = Mock()
-        client._get_access_token = Mock(return_value="mock_token_12345")
-        client.get_meeting_recordings = Mock(
-            return_value={
-                "recording_files": [
-                    {
-                        "id": "test123",
-                        "file_extension": "M4A",
-                        "file_size": 1000,
-                        "download_url": "https://zoom.us/rec/test.m4a",
-                        "status": "completed",
-                    }
-                ],
-                "topic": "Test",
-                "start_time": "2024-01-01T10:00:00Z",
-                "uuid": "test-uuid",
-            }
+        # A ZoomClient spec passes the handler's S2S isinstance check, which fetches participants
+        client = Mock(
+            spec=ZoomClient,
+            **{
+                "get_meeting_recordings.return_value": _RECORDING_PAYLOAD,
+                "get_all_participants.return_value": [],
+            },
         )
+        # Assigned explicitly: the handler's defensive check looks in the instance __dict__
+        client._get_access_token = Mock(return_value="mock_token_12345")
         return client
 
     def test_get_access_token_called_before_downloader_construction(
-        self, mock_client_with_token: Mock, tmp_path: Path
+        self,
+        mock_client_with_token: Mock,
+        tmp_path: Path,
+        selector: Mock,
+        human_formatter: OutputFormatter,
+        downloader_mock: Mock,
     ) -> None:
         """
         Verify _get_access_token is called before Downloader is constructed.
 
         This is the PRIMARY regression test for the critical bug.
         """
-        selector = RecordingSelector()
-        formatter = OutputFormatter("human")
-
-        with patch("dlzoom.handlers.Downloader") as mock_downloader_cls:
-            mock_downloader = Mock()
-            mock_downloader_cls.return_value = mock_downloader
-            mock_downloader.download_file = Mock(return_value=tmp_path / "test.m4a")
-            mock_downloader.download_transcripts_and_chat = Mock(
-                return_value={"vtt": [], "txt": [], "timeline": [], "speakers": []}
-            )
+        _invoke(
+            client=mock_client_with_token,
+            selector=selector,
+            meeting_id="123",
+            output_dir=tmp_path,
+            output_name="test",
+            formatter=human_formatter,
+        )
 
-            _handle_download_mode(
+    def test_downloader_closed_when_download_fails(
+        self,
+        mock_client_with_token: Mock,
+        tmp_path: Path,
+        selector: Mock,
+        human_formatter: OutputFormatter,
+        downloader_mock: Mock,
+    ) -> None:
+        """The downloader's pooled session is released even when a download raises."""
+        downloader_mock.return_value.download_file.side_effect = DownloadError("boom")
+
+        with pytest.raises(DownloadError):
+            _invoke(
                 client=mock_client_with_token,
                 selector=selector,
                 meeting_id="123",
-                recording_id=None,
                 output_dir=tmp_path,
                 output_name="test",
-                skip_transcript=True,
-                skip_chat=True,
-                skip_timeline=True,
-                dry_run=False,
-                log_file=None,
-                formatter=formatter,
-                verbose=False,
-                debug=False,
-                json_mode=False,
-                wait=None,
+                formatter=human_formatter,
             )
-
-    def test_metadata_uses_actual_audio_file_size(
-        self, mock_client_with_token: Mock, tmp_path: Path, capfd
+        downloader_mock.return_value.close.assert_called_once_with()
+
+    def test_get_access_token_called_once_for_multi_file_recording(
+        self,
+        mock_client_with_token: Mock,
+        tmp_path: Path,
+        selector: Mock,
+        human_formatter: OutputFormatter,
+        downloader_mock: Mock,
     ) -> None:
-        selector = RecordingSelector()
-        formatter = OutputFormatter("json")
+        """The token is fetched once per handler call, not once per recording file."""
+        mock_client_with_token.get_meeting_recordings.return_value = _recording(
+            recording_files=[
+                {
+                    "id": f"file{i}",
+                    "file_type": file_type,
+                    "file_extension": ext,
+                    "file_size": 1000,
+                    "download_url": f"https://zoom.us/rec/file{i}",
+                    "status": "completed",
+                }
+                for i, (file_type, ext) in enumerate(
+                    [
+                        ("M4A", "M4A"),
+                        ("MP4", "MP4"),
+                        ("TRANSCRIPT", "VTT"),
+                        ("CHAT", "TXT"),
+                        ("TIMELINE", "JSON"),
+                    ]
+                )
+            ],
+        )
 
-        with patch("dlzoom.handlers.Downloader") as mock_downloader_cls:
-            mock_downloader = Mock()
+        _invoke(
+            client=mock_client_with_token,
+            selector=selector,
+            meeting_id="multi",
+            output_dir=tmp_path,
+            output_name="multi",
+            skip_transcript=False,
+            skip_chat=False,
+            skip_timeline=False,
+            formatter=human_formatter,
+        )
 
-            def fake_download(*args, **kwargs):
-                path = tmp_path / "test.m4a"
-                path.write_bytes(b"1234567890")
-                return path
+        assert mock_client_with_token._get_access_token.call_count == 1
 
-            mock_downloader.download_file = Mock(side_effect=fake_download)
-            mock_downloader.download_transcripts_and_chat = Mock(
-                return_value={"vtt": [], "txt": [], "timeline": [], "speakers": []}
-            )
-            mock_downloader_cls.return_value = mock_downloader
+    def test_metadata_uses_actual_audio_file_size(
+        self,
+        mock_client_with_token: Mock,
+        tmp_path: Path,
+        capsys: pytest.CaptureFixture[str],
+        selector: Mock,
+        json_formatter: OutputFormatter,
+        downloader_mock: Mock,
+    ) -> None:
+        downloader_mock.return_value.download_file.side_effect = partial(_fake_download, tmp_path)
 
-            _handle_download_mode(
-                client=mock_client_with_token,
-                selector=selector,
-                meeting_id="123",
-                recording_id=None,
-                output_dir=tmp_path,
-                output_name="audio_test",
-                skip_transcript=True,
-                skip_chat=True,
-                skip_timeline=True,
-                dry_run=False,
-                log_file=None,
-                formatter=formatter,
-                verbose=False,
-                debug=False,
-                json_mode=True,
-                wait=None,
-            )
+        _invoke(
+            client=mock_client_with_token,
+            selector=selector,
+            meeting_id="123",
+            output_dir=tmp_path,
+            output_name="audio_test",
+            formatter=json_formatter,
+            json_mode=True,
+        )
 
-        output = json.loads(capfd.readouterr().out)
+        output = json.loads(capsys.readouterr().out)
         assert output["metadata_summary"]["audio_size_bytes"] == 10
 
     def test_access_token_passed_as_second_argument(
-        self, mock_client_with_token: Mock, tmp_path: Path
+        self,
+        mock_client_with_token: Mock,
+        tmp_path: Path,
+        selector: Mock,
+        human_formatter: OutputFormatter,
+        downloader_mock: Mock,
     ) -> None:
         """
         Verify access token is passed as 2nd argument to Downloader.__init__.
 
         Signature: Downloader(output_dir, access_token, output_name=None)
         """
-        selector = RecordingSelector()
-        formatter = OutputFormatter("human")
-
-        with patch("dlzoom.handlers.Downloader") as mock_downloader_cls:
-            mock_downloader = Mock()
-            mock_downloader_cls.return_value = mock_downloader
-            mock_downloader.download_file = Mock(return_value=tmp_path / "test.m4a")
-            mock_downloader.download_transcripts_and_chat = Mock(
-                return_value={"vtt": [], "txt": [], "timeline": [], "speakers": []}
-            )
-
-            _handle_download_mode(
-                client=mock_client_with_token,
-                selector=selector,
-                meeting_id="456",
-                recording_id=None,
-                output_dir=tmp_path,
-                output_name="my_output",
-                skip_transcript=True,
-                skip_chat=True,
-                skip_timeline=True,
-                dry_run=False,
-                log_file=None,
-                formatter=formatter,
-                verbose=False,
-                debug=False,
-                json_mode=False,
-                wait=None,
-            )
-
-            # Verify constructor call arguments
-            assert mock_downloader_cls.called
-            args, kwargs = mock_downloader_cls.call_args
-
-            # Positional args should be: (output_dir, access_token, output_name)
-            assert len(args) == 3
-            assert args[0] == tmp_path  # output_dir
-            assert args[1] == "mock_token_12345"  # access_token
-            assert args[2] == "my_output"  # output_name
+        _invoke(
+            client=mock_client_with_token,
+            selector=selector,
+            meeting_id="456",
+            output_dir=tmp_path,
+            output_name="my_output",
+            formatter=human_formatter,
+        )
 
-    def test_different_token_for_different_client(self, tmp_path: Path) -> None:
+        # Verify constructor call arguments
+        assert downloader_mock.called
+        args, kwargs = downloader_mock.call_args
+
+        # Positional args should be: (output_dir, access_token, output_name)
+        assert len(args) == 3
+        assert args[0] == tmp_path  # output_dir
+        assert args[1] == "mock_token_12345"  # access_token
+        assert args[2] == "my_output"  # output_name
+
+    def test_different_token_for_different_client(
+        self,
+        tmp_path: Path,
+        selector: Mock,
+        human_formatter: OutputFormatter,
+        downloader_mock: Mock,
+    ) -> None:
         """
         Verify handler correctly retrieves token from different client types.
         """
         # Create a different mock client with different token
-        client2 = Mock()
-        client2._get_access_token = Mock(return_value="different_token_67890")
-        client2.get_meeting_recordings = Mock(
-            return_value={
-                "recording_files": [
-                    {
-                        "id": "different",
-                        "file_extension": "M4A",
-                        "file_size": 2000,
-                        "download_url": "https://zoom.us/rec/different.m4a",
-                        "status": "completed",
-                    }
-                ],
-                "topic": "Different Test",
-                "start_time": "2024-01-02T10:00:00Z",
-                "uuid": "different-uuid",
-            }
+        client2 = Mock(
+            spec=ZoomClient,
+            **{
+                "get_meeting_recordings.return_value": _recording(
+                    topic="Different Test", uuid="different-uuid"
+                ),
+                "get_all_participants.return_value": [],
+            },
         )
+        client2._get_access_token = Mock(return_value="different_token_67890")
 
-        selector = RecordingSelector()
-        formatter = OutputFormatter("human")
-
-        with patch("dlzoom.handlers.Downloader") as mock_downloader_cls:
-            mock_downloader = Mock()
-            mock_downloader_cls.return_value = mock_downloader
-            mock_downloader.download_file = Mock(return_value=tmp_path / "diff.m4a")
-            mock_downloader.download_transcripts_and_chat = Mock(
-                return_value={"vtt": [], "txt": [], "timeline": [], "speakers": []}
-            )
-
-            _handle_download_mode(
-                client=client2,
-                selector=selector,
-                meeting_id="789",
-                recording_id=None,
-                output_dir=tmp_path,
-                output_name="different",
-                skip_transcript=True,
-                skip_chat=True,
-                skip_timeline=True,
-                dry_run=False,
-                log_file=None,
-                formatter=formatter,
-                verbose=False,
-                debug=False,
-                json_mode=False,
-                wait=None,
-            )
+        _invoke(
+            client=client2,
+            selector=selector,
+            meeting_id="789",
+            output_dir=tmp_path,
+            output_name="different",
+            formatter=human_formatter,
+        )
 
-            # Verify correct token was retrieved and passed
-            client2._get_access_token.assert_called_once()
-            args, _ = mock_downloader_cls.call_args
-            assert args[1] == "different_token_67890"
+        # Verify correct token was retrieved and passed
+        client2._get_access_token.assert_called_once()
+        args, _ = downloader_mock.call_args
+        assert args[1] == "different_token_67890"
 
     def test_token_not_retrieved_in_dry_run(
-        self, mock_client_with_token: Mock, tmp_path: Path
+        self,
+        mock_client_with_token: Mock,
+        tmp_path: Path,
+        selector: Mock,
+        human_formatter: OutputFormatter,
     ) -> None:
         """
         Verify token is NOT retrieved during dry run.
 
         Dry run should return early without creating Downloader.
         """
-        selector = RecordingSelector()
-        formatter = OutputFormatter("human")
-
-        _handle_download_mode(
+        _invoke(
             client=mock_client_with_token,
             selector=selector,
             meeting_id="999",
-            recording_id=None,
             output_dir=tmp_path,
             output_name="dry",
             skip_transcript=False,
             skip_chat=False,
             skip_timeline=False,
             dry_run=True,  # DRY RUN
-            log_file=None,
-            formatter=formatter,
-            verbose=False,
-            debug=False,
-            json_mode=False,
-            wait=None,
+            formatter=human_formatter,
         )
 
         # Token should NOT be retrieved in dry run
         mock_client_with_token._get_access_token.assert_not_called()
 
     def test_token_retrieval_with_templates(
-        self, mock_client_with_token: Mock, tmp_path: Path
+        self,
+        mock_client_with_token: Mock,
+        tmp_path: Path,
+        selector: Mock,
+        human_formatter: OutputFormatter,
+        downloader_mock: Mock,
     ) -> None:
         """
         Verify token is retrieved even when using filename/folder templates.
 
         Templates should not affect the core token retrieval logic.
         """
-        selector = RecordingSelector()
-        formatter = OutputFormatter("human")
-
-        with patch("dlzoom.handlers.Downloader") as mock_downloader_cls:
-            mock_downloader = Mock()
-            mock_downloader_cls.return_value = mock_downloader
-            mock_downloader.download_file = Mock(return_value=tmp_path / "test.m4a")
-            mock_downloader.download_transcripts_and_chat = Mock(
-                return_value={"vtt": [], "txt": [], "timeline": [], "speakers": []}
-            )
-
-            _handle_download_mode(
-                client=mock_client_with_token,
-                selector=selector,
-                meeting_id="template_test",
-                recording_id=None,
-                output_dir=tmp_path,
-                output_name="base_name",
-                skip_transcript=True,
-                skip_chat=True,
-                skip_timeline=True,
-                dry_run=False,
-                log_file=None,
-                formatter=formatter,
-                verbose=False,
-                debug=False,
-                json_mode=False,
-                wait=None,
-                filename_template="{topic}_{start_time:%Y%m%d}",
-                folder_template="{start_time:%Y/%m}",
-            )
+        _invoke(
+            client=mock_client_with_token,
+            selector=selector,
+            meeting_id="template_test",
+            output_dir=tmp_path,
+            output_name="base_name",
+            formatter=human_formatter,
+            filename_template="{topic}_{start_time:%Y%m%d}",
+            folder_template="{start_time:%Y/%m}",
+        )
 
-            # Token should still be retrieved with templates
-            mock_client_with_token._get_access_token.assert_called_once()
+        # Token should still be retrieved with templates
+        mock_client_with_token._get_access_token.assert_called_once()
 
-            # And passed to Downloader
-            args, _ = mock_downloader_cls.call_args
-            assert args[1] == "mock_token_12345"
+        # And passed to Downloader
+        args, _ = downloader_mock.call_args
+        assert args[1] == "mock_token_12345"
 
     def test_extracted_audio_listed_when_suffix_misreported(
-        self, mock_client_with_token: Mock, tmp_path: Path, capfd
+        self,
+        mock_client_with_token: Mock,
+        tmp_path: Path,
+        capsys: pytest.CaptureFixture[str],
+        selector: Mock,
+        json_formatter: OutputFormatter,
+        downloader_mock: Mock,
     ) -> None:
         """
         Ensure extracted audio paths are surfaced even if Path.suffix misreports.
         """
-        selector = RecordingSelector()
-        formatter = OutputFormatter("json")
-        formatter.set_silent(True)
+        json_formatter.set_silent(True)
 
         path_cls = type(tmp_path)
 
         class MisreportingPath(path_cls):  # type: ignore[misc, valid-type]
+            """Path whose suffix always claims .mp4, whatever the real extension."""
+
             _flavour = path_cls._flavour
 
             def __new__(cls, path: Path):
@@ -331,21 +398,11 @@ class TestHandlersTokenRetrieval:
             def suffix(self) -> str:  # pragma: no cover - behavior under test
                 return ".mp4"
 
-        with (
-            patch("dlzoom.handlers.Downloader") as mock_downloader_cls,
-            patch("dlzoom.handlers.AudioExtractor") as mock_extractor_cls,
-        ):
+        with patch("dlzoom.handlers.AudioExtractor") as mock_extractor_cls:
             mp4_path = tmp_path / "video.mp4"
-            mp4_path.write_bytes(b"1234")
             extracted_path = MisreportingPath(tmp_path / "video.m4a")
-            extracted_path.write_bytes(b"5678")
 
-            mock_downloader = Mock()
-            mock_downloader.download_file = Mock(return_value=mp4_path)
-            mock_downloader.download_transcripts_and_chat = Mock(
-                return_value={"vtt": [], "txt": [], "timeline": [], "speakers": []}
-            )
-            mock_downloader_cls.return_value = mock_downloader
+            downloader_mock.return_value.download_file.return_value = mp4_path
 
             mock_extractor = Mock()
             mock_extractor.extract_audio = Mock(return_value=extracted_path)
@@ -354,133 +411,112 @@ class TestHandlersTokenRetrieval:
 
             log_file = tmp_path / "run.log"
 
-            _handle_download_mode(
+            _invoke(
                 client=mock_client_with_token,
                 selector=selector,
                 meeting_id="audio-misreport",
-                recording_id=None,
                 output_dir=tmp_path,
                 output_name="test",
-                skip_transcript=True,
-                skip_chat=True,
-                skip_timeline=True,
-                dry_run=False,
                 log_file=log_file,
-                formatter=formatter,
-                verbose=False,
-                debug=False,
+                formatter=json_formatter,
                 json_mode=True,
-                wait=None,
             )
 
-        output = json.loads(capfd.readouterr().out)
+        output = json.loads(capsys.readouterr().out)
         assert output["log_file"] == str(log_file.absolute())
         files = output["files"]
         assert files["audio"] == str(extracted_path)
-        assert str(extracted_path) in files["audio_files"]
-        assert str(mp4_path) in files["videos"]
+        # The handler tracks delivered files by path, so each list holds unique entries
+        audio_set, video_set = set(files["audio_files"]), set(files["videos"])
+        assert len(audio_set) == len(files["audio_files"])
+        assert len(video_set) == len(files["videos"])
+        assert str(extracted_path) in audio_set
+        assert str(mp4_path) in video_set
 
         log_lines = log_file.read_text().strip().splitlines()
         assert any("video.m4a" in line for line in log_lines)
 
-
-class TestTokenRetrievalEdgeCases:
-    """Test edge cases in token retrieval."""
-
-    def test_client_missing_get_access_token_method(self, tmp_path: Path) -> None:
+    def test_token_cached_across_calls(
+        self,
+        tmp_path: Path,
+        selector: Mock,
+        human_formatter: OutputFormatter,
+        downloader_mock: Mock,
+    ) -> None:
         """
-        Verify appropriate error if client doesn't have _get_access_token.
+        Repeated downloads through one ZoomClient reuse its cached token.
 
-        This shouldn't happen in practice but worth testing defensive behavior.
+        The handler asks the client every time; the client's TTL cache must absorb
+        the repeat so only one OAuth request goes out.
         """
-        bad_client = Mock()
-        # Intentionally don't add _get_access_token method
-        bad_client.get_meeting_recordings = Mock(
-            return_value={
-                "recording_files": [
-                    {
-                        "id": "test",
-                        "file_extension": "M4A",
-                        "file_size": 1000,
-                        "download_url": "https://zoom.us/rec/test.m4a",
-                        "status": "completed",
-                    }
-                ],
-                "topic": "Test",
-                "start_time": "2024-01-01T10:00:00Z",
-                "uuid": "test",
-            }
+        client = ZoomClient("acc", "cli", "sec")
+        token_response = Mock(
+            status_code=200, json=lambda: {"access_token": "s2s_token", "expires_in": 3600}
         )
 
-        selector = RecordingSelector()
-        formatter = OutputFormatter("human")
+        with (
+            patch("requests.Session.post", return_value=token_response) as mock_post,
+            patch.object(ZoomClient, "get_meeting_recordings", return_value=_RECORDING_PAYLOAD),
+            patch.object(ZoomClient, "get_all_participants", return_value=[]),
+        ):
+            for name in ("first", "second"):
+                _invoke(
+                    client=client,
+                    selector=selector,
+                    meeting_id="123",
+                    output_dir=tmp_path,
+                    output_name=name,
+                    formatter=human_formatter,
+                )
 
-        with pytest.raises(AttributeError):
-            _handle_download_mode(
-                client=bad_client,
-                selector=selector,
-                meeting_id="bad",
-                recording_id=None,
-                output_dir=tmp_path,
-                output_name="bad",
-                skip_transcript=True,
-                skip_chat=True,
-                skip_timeline=True,
-                dry_run=False,
-                log_file=None,
-                formatter=formatter,
-                verbose=False,
-                debug=False,
-                json_mode=False,
-                wait=None,
-            )
+        assert mock_post.call_count == 1
+        assert [c.args[1] for c in downloader_mock.call_args_list] == ["s2s_token"] * 2
 
-    def test_get_access_token_raises_exception(self, tmp_path: Path) -> None:
-        """
-        Verify exception from _get_access_token is properly propagated.
-        """
-        failing_client = Mock()
-        failing_client._get_access_token = Mock(
-            side_effect=Exception("Token retrieval failed: network error")
-        )
-        failing_client.get_meeting_recordings = Mock(
-            return_value={
-                "recording_files": [
-                    {
-                        "id": "test",
-                        "file_extension": "M4A",
-                        "file_size": 1000,
-                        "download_url": "https://zoom.us/rec/test.m4a",
-                        "status": "completed",
-                    }
-                ],
-                "topic": "Test",
-                "start_time": "2024-01-01T10:00:00Z",
-                "uuid": "test",
-            }
-        )
 
-        selector = RecordingSelector()
-        formatter = OutputFormatter("human")
+def _client_without_token_method() -> Mock:
+    # Spec without _get_access_token, so the attribute is genuinely missing
+    return Mock(
+        spec=["get_meeting_recordings"],
+        **{"get_meeting_recordings.return_value": _RECORDING_PAYLOAD},
+    )
+
 
-        with pytest.raises(Exception) as exc_info:
-            _handle_download_mode(
-                client=failing_client,
+def _client_with_failing_token() -> Mock:
+    client = Mock(spec=ZoomClient, **{"get_meeting_recordings.return_value": _RECORDING_PAYLOAD})
+    client._get_access_token = Mock(side_effect=Exception("Token retrieval failed: network error"))
+    return client
+
+
+class TestTokenRetrievalEdgeCases:
+    """Test edge cases in token retrieval."""
+
+    @pytest.mark.parametrize(
+        "make_client,exc,match",
+        [
+            # Shouldn't happen in practice, but the handler checks defensively
+            (_client_without_token_method, AttributeError, "_get_access_token"),
+            (_client_with_failing_token, Exception, "Token retrieval failed"),
+        ],
+        ids=["missing-method", "token-error-propagates"],
+    )
+    def test_token_retrieval_failures(
+        self,
+        tmp_path: Path,
+        selector: Mock,
+        human_formatter: OutputFormatter,
+        make_client: Callable[[], Mock],
+        exc: type[Exception],
+        match: str,
+    ) -> None:
+        """
+        Verify a client that cannot produce a token aborts the download with its error.
+        """
+        with pytest.raises(exc, match=match):
+            _invoke(
+                client=make_client(),
                 selector=selector,
                 meeting_id="fail",
-                recording_id=None,
                 output_dir=tmp_path,
                 output_name="fail",
-                skip_transcript=True,
-                skip_chat=True,
-                skip_timeline=True,
-                dry_run=False,
-                log_file=None,
-                formatter=formatter,
-                verbose=False,
-                debug=False,
-                json_mode=False,
-                wait=None,
+                formatter=human_formatter,
             )
-
-        assert "Token retrieval failed" in str(exc_info.value)